@@ -0,0 +1,354 @@
+"""Rollout advisor: what each answer to the open decision is worth.
+
+For the decision the game is waiting on (buying the pending property, a
+pre-roll house or hotel, the next auction bid, the Hackathon Laptop
+destination) the advisor plays many short games out from a snapshot of the
+current position, once per rollout and choice, and reports each choice's
+mean change in the deciding player's net worth, e.g.
+
+    advisor = Advisor()
+    advisor.start(engine)            # snapshot + first batches
+    while advisor.busy:
+        advisor.poll()               # non-blocking; call once per frame
+    for label, mean, stderr, n in advisor.results():
+        ...
+
+Rollouts run in a process pool, so the pygame thread only pickles a
+snapshot and collects results. The search is one level deep: the choices
+are the root's children and each batch goes to the choice with the highest
+upper confidence bound, so clearly bad answers stop getting rollouts early.
+Every rollout's first roll is stratified over the exact totals from
+get_dice_total_distribution (a van der Corput sequence picks the quantile),
+so even a small batch sees lucky and unlucky rolls in their true
+proportions. After that the seats play ROLLOUT_POLICY for ROLLOUT_TURNS
+rolls on their own seeded streams.
+"""
+import math
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from monopoly_engine import DICE_FACE_WEIGHTS, MonopolyEngine
+from policies import POLICIES, HeuristicPolicy
+
+ROLLOUT_POLICY = POLICIES["balanced"]
+ROLLOUT_TURNS = 40      # play_turn calls after the decision's own turn
+BATCH_SIZE = 8          # rollouts per task sent to a worker
+MIN_ROLLOUTS = 16       # per choice before the confidence bounds steer the search
+# Every choice keeps at least this share of an even split: net worth is heavy-tailed (stock prices
+# compound), so a few lucky rollouts must not starve the other choices of samples
+MIN_SHARE = 0.5
+BUDGET_MS = 2500
+
+
+class HoldBuildsPolicy(HeuristicPolicy):
+    """ROLLOUT_POLICY without pre-roll building, for the turn whose build is being advised."""
+
+    def decide_builds(self, engine, player):
+        pass
+
+
+HOLD_BUILDS = HoldBuildsPolicy(ROLLOUT_POLICY.cash_reserve, ROLLOUT_POLICY.bid_limit,
+                               ROLLOUT_POLICY.build_reserve, ROLLOUT_POLICY.trade_margin)
+
+
+# ── Decisions ──
+def legal_builds(engine, player):
+    """[(position, "house" | "hotel")] that try_buy_house / try_buy_hotel would accept right now."""
+    builds = []
+    board = engine.board
+    for color, group in board.color_groups.items():
+        if not board.index.owns_color_set(player, color):
+            continue
+        lowest = min(p.get_building_level() for p in group)
+        for prop in group:
+            if prop.get_building_level() != lowest:
+                continue
+            cost = prop.get_house_cost()
+            if cost is not None and board.house_pool > 0 and player.money >= cost:
+                builds.append((prop.position, "house"))
+            cost = prop.get_hotel_cost()
+            if cost is not None and board.hotel_pool > 0 and player.money >= cost:
+                builds.append((prop.position, "hotel"))
+    return builds
+
+
+def get_decision(engine):
+    """(kind, player, choices) for the decision the game is waiting on, or None if there is nothing to advise."""
+    if engine.game_over or engine.trade_active or engine.evaporator_pending:
+        return None
+    if engine.hackathon_pending:
+        return "hackathon", engine.hackathon_player, list(range(1, 13))
+    if engine.pending_property is not None:
+        return "purchase", engine.players[engine.current_player_index], ["buy", "skip", "auction"]
+    if engine.auction_active:
+        bidder = engine.get_current_auction_player()
+        if bidder is None:
+            return None
+        steps = [step for step in (5, 20, 100) if engine.auction_current_bid + step <= bidder.money]
+        return "bid", bidder, [None] + steps
+    if engine.waiting_for_action and not engine.dice_rolled:
+        player = engine.players[engine.current_player_index]
+        builds = legal_builds(engine, player)
+        if builds:
+            return "build", player, [None] + builds
+    return None
+
+
+def choice_label(engine, kind, choice):
+    if kind == "purchase":
+        return choice.capitalize()
+    if kind == "bid":
+        return "Leave" if choice is None else f"+${choice}"
+    if kind == "hackathon":
+        return f"{choice}: {engine.board.spaces[choice]['name']}"
+    if choice is None:
+        return "Don't build"
+    position, building = choice
+    return f"{building.capitalize()} on {engine.board.spaces[position]['name']}"
+
+
+def apply_choice(engine, kind, choice):
+    """Answer the open decision with choice, then play out the rest of that turn."""
+    player = engine.players[engine.current_player_index]
+    if kind == "build":
+        if choice is not None:
+            position, building = choice
+            prop = engine.board.spaces[position]["property"]
+            if building == "house":
+                engine.try_buy_house(player, prop)
+            else:
+                engine.try_buy_hotel(player, prop)
+        # The advised build (or the lack of one) is the whole pre-roll step
+        engine.set_policy(player, HOLD_BUILDS)
+        engine.play_turn()
+        engine.set_policy(player, ROLLOUT_POLICY)
+        return
+    if kind == "purchase":
+        if choice == "buy":
+            engine.buy_pending_property()
+        elif choice == "auction":
+            engine.auction_pending_property()
+        else:
+            engine.skip_pending_property()
+    elif kind == "bid":
+        if choice is None or not engine.place_bid(choice):
+            engine.leave_auction()
+    else:
+        engine.choose_hackathon_space(choice)
+    engine.resolve_pending()
+    engine.force_bankruptcy_if_needed()
+    if engine.can_end_turn():
+        engine.end_turn()
+
+
+def net_worth(engine, seat):
+    """Cash plus market value of the seat's lots (mortgage value if mortgaged) and buildings at cost; 0 once bankrupt."""
+    player = engine.board.seats[seat]
+    if player not in engine.players:
+        return 0
+    worth = player.money
+    build_costs = engine.board.build_costs
+    for prop in player.properties:
+        worth += prop.get_mortgage_value() if prop.mortgaged else prop.stock_value
+        level = prop.get_building_level()
+        if level:
+            worth += sum(build_costs[prop.position][:level])
+    return worth
+
+
+# ── Rollouts (run in worker processes) ──
+def radical_inverse(n):
+    """n-th point of the base-2 van der Corput sequence in [0, 1)."""
+    result, scale = 0.0, 0.5
+    while n:
+        if n & 1:
+            result += scale
+        n >>= 1
+        scale *= 0.5
+    return result
+
+
+def stratified_roll(engine, quantile, rng):
+    """A (die1, die2) pair whose total sits at `quantile` of the exact total distribution."""
+    dice_type = engine.dice.dice_type
+    cumulative = 0.0
+    distribution = sorted(engine.get_dice_total_distribution(dice_type).items())
+    total = distribution[-1][0]
+    for value, probability in distribution:
+        cumulative += probability
+        if quantile < cumulative:
+            total = value
+            break
+    weights = DICE_FACE_WEIGHTS[dice_type]
+    pairs = [(a, total - a) for a in weights if total - a in weights]
+    return rng.choices(pairs, weights=[weights[a] * weights[b] for a, b in pairs])[0]
+
+
+def run_rollouts(task):
+    """Worker entry point: net-worth deltas of `count` rollouts of one choice."""
+    snap, kind, choice, seat, first_index, count, seed, turns = task
+    deltas = []
+    for index in range(first_index, first_index + count):
+        rollout_seed = random.Random(f"{seed}:{index}").getrandbits(64)
+        engine = MonopolyEngine(len(snap.seats), seed=rollout_seed, batch_dice=True)
+        engine.restore(snap)
+        for player in engine.players:
+            engine.set_policy(player, ROLLOUT_POLICY)
+        start = net_worth(engine, seat)
+        engine.dice.preset_rolls.append(stratified_roll(engine, radical_inverse(index + 1), engine.dice_rng))
+        apply_choice(engine, kind, choice)
+        for _ in range(turns):
+            if engine.game_over:
+                break
+            engine.play_turn()
+        deltas.append(net_worth(engine, seat) - start)
+    return deltas
+
+
+# ── Search (main thread) ──
+class ChoiceStats:
+    __slots__ = ("choice", "label", "n", "total", "total_sq", "queued", "error")
+
+    def __init__(self, choice, label):
+        self.choice = choice
+        self.label = label
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.queued = 0       # rollouts sent out but not back yet
+        self.error = None     # exception a batch raised; the choice gets no more rollouts
+
+    def add(self, deltas):
+        self.n += len(deltas)
+        self.total += sum(deltas)
+        self.total_sq += sum(d * d for d in deltas)
+
+    def mean(self):
+        return self.total / self.n if self.n else 0.0
+
+    def stderr(self):
+        if self.n < 2:
+            return math.inf
+        variance = max(0.0, (self.total_sq - self.total * self.total / self.n) / (self.n - 1))
+        return math.sqrt(variance / self.n)
+
+
+class Advisor:
+    """Time-boxed rollout search over the open decision, fed from a process pool."""
+
+    def __init__(self, workers=None, budget_ms=BUDGET_MS, turns=ROLLOUT_TURNS):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.budget_ms = budget_ms
+        self.turns = turns
+        self.pool = None
+        self.key = None
+        self.kind = None
+        self.seat = None
+        self.snap = None
+        self.stats = []
+        self.in_flight = {}    # future -> ChoiceStats
+        self.deadline = 0.0
+        self.seed = 0
+        self.generation = 0    # bumped whenever results change, for cheap redraw checks
+
+    @property
+    def busy(self):
+        return bool(self.in_flight) or (self.snap is not None and time.perf_counter() < self.deadline)
+
+    def start(self, engine, key=None):
+        """Start advising on engine's open decision; returns False if there is none."""
+        self.cancel()
+        decision = get_decision(engine)
+        self.key = key
+        if decision is None:
+            return False
+        kind, player, choices = decision
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers)
+        self.kind = kind
+        self.seat = player.seat
+        self.snap = engine.snapshot()
+        self.stats = [ChoiceStats(choice, choice_label(engine, kind, choice)) for choice in choices]
+        self.deadline = time.perf_counter() + self.budget_ms / 1000.0
+        self.seed += 1
+        self.generation += 1
+        self.fill()
+        return True
+
+    def cancel(self):
+        for future in self.in_flight:
+            future.cancel()
+        self.in_flight = {}
+        self.snap = None
+        self.stats = []
+        self.kind = None
+        self.generation += 1
+
+    def shutdown(self):
+        self.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def poll(self):
+        """Collect finished batches and queue more while the budget lasts. Never blocks."""
+        done = [future for future in self.in_flight if future.done()]
+        for future in done:
+            stats = self.in_flight.pop(future)
+            stats.queued -= BATCH_SIZE
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                stats.add(future.result())
+            elif stats.error is None:
+                # A bug in the rollout code: report it once rather than resampling the choice forever
+                stats.error = error
+                print(f"Advisor rollouts for {stats.label!r} failed:", file=sys.stderr)
+                traceback.print_exception(error)
+        if done:
+            self.generation += 1
+        if self.snap is not None and time.perf_counter() < self.deadline:
+            self.fill()
+        elif self.snap is not None and not self.in_flight:
+            self.snap = None
+
+    def fill(self):
+        # Keep every worker busy with one batch and one queued behind it
+        while len(self.in_flight) < 2 * self.workers:
+            stats = self.pick()
+            if stats is None:
+                return
+            first_index = stats.n + stats.queued
+            task = (self.snap, self.kind, stats.choice, self.seat, first_index, BATCH_SIZE, self.seed, self.turns)
+            future = self.pool.submit(run_rollouts, task)
+            stats.queued += BATCH_SIZE
+            self.in_flight[future] = stats
+
+    def pick(self):
+        """The choice to sample next: the least sampled while under its minimum, else the highest upper bound.
+
+        None once every choice has failed.
+        """
+        live = [s for s in self.stats if s.error is None]
+        if not live:
+            return None
+        least = min(live, key=lambda s: s.n + s.queued)
+        sampled = sum(s.n + s.queued for s in live)
+        if least.n + least.queued < max(MIN_ROLLOUTS, MIN_SHARE * sampled / len(live)):
+            return least
+        return max(live, key=lambda s: s.mean() + 2.0 * s.stderr())
+
+    def results(self):
+        """[(label, mean net-worth delta, standard error, rollouts)], best first."""
+        rows = [(s.label, s.mean(), s.stderr(), s.n) for s in self.stats if s.n and s.error is None]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows
+
+    def failures(self):
+        """[(label, exception)] for the choices whose rollouts raised."""
+        return [(s.label, s.error) for s in self.stats if s.error is not None]
@@ -0,0 +1,98 @@
+"""Time-based token animation along the board path.
+
+A move is drawn as one hop per space, forward round the board, so a token
+follows the ring instead of cutting across it. Every hop plays the same
+precomputed curve: HOP_CURVE holds the eased progress along the hop and the
+lift above it at CURVE_SAMPLES evenly spaced instants, so a frame only
+indexes the table and interpolates between two space centers.
+
+Animations run on elapsed milliseconds (pygame.time.get_ticks()), not on
+frames: a move takes the same time and passes through the same points at
+any frame rate, and TokenAnimator is empty (falsy) once every token has
+landed, which is what lets the render loop go idle.
+"""
+import math
+
+from monopoly_engine import BOARD_SIZE
+
+HOP_MS = 130          # one space
+HOP_HEIGHT = 18       # pixels at the top of a hop
+CURVE_SAMPLES = 64
+
+
+def build_hop_curve(samples=CURVE_SAMPLES):
+    """[(fraction of the way to the next space, lift as a fraction of HOP_HEIGHT)] at samples + 1 instants."""
+    curve = []
+    for i in range(samples + 1):
+        t = i / samples
+        # Smoothstep eases into and out of each space; the sine arc peaks mid-hop
+        curve.append((t * t * (3.0 - 2.0 * t), math.sin(math.pi * t)))
+    return curve
+
+
+HOP_CURVE = build_hop_curve()
+
+
+def hop_path(start, end):
+    """Board positions visited moving forward from start to end, both included."""
+    steps = (end - start) % BOARD_SIZE
+    return [(start + step) % BOARD_SIZE for step in range(steps + 1)]
+
+
+class TokenAnimation:
+    __slots__ = ("path", "start_ms", "duration_ms")
+
+    def __init__(self, path, start_ms):
+        self.path = path
+        self.start_ms = start_ms
+        self.duration_ms = (len(path) - 1) * HOP_MS
+
+    def finished(self, now):
+        return now - self.start_ms >= self.duration_ms
+
+    def point(self, now, centers):
+        """Screen (x, y) of the token at `now`, given the space centers."""
+        elapsed = min(max(now - self.start_ms, 0), self.duration_ms)
+        hop, into_hop = divmod(elapsed, HOP_MS)
+        if hop >= len(self.path) - 1:
+            return centers[self.path[-1]]
+        along, lift = HOP_CURVE[into_hop * CURVE_SAMPLES // HOP_MS]
+        (x0, y0), (x1, y1) = centers[self.path[hop]], centers[self.path[hop + 1]]
+        return x0 + (x1 - x0) * along, y0 + (y1 - y0) * along - HOP_HEIGHT * lift
+
+
+class TokenAnimator:
+    """The tokens currently moving, keyed by player."""
+
+    def __init__(self):
+        self.animations = {}
+        self.now = 0
+
+    def __bool__(self):
+        return bool(self.animations)
+
+    def __contains__(self, player):
+        return player in self.animations
+
+    def start(self, player, start, end, now):
+        path = hop_path(start, end)
+        if len(path) > 1:
+            self.animations[player] = TokenAnimation(path, now)
+        else:
+            self.animations.pop(player, None)
+        self.now = now
+
+    def update(self, now):
+        """Move the clock to `now` and drop the animations that have finished."""
+        self.now = now
+        if self.animations:
+            for player in [p for p, anim in self.animations.items() if anim.finished(now)]:
+                del self.animations[player]
+
+    def clear(self):
+        self.animations = {}
+
+    def point(self, player, centers):
+        """Screen position of a moving player's token, or None if it is standing still."""
+        anim = self.animations.get(player)
+        return None if anim is None else anim.point(self.now, centers)
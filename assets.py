@@ -0,0 +1,107 @@
+"""Image and font assets for the pygame front end.
+
+Paths resolve relative to this module, so the game finds its art no matter
+which directory it is started from. AssetManager decodes the PNGs on a
+background thread; until they are in, the board art and dice faces are
+None and the UI draws its plain placeholders (colored spaces, numbered
+dice). The six dice faces are packed into one atlas Surface, and scaled
+variants of the board and the atlas are memoized per size.
+"""
+import os
+import threading
+
+import pygame
+
+from render_cache import ScaledImageCache
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FONT_FILE = "Futura.ttf"
+BOARD_FILE = "board.png"
+DICE_FACE_FILES = (
+    "dice-six-faces-one.png",
+    "dice-six-faces-two.png",
+    "dice-six-faces-three.png",
+    "dice-six-faces-four.png",
+    "dice-six-faces-five.png",
+    "dice-six-faces-six.png",
+)
+
+
+def asset_path(name):
+    return os.path.join(ASSET_DIR, name)
+
+
+class AssetManager:
+    def __init__(self, scaled_cache=None):
+        self.scaled = scaled_cache if scaled_cache is not None else ScaledImageCache()
+        self.generation = 0       # bumped when images arrive, so cached layers know to redraw
+        self.board = None
+        self.dice_atlas = None    # the six faces side by side at source resolution
+        self.dice_cell = None     # (width, height) of one face in dice_atlas
+        self.loaded = None        # (board, faces) decoded by the loader thread, not yet converted
+        self.thread = None
+
+    def start(self):
+        """Start decoding images on a background thread."""
+        self.thread = threading.Thread(target=self.load, name="asset-loader", daemon=True)
+        self.thread.start()
+
+    def load(self):
+        try:
+            board = pygame.image.load(asset_path(BOARD_FILE))
+        except Exception:
+            board = None
+        faces = []
+        for file_name in DICE_FACE_FILES:
+            try:
+                faces.append(pygame.image.load(asset_path(file_name)))
+            except Exception:
+                faces = None
+                break
+        self.loaded = (board, faces)
+
+    def poll(self):
+        """Finish loading on the main thread (convert() needs the display). True if new images came in."""
+        if self.loaded is None:
+            return False
+        board, faces = self.loaded
+        self.loaded = None
+        if board is not None:
+            self.board = board.convert()
+        if faces:
+            width = max(face.get_width() for face in faces)
+            height = max(face.get_height() for face in faces)
+            atlas = pygame.Surface((width * len(faces), height), pygame.SRCALPHA)
+            for index, face in enumerate(faces):
+                # BLEND_RGBA_MAX onto the transparent atlas copies pixels without darkening soft edges
+                atlas.blit(face, (index * width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.dice_atlas = atlas.convert_alpha()
+            self.dice_cell = (width, height)
+        self.generation += 1
+        return True
+
+    def get_board(self, size):
+        """The board art scaled to size, or None until it has loaded."""
+        if self.board is None:
+            return None
+        return self.scaled.get(BOARD_FILE, self.board, size)
+
+    def get_dice_atlas(self, face_size):
+        """(atlas, cell rects by face value) with faces face_size pixels square, or None until loaded."""
+        if self.dice_atlas is None:
+            return None
+        key = ("dice", face_size)
+        atlas = self.scaled.lookup(key)
+        if atlas is None:
+            width, height = self.dice_cell
+            atlas = pygame.Surface((face_size * len(DICE_FACE_FILES), face_size), pygame.SRCALPHA).convert_alpha()
+            # Scale each face on its own so neighbouring faces never bleed into each other
+            for index in range(len(DICE_FACE_FILES)):
+                face = self.dice_atlas.subsurface((index * width, 0, width, height))
+                atlas.blit(pygame.transform.smoothscale(face, (face_size, face_size)), (index * face_size, 0),
+                           special_flags=pygame.BLEND_RGBA_MAX)
+            self.scaled.put(key, atlas)
+        cells = {value: pygame.Rect((value - 1) * face_size, 0, face_size, face_size)
+                 for value in range(1, len(DICE_FACE_FILES) + 1)}
+        return atlas, cells
@@ -0,0 +1,185 @@
+"""Headless rendering benchmark for the pygame front end.
+
+Runs CanadaMonopoly's frame (draw_board, end_frame, display update) under
+the dummy SDL video driver over a fixed set of scripted board states and
+prints frames/sec, frame-time percentiles and per-frame allocations, e.g.
+
+    python bench_render.py --frames 500
+    python bench_render.py --scenarios auction trade --json bench.json
+
+Timings come from a plain pass; allocations from a second, shorter pass
+under tracemalloc (Python heap, peak per frame) plus the FrameProfiler's
+Surface and text-render counters, so the two never disturb each other.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from main2 import CanadaMonopoly  # noqa: E402
+from monopoly_engine import BOARD_SIZE, PropertyType  # noqa: E402
+
+
+# ── Scripted board states ──
+def setup_empty(game):
+    pass
+
+
+def setup_hotels(game):
+    for index, prop in enumerate(game.board.properties):
+        game.board.transfer(prop, game.players[index % len(game.players)])
+        if prop.property_type == PropertyType.PROPERTY:
+            prop.hotel = True
+
+
+def setup_stacked(game):
+    for player in game.players:
+        player.position = 24
+
+
+def setup_animation(game):
+    game.on_player_moved(game.players[0], 5, 15)
+
+
+def step_animation(game):
+    game.update_animations(pygame.time.get_ticks())
+    if not game.tokens:
+        setup_animation(game)
+
+
+def setup_trade(game):
+    setup_hotels(game)
+    game.open_trade()
+    game.trade_partner_index = 1
+    game.trade_offer_props = set(game.players[0].properties[:2])
+    game.trade_offer_cash = 120
+
+
+def setup_auction(game):
+    game.start_auction(game.board.properties[12])
+    game.auction_current_bid = 45
+
+
+def setup_probability_dark(game):
+    game.dark_mode = True
+    game.probability_panel_open = True
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        die1, die2 = (int(v) for v in rng.integers(1, 7, 2))
+        game.record_roll_stats(die1 + die2, die1 == die2, int(rng.integers(0, BOARD_SIZE)))
+
+
+# name -> (setup, per-frame step or None)
+SCENARIOS = {
+    "empty": (setup_empty, None),
+    "hotels": (setup_hotels, None),
+    "stacked": (setup_stacked, None),
+    "animation": (setup_animation, step_animation),
+    "trade": (setup_trade, None),
+    "auction": (setup_auction, None),
+    "probability_dark": (setup_probability_dark, None),
+}
+
+
+# ── Measurement ──
+def make_game(scenario, num_players):
+    game = CanadaMonopoly(num_players)
+    game.assets.thread.join()
+    game.assets.poll()
+    setup, _ = SCENARIOS[scenario]
+    setup(game)
+    game.message_timer = 0
+    return game
+
+
+def render_frame(game, step):
+    if step is not None:
+        step(game)
+    game.begin_frame()
+    game.draw_board()
+    dirty = game.end_frame()
+    if dirty:
+        pygame.display.update(dirty)
+
+
+def bench_scenario(scenario, frames, alloc_frames, num_players):
+    """Time `frames` frames, then measure allocations over `alloc_frames` more."""
+    _, step = SCENARIOS[scenario]
+    game = make_game(scenario, num_players)
+
+    start = time.perf_counter()
+    render_frame(game, step)
+    first_ms = (time.perf_counter() - start) * 1000.0
+    times = np.empty(frames)
+    for i in range(frames):
+        start = time.perf_counter()
+        render_frame(game, step)
+        times[i] = time.perf_counter() - start
+
+    profiler = game.profiler
+    profiler.enable()
+    peaks = np.empty(alloc_frames)
+    tracemalloc.start()
+    try:
+        for i in range(alloc_frames):
+            profiler.begin_frame()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            render_frame(game, step)
+            peaks[i] = tracemalloc.get_traced_memory()[1] - before
+            profiler.end_frame()
+    finally:
+        tracemalloc.stop()
+        profiler.disable()
+    counts = profiler.summary()
+
+    def per_frame(name):
+        return counts[name]["mean"] if name in counts else 0.0
+
+    return {
+        "scenario": scenario,
+        "frames": frames,
+        "fps": frames / times.sum(),
+        "first_frame_ms": first_ms,
+        "p50_ms": float(np.percentile(times, 50) * 1000.0),
+        "p95_ms": float(np.percentile(times, 95) * 1000.0),
+        "alloc_kb_per_frame": float(peaks.mean() / 1024.0),
+        "surfaces_per_frame": per_frame("surfaces"),
+        "text_renders_per_frame": per_frame("text_renders"),
+    }
+
+
+def print_report(results):
+    print(f"{'scenario':<18}{'fps':>9}{'first ms':>10}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'alloc KB':>10}{'surfaces':>10}{'text':>7}")
+    for r in results:
+        print(f"{r['scenario']:<18}{r['fps']:>9.0f}{r['first_frame_ms']:>10.2f}{r['p50_ms']:>9.3f}{r['p95_ms']:>9.3f}"
+              f"{r['alloc_kb_per_frame']:>10.1f}{r['surfaces_per_frame']:>10.2f}{r['text_renders_per_frame']:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Canada Monopoly rendering without a display.")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per scenario")
+    parser.add_argument("--alloc-frames", type=int, default=50, help="frames measured under tracemalloc")
+    parser.add_argument("--players", type=int, default=4, choices=range(2, 5))
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = [bench_scenario(name, args.frames, args.alloc_frames, args.players) for name in args.scenarios]
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
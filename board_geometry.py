@@ -0,0 +1,108 @@
+"""Screen geometry of the board spaces, computed once per board rect.
+
+BoardGeometry holds the 40 space rects (screen and board-local), their
+centers and the center area for one board_rect, so per-frame code only
+indexes lists. Hit testing is edge based: a point can only be on the
+bottom row, right column, top row or left column of the ring, and along
+each of those a per-pixel table gives the space directly.
+
+The game rebuilds its BoardGeometry only when board_rect changes.
+"""
+import pygame
+
+from monopoly_engine import BOARD_SIZE
+
+CORNER_FRACTION = 0.135
+
+
+def board_metrics(board_rect):
+    """(left, top, right, bottom, corner, edge) in float screen coordinates."""
+    left = float(board_rect.left)
+    top = float(board_rect.top)
+    side = float(board_rect.width)
+    corner = side * CORNER_FRACTION
+    edge = (side - (2 * corner)) / 9.0
+    return left, top, left + side, top + side, corner, edge
+
+
+def space_rect(metrics, position):
+    left, top, right, bottom, corner, edge = metrics
+    if position == 0:
+        x, y, w, h = left, bottom - corner, corner, corner
+    elif 1 <= position <= 9:
+        x, y, w, h = left + corner + (position - 1) * edge, bottom - corner, edge, corner
+    elif position == 10:
+        x, y, w, h = right - corner, bottom - corner, corner, corner
+    elif 11 <= position <= 19:
+        offset = position - 10
+        x, y, w, h = right - corner, bottom - corner - offset * edge, corner, edge
+    elif position == 20:
+        x, y, w, h = right - corner, top, corner, corner
+    elif 21 <= position <= 29:
+        offset = position - 20
+        x, y, w, h = right - corner - offset * edge, top, edge, corner
+    elif position == 30:
+        x, y, w, h = left, top, corner, corner
+    else:
+        offset = position - 31
+        x, y, w, h = left, top + corner + offset * edge, corner, edge
+    return pygame.Rect(int(round(x)), int(round(y)), int(round(w)), int(round(h)))
+
+
+# The four sides of the ring, corners included: (positions, True if the side runs horizontally)
+SIDES = (
+    (range(0, 11), True),                  # bottom row
+    (range(10, 21), False),                # right column
+    (range(20, 31), True),                 # top row
+    ((*range(30, BOARD_SIZE), 0), False),  # left column
+)
+
+
+class BoardGeometry:
+    """Space rects, centers and hit testing for one board_rect. Treat the Rects as read-only."""
+
+    def __init__(self, board_rect):
+        self.board_rect = pygame.Rect(board_rect)
+        self.metrics = board_metrics(self.board_rect)
+        left, top = self.board_rect.topleft
+        corner = self.metrics[4]
+        self.rects = [space_rect(self.metrics, position) for position in range(BOARD_SIZE)]
+        self.local_rects = [rect.move(-left, -top) for rect in self.rects]
+        self.centers = [rect.center for rect in self.rects]
+        self.center_rect = pygame.Rect(
+            int(round(left + corner)),
+            int(round(top + corner)),
+            int(round(self.board_rect.width - 2 * corner)),
+            int(round(self.board_rect.height - 2 * corner)),
+        )
+        self.sides = [self.build_side(positions, horizontal) for positions, horizontal in SIDES]
+
+    def build_side(self, positions, horizontal):
+        """(cross_start, cross_end, horizontal, table) where table[offset along the side] -> position or -1."""
+        first = self.rects[positions[0]]
+        if horizontal:
+            origin, cross_start, cross_end = self.board_rect.left, first.top, first.bottom
+        else:
+            origin, cross_start, cross_end = self.board_rect.top, first.left, first.right
+        table = [-1] * (self.board_rect.width + 2)
+        # Paint higher positions first so the lowest wins where rounded rects overlap,
+        # matching a first-match scan over positions 0..39
+        for position in sorted(positions, reverse=True):
+            rect = self.rects[position]
+            start, end = (rect.left, rect.right) if horizontal else (rect.top, rect.bottom)
+            start = max(start - origin, 0)
+            end = min(end - origin, len(table))
+            table[start:end] = [position] * max(end - start, 0)
+        return cross_start, cross_end, horizontal, table
+
+    def hit_test(self, point):
+        """The board position under a screen point, or None."""
+        x, y = point
+        hit = None
+        for cross_start, cross_end, horizontal, table in self.sides:
+            cross, along = (y, x - self.board_rect.left) if horizontal else (x, y - self.board_rect.top)
+            if cross_start <= cross < cross_end and 0 <= along < len(table):
+                position = table[along]
+                if position >= 0 and (hit is None or position < hit):
+                    hit = position
+        return hit
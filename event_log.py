@@ -0,0 +1,129 @@
+"""Append-only log of typed rule events, streamed to disk in batches.
+
+MonopolyEngine.emit() hands every rule event (roll, move, rent, card,
+auction, trade, build, bankruptcy, ...) to an attached EventLog, which
+buffers them and appends whole batches to a file, e.g.
+
+    with EventLog("games.jsonl") as log:          # or "games.cmevents" for columns
+        for game in range(1000):
+            engine = MonopolyEngine(4, seed=game)
+            engine.event_log = log
+            log.start_game(game)
+            engine.play_game()
+
+Each record carries the game number, the turn and its event's fields from
+EVENT_FIELDS (players by seat, lots by board position). JSONL gets one
+object per line. The columnar format (COLUMNAR_SUFFIX) writes each batch
+as one block per event type: the event name, then one .npy array per
+column. read_columns() stitches the blocks back into arrays. Batches are
+handed to the OS with a plain write and never fsynced, so memory stays at
+one batch however many games are played.
+"""
+import json
+import os
+
+import numpy as np
+
+BATCH_SIZE = 8192           # records buffered before a write
+COLUMNAR_SUFFIX = ".cmevents"
+COMMON_FIELDS = ("game", "turn")
+
+# Event -> its fields, in the order MonopolyEngine.emit passes them
+EVENT_FIELDS = {
+    "roll": ("seat", "die1", "die2", "total"),                  # total after any Outlier Clamp
+    "move": ("seat", "start", "end"),
+    "pass_go": ("seat", "amount"),                              # also the bonus for landing on GO
+    "rent": ("seat", "owner", "position", "amount", "paid"),    # paid False: the player went bankrupt
+    "card": ("seat", "deck", "action"),                         # deck: chance, chance_dice or chest
+    "market_start": ("effect", "percent", "turns"),
+    "market_expire": ("effect", "percent"),
+    "buy": ("seat", "position", "price"),
+    "bid": ("seat", "position", "bid"),
+    "auction_end": ("seat", "position", "price"),               # seat -1: no bids
+    "trade": ("seat", "partner", "cash_given", "cash_received", "lots_given", "lots_received"),  # lots: 1 << position
+    "build": ("seat", "position", "building", "cost"),
+    "sell": ("seat", "position", "item", "amount"),             # item: building or property
+    "evaporate": ("seat", "position", "building"),
+    "mortgage": ("seat", "position", "mortgaged", "amount"),    # mortgaged False: paid off
+    "bankruptcy": ("seat", "cause"),
+    "bazinga_rescue": ("seat", "amount", "rescues_left"),
+}
+
+
+class EventLog:
+    """Buffered, append-only event sink writing JSONL or, for COLUMNAR_SUFFIX paths, columns."""
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = path
+        self.columnar = path.endswith(COLUMNAR_SUFFIX)
+        self.batch_size = batch_size
+        self.file = open(path, "ab")
+        self.buffer = []
+        self.game = 0
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def start_game(self, game):
+        """Tag the events that follow with this game number."""
+        self.game = game
+
+    def append(self, turn, event, fields):
+        self.buffer.append((self.game, turn, event, fields))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered batch (no fsync; the OS decides when it reaches the disk)."""
+        if not self.buffer:
+            return
+        if self.columnar:
+            self.write_columns(self.buffer)
+        else:
+            self.write_jsonl(self.buffer)
+        self.file.flush()
+        self.written += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+    def write_jsonl(self, records):
+        lines = []
+        for game, turn, event, fields in records:
+            record = {"event": event, "game": game, "turn": turn}
+            record.update(zip(EVENT_FIELDS[event], fields))
+            lines.append(json.dumps(record))
+        lines.append("")
+        self.file.write("\n".join(lines).encode("utf-8"))
+
+    def write_columns(self, records):
+        rows = {}
+        for game, turn, event, fields in records:
+            rows.setdefault(event, []).append((game, turn) + fields)
+        for event, event_rows in rows.items():
+            np.save(self.file, np.array(event))
+            for column in zip(*event_rows):
+                np.save(self.file, np.array(column))
+
+
+def read_columns(path):
+    """{event: {field: array}} from a columnar event file, every batch concatenated."""
+    blocks = {}
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        while f.tell() < size:
+            event = str(np.load(f))
+            columns = blocks.setdefault(event, {name: [] for name in COMMON_FIELDS + EVENT_FIELDS[event]})
+            for parts in columns.values():
+                parts.append(np.load(f))
+    return {event: {name: np.concatenate(parts) for name, parts in columns.items()}
+            for event, columns in blocks.items()}
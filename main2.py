@@ -1,13 +1,27 @@
 import pygame
-import random
 import math
-import os
-from enum import Enum
+import sys
+from monopoly_engine import (
+    BOARD_SIZE, CANADA_RED, CANADA_WHITE, BLACK, GRAY, LIGHT_GRAY, GOLD, BROWN,
+    MAX_PLAYERS, SKY_BLUE, ORANGE, RED, YELLOW, GREEN, BLUE, DiceType, PropertyType, MonopolyEngine,
+)
+from advisor import Advisor
+from animation import TokenAnimator
+from assets import FONT_FILE, AssetManager, asset_path
+from board_geometry import BoardGeometry
+from markov import get_landing_probabilities
+from render_cache import BoardLayer, FontRegistry, ModalCompositor
+from policies import POLICIES
+from profiler import FrameProfiler
+from rent_heatmap import ExpectedRentTable
+from replay import ActionLog, apply_action, load_replay, matches_recording, save_replay, start_replay
+from savegame import SaveFormatError, load_game, save_game
 
 # Initialize Pygame
 pygame.init()
 
 # Constants
+# Default (and smallest) window size; the window is resizable and layout follows its size
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 WIDTH = SCREEN_WIDTH
@@ -17,23 +31,28 @@ BOARD_HEIGHT = 800
 CARD_WIDTH = 300
 CARD_HEIGHT = 400
 FPS = 60
-
-# Colors
-CANADA_RED = (255, 51, 51)
-CANADA_WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GRAY = (128, 128, 128)
-LIGHT_GRAY = (200, 200, 200)
-GOLD = (255, 215, 0)
-SILVER = (192, 192, 192)
-BROWN = (139, 69, 19)
-SKY_BLUE = (135, 206, 235)
-PINK = (255, 182, 193)
-ORANGE = (255, 165, 0)
-RED = (255, 0, 0)
-YELLOW = (255, 255, 0)
-GREEN = (0, 128, 0)
-BLUE = (0, 0, 255)
+# With nothing animating the loop sleeps on pygame.event.wait for at most this long
+IDLE_WAIT_MS = 500
+# Pause after a turn is resolved (and its message has expired) before play passes on
+END_TURN_DELAY_MS = 1000
+# F5 saves here, F9 loads it back
+QUICKSAVE_PATH = "quicksave.cmsave"
+# F4 appends per-frame timings here (one JSON object per line)
+PROFILE_TRACE_PATH = "frame_trace.jsonl"
+# How often the F3 diagnostics overlay redraws its numbers
+PROFILER_REFRESH_MS = 250
+# Computer players use this entry of policies.POLICIES and pause this long before each move
+BOT_POLICY = "balanced"
+BOT_DELAY_MS = 700
+# Every game is recorded; F6 and quitting write the recording here (python main2.py --replay <file> plays it back)
+REPLAY_PATH = "last_game.cmreplay"
+# Pause between actions when playing a recording back
+REPLAY_STEP_MS = 400
+
+# Expected-rent heatmap (H): tint from cheap to costly, by log2(1 + 2 * dollars per opponent turn)
+HEAT_COLORS = [(255, 236, 120), (255, 214, 96), (255, 186, 78), (252, 154, 62),
+               (244, 120, 50), (232, 86, 42), (214, 54, 38), (190, 24, 36)]
+HEAT_ALPHA = 120
 
 # ── Dark-mode palette ─────────────────────────────────────────────────────────
 DM_BG         = (18,  18,  28)    # near-black background
@@ -59,522 +78,107 @@ def theme(color, dark_mode):
     }
     return mapping.get(color, color)
 
-# Dice Types
-class DiceType(Enum):
-    REGULAR = "Regular Dice"
-    STABLE = "Stable Dice (3s & 4s)"
-    CHANCE = "Chance Dice (1,1,1,4,5,6)"
-    BAZINGA = "Bazinga Dice (1,2,3,3,4,4)"
-    HIGH_EXPLOSIVE = "High Explosives!!"
-    pass
-
-# Typical rent/prices matrix (user-provided) used as baseline rent tiers per board position
-TYPICAL_RENTS = [["no"], [2, 10, 30, 90, 160, 250], ["no"],
-        [4, 20, 60, 180, 320, 450], ["no"], [25, 50, 100, 200],
-        [6, 30, 90, 270, 400, 550], ["no"], [6, 30, 90, 270, 400, 550],
-        [8, 40, 100, 300, 450, 600], ["no"], [10, 50, 150, 450, 625, 750],
-        [4, 10], [10, 50, 150, 450, 625, 750], [12, 60, 180, 500, 700, 900],
-        [25, 50, 100, 200], [14, 70, 200, 550, 750, 950], ["no"],
-        [14, 70, 200, 550, 750, 950], [16, 80, 220, 600, 800, 1000], ["no"],
-        [18, 90, 250, 700, 875, 1050], ["no"], [18, 90, 250, 700, 875, 1050],
-        [20, 100, 300, 750, 925, 1100], [25, 50, 100, 200],
-        [22, 110, 330, 800, 975, 1150], [22, 110, 330, 800, 975, 1150],
-        [4, 10], [24, 120, 360, 850, 1025], ["no"],
-        [26, 130, 390, 900, 1100, 1275], [26, 130, 390, 900, 1100, 1275],
-        ["no"], [28, 150, 450, 1000, 1200, 1400], [25, 50, 100, 200], ["no"],
-        [35, 175, 500, 1100, 1300, 1500], ["no"],
-        [50, 200, 600, 1400, 1700, 2000]]
-
-# House/Hotel pool (bank supply)
-HOUSE_POOL = 32
-HOTEL_POOL = 12
-
-# Property Types
-class PropertyType(Enum):
-    PROPERTY = "property"
-    TRAIN_STATION = "train_station"
-    UTILITY = "utility"
-    CHEST = "chest"
-    CHANCE = "chance"
-    JAIL = "jail"
-    GO = "go"
-    GO_TO_US = "go_to_us"
-    FREE_PARKING = "free_parking"
-
-# Property Class
-class Property:
-    def __init__(self, name, price, color, property_type=PropertyType.PROPERTY, base_rent=0, position=None):
-        self.name = name
-        self.price = price
-        self.color = color
-        self.property_type = property_type
-        self.owner = None
-        self.houses = 0
-        self.hotel = False
-        self.mortgaged = False
-        self.base_rent = base_rent
-        self.stock_value = price
-        self.position = position
-
-    def get_base_build_cost(self):
-        return max(50, self.price // 4)
-
-    def get_house_cost(self):
-        if self.property_type != PropertyType.PROPERTY or self.hotel or self.houses >= 4:
-            return None
-        base_cost = self.get_base_build_cost()
-        return int(round(base_cost * (1.3 ** self.houses)))
-
-    def get_hotel_cost(self):
-        if self.property_type != PropertyType.PROPERTY or self.hotel or self.houses != 4:
-            return None
-        base_cost = self.get_base_build_cost()
-        return int(round(base_cost * (1.3 ** 4) * 2))
-
-    def get_income_multiplier(self):
-        multiplier = 1.3 ** self.houses
-        if self.hotel:
-            multiplier *= 2
-        return multiplier
-
-    def get_rent(self, dice_total=0):
-        if self.mortgaged:
-            return 0
-            
-        if self.property_type == PropertyType.TRAIN_STATION:
-            stations = [p for p in properties if p.property_type == PropertyType.TRAIN_STATION and p.owner == self.owner]
-            return 25 * (2 ** (len(stations) - 1))
-            
-        elif self.property_type == PropertyType.UTILITY:
-            utilities = [p for p in properties if p.property_type == PropertyType.UTILITY and p.owner == self.owner]
-            multiplier = 10 if len(utilities) == 2 else 4
-            return multiplier * max(1, dice_total)
-            
-        else:
-            try:
-                matrix = TYPICAL_RENTS[self.position]
-            except Exception:
-                matrix = [self.base_rent]
-
-            if isinstance(matrix, list) and len(matrix) > 0 and matrix[0] == "no":
-                stock_adjusted_base = max(1, int(round(self.base_rent * (self.stock_value / max(1, self.price)))))
-                return int(round(stock_adjusted_base * self.get_income_multiplier()))
-
-            if self.hotel:
-                tier_value = matrix[-1]
-            elif self.houses > 0:
-                idx = min(self.houses, len(matrix) - 1)
-                tier_value = matrix[idx]
-            else:
-                tier_value = matrix[0]
-
-            stock_adjusted = max(0, int(round(tier_value * (self.stock_value / max(1, self.price)))))
-            return stock_adjusted
-
-    def build_house(self):
-        global HOUSE_POOL
-        if self.property_type == PropertyType.PROPERTY and self.houses < 4 and not self.hotel and HOUSE_POOL > 0:
-            self.houses += 1
-            HOUSE_POOL -= 1
-            return True
-        return False
-
-    def build_hotel(self):
-        global HOTEL_POOL, HOUSE_POOL
-        if self.property_type == PropertyType.PROPERTY and self.houses == 4 and not self.hotel and HOTEL_POOL > 0:
-            self.hotel = True
-            self.houses = 0
-            HOTEL_POOL -= 1
-            HOUSE_POOL += 4
-            return True
-        return False
-    
-    def update_stock_value(self, percent_change):
-        self.stock_value = int(self.stock_value * (1 + percent_change / 100))
-        self.stock_value = max(10, self.stock_value)
 
-    def get_mortgage_value(self):
-        return self.price // 2
+# Main Game Class
+class CanadaMonopoly(MonopolyEngine):
+    def __init__(self, num_players=2, bots=0, batch_dice=False):
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("Canada Monopoly - Probability & Statistics Lab")
+        self.clock = pygame.time.Clock()
+        
+        # Load Futura font from assets; every font shares one rendered-text cache
+        self.fonts = FontRegistry(asset_path(FONT_FILE))
+        self.font = self.fonts.get(20)
+        self.big_font = self.fonts.get(32)
+        self.title_font = self.fonts.get(44)
+        self.geometry = None
+        self.layout()
 
-    def get_unmortgage_cost(self):
-        return int(round(self.get_mortgage_value() * 1.1))
+        # Dark mode & settings
+        self.dark_mode = False
+        self.settings_open = False
+        self.settings_darkmode_btn = pygame.Rect(0, 0, 200, 36)
 
-    def mortgage(self):
-        if self.mortgaged:
-            return None
-        if self.houses > 0 or self.hotel:
-            return None
-        self.mortgaged = True
-        return self.get_mortgage_value()
+        # Hackathon laptop / Evaporator pick buttons (rebuilt while drawing)
+        self.hackathon_buttons = []
+        self.evaporator_prop_rects = []
 
-    def unmortgage(self):
-        if not self.mortgaged:
-            return None
-        cost = self.get_unmortgage_cost()
-        self.mortgaged = False
-        return cost
-
-    def sell_house(self):
-        global HOUSE_POOL, HOTEL_POOL
-        if self.houses > 0:
-            last_cost = int(round(self.get_base_build_cost() * (1.3 ** (self.houses - 1))))
-            gain = last_cost // 2
-            self.houses -= 1
-            HOUSE_POOL += 1
-            return gain
-        if self.hotel:
-            if HOUSE_POOL < 4:
-                return 0
-            base_cost = self.get_base_build_cost()
-            hotel_cost = int(round(base_cost * (1.3 ** 4) * 2))
-            gain = hotel_cost // 2
-            self.hotel = False
-            self.houses = 4
-            HOTEL_POOL += 1
-            HOUSE_POOL -= 4
-            return gain
-        return 0
-
-    def sell_property_to_bank(self):
-        if self.houses > 0 or self.hotel:
-            return None
-        sell_amount = self.price // 2
-        if self.mortgaged:
-            return None
-        return sell_amount
-
-
-# Player Class
-class Player:
-    def __init__(self, name, color, token):
-        # Core identity/state
-        self.name = name
-        self.color = color
-        self.token = token
-
-        # Economy + ownership state
-        self.position = 0
-        self.money = 500
-        self.properties = []
-
-        # Jail / turn-modifier state
-        self.in_jail = False
-        self.jail_turns = 0
-        self.consecutive_doubles = 0
-        self.get_out_of_jail_free = 0
-        self.next_roll_max_one = False
-
-        # Bazinga safety-net charges: when cash is <= 0 and Bazinga dice is active,
-        # this player can be rescued by +$200 up to 3 times.
-        self.bazinga_rescues_left = 3
-
-        # Animation state for smooth/hopping movement
-        self.animating = False
-        self.anim_path = []        # list of position indices to traverse (in order)
-        self.anim_step = 0         # current step index in anim_path
-        self.anim_frame = 0        # current frame within the step
-        self.anim_frames_per_step = 8
-        self.anim_hop_height = 18  # pixels of hop peak
-        self.anim_pending_landing = None  # final landing position to handle after animation
-        
-    def move(self, spaces):
-        self.position = (self.position + spaces) % len(board_spaces)
-        return self.position
-    
-    def pay(self, amount, recipient=None):
-        if self.money >= amount:
-            self.money -= amount
-            if recipient:
-                recipient.money += amount
-            return True
-        return False
-    
-    def receive(self, amount):
-        self.money += amount
+        self.hovered_position = None
+        self.auction_timer = 0          # countdown frames left, derived from auction_deadline
+        self.auction_deadline = None    # get_ticks() when the current bidder runs out of time
+        self.auction_turn_seconds = 5   # seconds per bidder
+        self.trade_dragging = None
+        self.trade_offer_prop_rects = []
+        self.trade_request_prop_rects = []
+        self.trade_partner_rects = []
+        self.trade_accept_button = pygame.Rect(0, 0, 120, 36)
+        self.trade_decline_button = pygame.Rect(0, 0, 120, 36)
+        self.trade_propose_button = pygame.Rect(0, 0, 140, 36)
+        self.probability_panel_open = False
+        self.heatmap_open = False
+        self.rent_table = ExpectedRentTable()
+        self.heat_font = self.fonts.get(14)
+        self.heat_tiles = {}            # (width, height, level) -> translucent tint Surface
+
+        # Dirty-rect bookkeeping: only changed screen regions are pushed each frame
+        self.board_layer = BoardLayer()
+        self.dirty_rects = []          # changed this frame (board layer, info panel)
+        self.overlay_rects = []        # transient popups/tooltips drawn this frame
+        self.last_overlay_rects = []   # ...and last frame, so they get erased when they close
+        self.panel_signature = None
+        self.frame_key = None
+        self.modals = ModalCompositor()
+
+        # F3 shows frame timings, F4 records them to PROFILE_TRACE_PATH
+        self.profiler = FrameProfiler()
+        self.profiler.watch("text_renders", lambda: self.fonts.cache.misses)
+        self.profiler.watch("text_cache_hits", lambda: self.fonts.cache.hits)
+        self.profiler.watch("modal_renders", lambda: self.modals.renders)
+        self.profiler_overlay = False
+        self.profiler_font = None
+        self.profiler_surface = None
+        self.profiler_refresh_at = 0
+
+        # A toggles the rollout advisor; its worker pool starts the first time it is switched on
+        self.advisor = None
+        self.advisor_enabled = False
+        self.advisor_surface = None
+        self.advisor_drawn = None       # (generation, busy) the surface was drawn for
+
+        # Timers run on wall-clock deadlines (pygame.time.get_ticks) so the loop can idle between events
+        self.message_deadline = 0
+        self.message_timer_seen = None  # message_timer as last derived; anything else was set by the engine
+        self.end_turn_at = None
+        self.bot_move_at = None
+        self.pending_events = []
+
+        # The last bot_count seats are played by the computer
+        self.bot_count = bots
+
+        # Recording being played back (see start_replay); while set, input and the turn timers stand down
+        self.replay = None
+        self.replay_index = 0
+        self.replay_at = None
 
+        # Animation state for player movement
+        self.tokens = TokenAnimator()  # tokens hopping along the board, driven by get_ticks()
 
-# Dice Class
-class Dice:
-    def __init__(self):
-        # Active dice variant controls the probability model used in roll().
-        self.dice_type = DiceType.REGULAR
-        self.roll_result = (0, 0)
-        self.double_count = 0
-        
-    def roll(self):
-        # Standard fair 1..6 dice
-        if self.dice_type == DiceType.REGULAR:
-            die1 = random.randint(1, 6)
-            die2 = random.randint(1, 6)
-            
-        # Mid-variance profile concentrated around 3 and 4
-        elif self.dice_type == DiceType.STABLE:
-            # Physical die: three 3-faces and three 4-faces
-            die1 = random.choice([3, 3, 3, 4, 4, 4])
-            die2 = random.choice([3, 3, 3, 4, 4, 4])
-
-        # Buff-leaning chance profile
-        elif self.dice_type == DiceType.CHANCE:
-            # Physical die: faces are 1,1,1,4,5,6
-            die1 = random.choice([1, 1, 1, 4, 5, 6])
-            die2 = random.choice([1, 1, 1, 4, 5, 6])
-
-        # Low-to-mid profile + bankruptcy protection synergy
-        elif self.dice_type == DiceType.BAZINGA:
-            # Physical die: faces are 1,2,3,3,4,4
-            die1 = random.choice([1, 2, 3, 3, 4, 4])
-            die2 = random.choice([1, 2, 3, 3, 4, 4])
-
-        # High-variance profile with extreme 1/6 faces only
-        elif self.dice_type == DiceType.HIGH_EXPLOSIVE:
-            # Physical die: three 1-faces and three 6-faces
-            die1 = random.choice([1, 1, 1, 6, 6, 6])
-            die2 = random.choice([1, 1, 1, 6, 6, 6])
-        
-        self.roll_result = (die1, die2)
-        return die1 + die2, die1 == die2
-    
-    def change_dice_type(self):
-        types = list(DiceType)
-        current_index = types.index(self.dice_type)
-        self.dice_type = types[(current_index + 1) % len(types)]
-        return self.dice_type
-
-
-# Game Board Spaces
-def create_board():
-    spaces = [
-        {"name": "GO (MathHacks)", "type": PropertyType.GO, "color": GOLD},
-        {"name": "STC", "type": PropertyType.PROPERTY, "price": 60, "color": BROWN, "base_rent": 4},
-        {"name": "Item Chest", "type": PropertyType.CHEST, "color": LIGHT_GRAY},
-        {"name": "Fairview Mall", "type": PropertyType.PROPERTY, "price": 60, "color": BROWN, "base_rent": 2},
-        {"name": "Income Tax", "type": "tax", "color": GRAY},
-        {"name": "York University", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
-        {"name": "Little Italy", "type": PropertyType.PROPERTY, "price": 100, "color": SKY_BLUE, "base_rent": 6},
-        {"name": "Chance", "type": PropertyType.CHANCE, "color": LIGHT_GRAY},
-        {"name": "Chinatown", "type": PropertyType.PROPERTY, "price": 100, "color": SKY_BLUE, "base_rent": 6},
-        {"name": "Greektown", "type": PropertyType.PROPERTY, "price": 120, "color": SKY_BLUE, "base_rent": 8},
-        {"name": "Jail (Arctic)", "type": PropertyType.JAIL, "color": GRAY},
-        {"name": "Harvey's", "type": PropertyType.PROPERTY, "price": 140, "color": PINK, "base_rent": 10},
-        {"name": "407 ETR", "type": PropertyType.UTILITY, "price": 150, "color": GRAY},
-        {"name": "Frankie Tomatto's", "type": PropertyType.PROPERTY, "price": 140, "color": PINK, "base_rent": 10},
-        {"name": "Distillery District", "type": PropertyType.PROPERTY, "price": 160, "color": PINK, "base_rent": 12},
-        {"name": "University of Toronto", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
-        {"name": "Marineland", "type": PropertyType.PROPERTY, "price": 220, "color": RED, "base_rent": 18},
-        {"name": "Item Chest", "type": PropertyType.CHEST, "color": LIGHT_GRAY},
-        {"name": "Scarborough", "type": PropertyType.PROPERTY, "price": 180, "color": ORANGE, "base_rent": 14},
-        {"name": "Markham", "type": PropertyType.PROPERTY, "price": 200, "color": ORANGE, "base_rent": 16},
-        {"name": "Free Parking", "type": PropertyType.FREE_PARKING, "color": GRAY},
-        {"name": "Canada's Wonderland", "type": PropertyType.PROPERTY, "price": 220, "color": RED, "base_rent": 18},
-        {"name": "Chance", "type": PropertyType.CHANCE, "color": LIGHT_GRAY},
-        {"name": "Vaughan", "type": PropertyType.PROPERTY, "price": 180, "color": ORANGE, "base_rent": 14},
-        {"name": "Calgary Stampede", "type": PropertyType.PROPERTY, "price": 240, "color": RED, "base_rent": 20},
-        {"name": "TMU", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
-        {"name": "Toronto Raptors", "type": PropertyType.PROPERTY, "price": 260, "color": YELLOW, "base_rent": 22},
-        {"name": "Maple Leafs", "type": PropertyType.PROPERTY, "price": 260, "color": YELLOW, "base_rent": 22},
-        {"name": "401", "type": PropertyType.UTILITY, "price": 150, "color": GRAY},
-        {"name": "Blue Jays", "type": PropertyType.PROPERTY, "price": 280, "color": YELLOW, "base_rent": 24},
-        {"name": "Go to US", "type": PropertyType.GO_TO_US, "color": GRAY},
-        {"name": "Ripley's Aquarium", "type": PropertyType.PROPERTY, "price": 300, "color": GREEN, "base_rent": 26},
-        {"name": "Centre Island", "type": PropertyType.PROPERTY, "price": 300, "color": GREEN, "base_rent": 26},
-        {"name": "Item Chest", "type": PropertyType.CHEST, "color": LIGHT_GRAY},
-        {"name": "Ontario Science Centre", "type": PropertyType.PROPERTY, "price": 320, "color": GREEN, "base_rent": 28},
-        {"name": "University of Waterloo", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
-        {"name": "Chance", "type": PropertyType.CHANCE, "color": LIGHT_GRAY},
-        {"name": "CN Tower", "type": PropertyType.PROPERTY, "price": 350, "color": BLUE, "base_rent": 35},
-        {"name": "Luxury Tax", "type": "tax", "color": GRAY},
-        {"name": "Rogers Centre", "type": PropertyType.PROPERTY, "price": 400, "color": BLUE, "base_rent": 50}
-    ]
-    return spaces
-
-
-# Create properties list
-board_spaces = create_board()
-properties = []
-for i, space in enumerate(board_spaces):
-    if space["type"] == PropertyType.PROPERTY:
-        prop = Property(space["name"], space["price"], space["color"], 
-                       PropertyType.PROPERTY, space["base_rent"], position=i)
-        properties.append(prop)
-        board_spaces[i]["property"] = prop
-    elif space["type"] in [PropertyType.TRAIN_STATION, PropertyType.UTILITY]:
-        prop = Property(space["name"], space["price"], space["color"], space["type"], position=i)
-        properties.append(prop)
-        board_spaces[i]["property"] = prop
-
-
-# Item Chest Cards
-item_chest_cards = [
-    {"name": "Outlier Clamp", "description": "Force your next outcome to be at most 1", 
-     "action": "rigged_dice"},
-    {"name": "Variance Eraser", "description": "Delete one house placed on someone's property",
-     "action": "evaporator"},
-    {"name": "Bernoulli Trial", "description": "Flip a fair coin: Heads = extra turn, Tails = lose turn",
-     "action": "coin_flip"},
-    {"name": "Compound Growth", "description": "Gain a 10% wealth boost",
-     "action": "coin_bag"}
-]
-
-# ─────────────────────────────────────────────────────────────────────────────
-# CHANCE / FATE CARDS  (weighted draw system)
-# 35%  →  Market-effect cards  (inflation / market_drop)
-# 35%  →  Money-transfer cards  (canada_gold, friend_money, bake_sale, jackpot,
-#                                 mr_monopoly_tax, wheel_fortune, concert_tickets,
-#                                 spare_money, party_money, huge_apology)
-# 30%  →  Special-action cards  (hackathon_laptop, evaporator_chance,
-#                                 coin_flip_chance, coin_bag_chance)
-# ─────────────────────────────────────────────────────────────────────────────
-
-CHANCE_CATEGORIES = {
-    "market": {
-        "weight": 35,
-        "cards": [
-            {
-                "name": "Inflation",
-                "description": "Housing prices increase +50% to +100% for 2–4 turns!",
-                "action": "inflation"
-            },
-            {
-                "name": "Market Drop",
-                "description": "Housing prices decrease -25% to -50% for 2–4 turns!",
-                "action": "market_drop"
-            },
-        ]
-    },
-    "money": {
-        "weight": 35,
-        "cards": [
-            {
-                "name": "Canada Wins Gold!",
-                "description": "Gain $100.",
-                "action": "canada_gold"
-            },
-            {
-                "name": "Your Friend Needs Money",
-                "description": "Lose $25.",
-                "action": "friend_money"
-            },
-            {
-                "name": "School Bake Sale",
-                "description": "Your school hosted a bake sale. Gain $10.",
-                "action": "bake_sale"
-            },
-            {
-                "name": "Jackpot!",
-                "description": "You hit the jackpot! Gain $200.",
-                "action": "jackpot"
-            },
-            {
-                "name": "Mr. Monopoly's Tax",
-                "description": "Mr. Monopoly is taxing you. Lose $100.",
-                "action": "mr_monopoly_tax"
-            },
-            {
-                "name": "Wheel of Fortune",
-                "description": "You spun the wheel of fortune! Gain $50.",
-                "action": "wheel_fortune"
-            },
-            {
-                "name": "Concert Tickets",
-                "description": "You bought concert tickets. Lose $50.",
-                "action": "concert_tickets"
-            },
-            {
-                "name": "Spare Change",
-                "description": "You collected some spare money. Collect $10 from each player.",
-                "action": "spare_money"
-            },
-            {
-                "name": "Party Host",
-                "description": "You need money to host a party. Collect $25 from each player.",
-                "action": "party_money"
-            },
-            {
-                "name": "Huge Apology",
-                "description": "You owe a huge apology to the world. Pay $50 to each player.",
-                "action": "huge_apology"
-            },
-        ]
-    },
-    "special": {
-        "weight": 30,
-        "cards": [
-            {
-                "name": "Hackathon Laptop",
-                "description": "Pick a roll number between 1 and 12. Move to that space!",
-                "action": "hackathon_laptop"
-            },
-            {
-                "name": "Evaporator",
-                "description": "Delete one house from any property on the board!",
-                "action": "evaporator_chance"
-            },
-            {
-                "name": "Coin Flip",
-                "description": "Flip a coin: Heads = extra turn, Tails = lose a turn.",
-                "action": "coin_flip_chance"
-            },
-            {
-                "name": "Coin Bag",
-                "description": "Gives you 10% more money!",
-                "action": "coin_bag_chance"
-            },
-        ]
-    },
-}
-
-
-def draw_chance_card():
-    """Pick a weighted category, then a random card from that category."""
-    categories = list(CHANCE_CATEGORIES.keys())
-    weights = [CHANCE_CATEGORIES[c]["weight"] for c in categories]
-    chosen_category = random.choices(categories, weights=weights, k=1)[0]
-    card = random.choice(CHANCE_CATEGORIES[chosen_category]["cards"])
-    return card
-
-
-# Active market effects: list of dicts {"action": ..., "turns_left": N, "amount": X}
-active_market_effects = []
-
-
-def apply_market_effects():
-    """Apply ongoing market effects and decrement their timers. Call once per turn."""
-    global active_market_effects
-    expired = []
-    for effect in active_market_effects:
-        for prop in properties:
-            if effect["action"] == "inflation":
-                prop.update_stock_value(effect["amount"])
-            elif effect["action"] == "market_drop":
-                prop.update_stock_value(-effect["amount"])
-        effect["turns_left"] -= 1
-        if effect["turns_left"] <= 0:
-            expired.append(effect)
-    for e in expired:
-        active_market_effects.remove(e)
+        # Board art and dice faces load in the background; placeholders are drawn until they arrive
+        self.assets = AssetManager()
+        self.assets.start()
 
+        super().__init__(num_players, batch_dice=batch_dice)
 
-# Main Game Class
-class CanadaMonopoly:
-    def __init__(self, num_players=2):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Canada Monopoly - Probability & Statistics Lab")
-        self.clock = pygame.time.Clock()
-        
-        # Load Futura font from assets
-        futura_path = os.path.join("assets", "Futura.ttf")
-        try:
-            self.font = pygame.font.Font(futura_path, 20)
-            self.big_font = pygame.font.Font(futura_path, 32)
-            self.title_font = pygame.font.Font(futura_path, 44)
-        except Exception:
-            self.font = pygame.font.Font(None, 20)
-            self.big_font = pygame.font.Font(None, 32)
-            self.title_font = pygame.font.Font(None, 44)
-        board_size = min(SCREEN_HEIGHT - 80, SCREEN_WIDTH - 380)
+    # ── Layout ──
+    def layout(self):
+        """Place the board, info panel and buttons for the current window size."""
+        self.screen_width, self.screen_height = self.screen.get_size()
+        board_size = min(self.screen_height - 80, self.screen_width - 380)
         self.board_rect = pygame.Rect(30, 40, board_size, board_size)
         self.info_x = self.board_rect.right + 25
         self.info_y = 50
+        # Dice faces keep their 42px size at the default window and grow with the board
+        self.dice_face_size = max(42, board_size * 42 // 720)
         self.roll_button = pygame.Rect(self.info_x, self.info_y + 120, 150, 40)
         self.dice_button = pygame.Rect(self.info_x, self.info_y + 170, 150, 40)
         self.trade_button = pygame.Rect(self.info_x, self.info_y + 640, 150, 40)
@@ -591,482 +195,57 @@ class CanadaMonopoly:
         self.sell_house_button = pygame.Rect(self.info_x, self.info_y + 430, 150, 36)
         self.sell_property_button = pygame.Rect(self.info_x, self.info_y + 470, 150, 36)
         self.mortgage_button = pygame.Rect(self.info_x, self.info_y + 510, 150, 36)
+        self.stats_button = pygame.Rect(self.screen_width - 220, 10, 100, 32)
+        self.settings_button = pygame.Rect(self.screen_width - 110, 10, 100, 32)
 
-        # Dark mode & settings
-        self.dark_mode = False
-        self.settings_open = False
-        self.stats_button = pygame.Rect(SCREEN_WIDTH - 220, 10, 100, 32)
-        self.settings_button = pygame.Rect(SCREEN_WIDTH - 110, 10, 100, 32)
-        self.settings_darkmode_btn = pygame.Rect(0, 0, 200, 36)
+    def resize(self, size):
+        width = max(SCREEN_WIDTH, size[0])
+        height = max(SCREEN_HEIGHT, size[1])
+        if (width, height) != self.screen.get_size():
+            self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.layout()
 
-        # Hackathon laptop: pending position pick (1-12)
-        self.hackathon_pending = False
-        self.hackathon_player = None
-        self.hackathon_buttons = []
+    @property
+    def board_overlay_image(self):
+        return self.assets.get_board(self.board_rect.size)
 
-        # Evaporator (chance version): pending house removal
-        self.evaporator_pending = False
-        self.evaporator_player = None
-        self.evaporator_prop_rects = []
-        
-        self.players = []
-        self.current_player_index = 0
-        self.dice = Dice()
-        self.game_over = False
-        self.winner = None
-        self.message = ""
-        self.message_timer = 0
-        self.waiting_for_action = True
-        self.dice_rolled = False
-        self.roll_value = 0
-        self.is_double = False
-        self.pending_property = None
-        self.hovered_position = None
-        self.auction_active = False
-        self.auction_property = None
-        self.auction_current_bid = 0
-        self.auction_highest_bidder = None
-        self.auction_turn_index = 0
-        self.auction_active_players = []
-        self.trade_active = False
-        self.auction_timer = 0          # countdown frames; reset each bidder turn
-        self.auction_turn_seconds = 5   # seconds per bidder
-        self.trade_stage = "select"
-        self.trade_partner_index = None
-        self.trade_offer_props = set()
-        self.trade_request_props = set()
-        self.trade_offer_cash = 0
-        self.trade_request_cash = 0
-        self.trade_dragging = None
-        self.trade_offer_prop_rects = []
-        self.trade_request_prop_rects = []
-        self.trade_partner_rects = []
-        self.trade_accept_button = pygame.Rect(0, 0, 120, 36)
-        self.trade_decline_button = pygame.Rect(0, 0, 120, 36)
-        self.trade_propose_button = pygame.Rect(0, 0, 140, 36)
-        self.num_players = num_players
-        self.probability_panel_open = False
-        self.roll_count = 0
-        self.roll_sum_total = 0
-        self.doubles_count = 0
-        self.roll_total_counts = {n: 0 for n in range(2, 13)}
-        self.last_rolls = []
-        self.position_visit_counts = {i: 0 for i in range(len(board_spaces))}
-        
-        # Animation state for player movement
-        self.player_animations = {}  # {player_id: {start_pos, end_pos, progress}}
-        self.animation_duration = 20  # frames for jump animation
-
-        self.dice_face_size = 42
-        self.dice_face_images = {}
-        dice_face_files = {
-            1: "dice-six-faces-one.png",
-            2: "dice-six-faces-two.png",
-            3: "dice-six-faces-three.png",
-            4: "dice-six-faces-four.png",
-            5: "dice-six-faces-five.png",
-            6: "dice-six-faces-six.png",
-        }
-        for value, file_name in dice_face_files.items():
-            die_path = os.path.join("assets", file_name)
-            try:
-                loaded_die = pygame.image.load(die_path).convert_alpha()
-                self.dice_face_images[value] = pygame.transform.smoothscale(
-                    loaded_die,
-                    (self.dice_face_size, self.dice_face_size)
-                )
-            except Exception:
-                self.dice_face_images[value] = None
-
-        self.board_overlay_image = None
-        overlay_path = os.path.join("assets", "board.png")
-        try:
-            loaded_overlay = pygame.image.load(overlay_path).convert()
-            self.board_overlay_image = pygame.transform.smoothscale(
-                loaded_overlay,
-                (self.board_rect.width, self.board_rect.height)
-            )
-        except Exception:
-            self.board_overlay_image = None
-        
-        self.setup_game()
+    def start_auction(self, prop):
+        super().start_auction(prop)
+        self.reset_auction_timer()
 
-    def set_message(self, text, duration=180):
-        self.message = text
-        self.message_timer = duration
-
-    def get_dice_total_distribution(self, dice_type):
-        # Per-face multiplicity model for each custom die variant.
-        if dice_type == DiceType.REGULAR:
-            weights = {1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1}
-        elif dice_type == DiceType.STABLE:
-            weights = {3: 3, 4: 3}
-        elif dice_type == DiceType.CHANCE:
-            weights = {1: 3, 4: 1, 5: 1, 6: 1}
-        elif dice_type == DiceType.BAZINGA:
-            weights = {1: 1, 2: 1, 3: 2, 4: 2}
-        else:
-            weights = {1: 3, 6: 3}
-
-        distribution = {}
-        total_outcomes = sum(weights.values()) ** 2
-        for a, wa in weights.items():
-            for b, wb in weights.items():
-                total = a + b
-                distribution[total] = distribution.get(total, 0.0) + (wa * wb) / total_outcomes
-        return distribution
-
-    def get_expected_roll(self, dice_type):
-        distribution = self.get_dice_total_distribution(dice_type)
-        return sum(total * prob for total, prob in distribution.items())
-
-    def get_roll_variance(self, dice_type):
-        distribution = self.get_dice_total_distribution(dice_type)
-        mean = self.get_expected_roll(dice_type)
-        return sum(((total - mean) ** 2) * prob for total, prob in distribution.items())
-
-    def get_doubles_probability(self, dice_type):
-        # Doubles probabilities depend on repeated faces in each profile.
-        if dice_type == DiceType.REGULAR:
-            return 1 / 6
-        if dice_type == DiceType.CHANCE:
-            return 1 / 3
-        if dice_type == DiceType.BAZINGA:
-            return 5 / 18
-        return 1 / 2
-
-    def record_roll_stats(self, roll_value, is_double, landing_pos):
-        self.roll_count += 1
-        self.roll_sum_total += roll_value
-        if roll_value in self.roll_total_counts:
-            self.roll_total_counts[roll_value] += 1
-        if is_double:
-            self.doubles_count += 1
-        self.last_rolls.append(roll_value)
-        if len(self.last_rolls) > 12:
-            self.last_rolls.pop(0)
-        if landing_pos is not None and landing_pos in self.position_visit_counts:
-            self.position_visit_counts[landing_pos] += 1
-        
-    def setup_game(self):
-        player_colors = [CANADA_RED, BLUE, GREEN, GOLD]
-        player_tokens = ["▲", "●", "■", "♦"]
-        for i in range(self.num_players):
-            player = Player(f"Player {i+1}", player_colors[i], player_tokens[i])
-            self.players.append(player)
-        
-    def handle_item_chest(self, player):
-        card = item_chest_cards.pop(0)
-        item_chest_cards.append(card)
-        
-        self.set_message(f"Item Chest Experiment: {card['name']}")
-        
-        if card['action'] == "rigged_dice":
-            player.next_roll_max_one = True
-            self.set_message("Outlier Clamp! Your next roll is capped at 1.")
-            
-        elif card['action'] == "evaporator":
-            self.set_message("Item Chest: Evaporator (not implemented) - no effect this turn")
-            
-        elif card['action'] == "coin_flip":
-            result = random.choice(["Heads", "Tails"])
-            if result == "Heads":
-                self.set_message("Heads! You get an extra turn!")
-                self.extra_turn = True
-            else:
-                self.set_message("Tails! You lose a turn!")
-                self.lose_turn = True
-                
-        elif card['action'] == "coin_bag":
-            bonus = int(player.money * 0.1)
-            player.receive(bonus)
-            self.set_message(f"Coin Bag: You got ${bonus} (10% bonus)!")
-
-    # ─────────────────────────────────────────────────────────────────────────
-    # CHANCE / FATE CARD HANDLER
-    # ─────────────────────────────────────────────────────────────────────────
-    def handle_chance(self, player):
-        if self.dice.dice_type == DiceType.CHANCE:
-            buff_actions = [
-                "canada_gold",
-                "bake_sale",
-                "jackpot",
-                "wheel_fortune",
-                "spare_money",
-                "party_money",
-                "coin_bag_chance",
-            ]
-            action = random.choice(buff_actions)
-            chance_dice_card_text = {
-                "canada_gold": ("Canada Wins Gold!", "Chance Dice boost: gain $100."),
-                "bake_sale": ("School Bake Sale", "Chance Dice boost: gain $10."),
-                "jackpot": ("Jackpot!", "Chance Dice boost: gain $200."),
-                "wheel_fortune": ("Wheel of Fortune", "Chance Dice boost: gain $50."),
-                "spare_money": ("Spare Change", "Chance Dice boost: collect $10 from each player."),
-                "party_money": ("Party Host", "Chance Dice boost: collect $25 from each player."),
-                "coin_bag_chance": ("Coin Bag", "Chance Dice boost: gain +10% money."),
-            }
-            name, description = chance_dice_card_text[action]
-            card = {"name": name, "description": description, "action": action}
-        else:
-            card = draw_chance_card()
-        action = card["action"]
-
-        # Show card name + description at the top
-        self.set_message(f"Stat Event – {card['name']}: {card['description']}", 240)
-
-        # ── Market effects (35%) ──────────────────────────────────────────────
-        if action == "inflation":
-            pct = random.randint(50, 100)
-            turns = random.randint(2, 4)
-            active_market_effects.append({"action": "inflation", "amount": pct, "turns_left": turns})
-            # Apply immediately this turn too
-            for prop in properties:
-                prop.update_stock_value(pct)
-            self.set_message(f"Inflation! Property values +{pct}% for {turns} turns!", 240)
-
-        elif action == "market_drop":
-            pct = random.randint(25, 50)
-            turns = random.randint(2, 4)
-            active_market_effects.append({"action": "market_drop", "amount": pct, "turns_left": turns})
-            for prop in properties:
-                prop.update_stock_value(-pct)
-            self.set_message(f"Market Drop! Property values -{pct}% for {turns} turns!", 240)
-
-        # ── Money-transfer cards (35%) ────────────────────────────────────────
-        elif action == "canada_gold":
-            player.receive(100)
-            self.set_message("Canada Wins Gold! You gained $100!")
-
-        elif action == "friend_money":
-            amt = min(25, player.money)
-            player.pay(amt)
-            self.set_message("Your friend needs $25. You lost $25.")
-
-        elif action == "bake_sale":
-            player.receive(10)
-            self.set_message("School bake sale raised money! You gained $10.")
-
-        elif action == "jackpot":
-            player.receive(200)
-            self.set_message("JACKPOT! You gained $200!")
-
-        elif action == "mr_monopoly_tax":
-            amt = min(100, player.money)
-            player.pay(amt)
-            self.set_message("Mr. Monopoly is taxing you $100!")
-
-        elif action == "wheel_fortune":
-            player.receive(50)
-            self.set_message("Wheel of Fortune! You gained $50!")
-
-        elif action == "concert_tickets":
-            amt = min(50, player.money)
-            player.pay(amt)
-            self.set_message("You bought concert tickets. Lost $50.")
-
-        elif action == "spare_money":
-            collected = 0
-            for other in self.players:
-                if other != player:
-                    paid = min(10, other.money)
-                    other.pay(paid)
-                    player.receive(paid)
-                    collected += paid
-            self.set_message(f"Collected spare change! Got ${collected} total (${10} per player).")
-
-        elif action == "party_money":
-            collected = 0
-            for other in self.players:
-                if other != player:
-                    paid = min(25, other.money)
-                    other.pay(paid)
-                    player.receive(paid)
-                    collected += paid
-            self.set_message(f"Party time! Collected ${collected} total (${25} per player).")
-
-        elif action == "huge_apology":
-            total_paid = 0
-            for other in self.players:
-                if other != player:
-                    amt = min(50, player.money)
-                    if player.money >= 50:
-                        player.pay(50, other)
-                        total_paid += 50
-                    else:
-                        player.pay(player.money, other)
-                        total_paid += amt
-            self.set_message(f"Huge Apology! You paid $50 to each other player (${total_paid} total).")
-
-        # ── Special-action cards (30%) ────────────────────────────────────────
-        elif action == "hackathon_laptop":
-            self.set_message("Hackathon Laptop! Choose a number 1–12 to move to that space!", 999999)
-            self.hackathon_pending = True
-            self.hackathon_player = player
-            self.waiting_for_action = False
-
-        elif action == "evaporator_chance":
-            # Find all properties with houses/hotels
-            buildable = [p for p in properties if (p.houses > 0 or p.hotel) and p.owner is not None]
-            if not buildable:
-                self.set_message("Evaporator: No houses on the board to remove!")
-            else:
-                self.set_message("Evaporator! Click a property to remove one house/hotel.", 999999)
-                self.evaporator_pending = True
-                self.evaporator_player = player
-                self.waiting_for_action = False
-
-        elif action == "coin_flip_chance":
-            result = random.choice(["Heads", "Tails"])
-            if result == "Heads":
-                self.set_message(f"Coin Flip – Heads! {player.name} gets an extra turn!")
-                self.extra_turn = True
-            else:
-                self.set_message(f"Coin Flip – Tails! {player.name} loses a turn!")
-                self.lose_turn = True
+    def advance_auction_turn(self):
+        super().advance_auction_turn()
+        self.reset_auction_timer()
 
-        elif action == "coin_bag_chance":
-            bonus = int(player.money * 0.1)
-            player.receive(bonus)
-            self.set_message(f"Coin Bag! You got +10% money (${bonus})!")
+    def reset_auction_timer(self):
+        self.auction_timer = self.auction_turn_seconds * FPS
+        self.auction_deadline = pygame.time.get_ticks() + self.auction_turn_seconds * 1000
 
-    def handle_landing(self, player, position):
-        space = board_spaces[position]
-        
-        if position == 0 and not self.just_passed_go:
-            player.receive(300)
-            self.set_message("Landed on GO! Received $300!")
-        
-        if "property" in space:
-            prop = space["property"]
-            
-            if prop.owner is None:
-                if player.money < prop.price:
-                    self.set_message(f"{prop.name} costs ${prop.price}. Starting auction.")
-                    self.start_auction(prop)
-                else:
-                    self.waiting_for_action = False
-                    self.pending_property = prop
-                    self.set_message(f"{prop.name} is unowned. Buy for ${prop.price}, auction, or skip.", 100000)
-                
-            elif prop.owner != player:
-                rent = prop.get_rent()
-                if player.pay(rent, prop.owner):
-                    self.set_message(f"Paid ${rent} rent to {prop.owner.name}")
-                else:
-                    # Failed rent payment is treated as a bankruptcy event.
-                    # Set cash to 0 so Bazinga rescue logic can evaluate the <= 0 rule.
-                    player.money = 0
-                    self.set_message(f"{player.name} can't pay rent! Bankruptcy!")
-                    self.handle_bankruptcy(player)
-        
-        elif space["type"] == PropertyType.CHEST:
-            self.handle_item_chest(player)
-            
-        elif space["type"] == PropertyType.CHANCE:
-            self.handle_chance(player)
-            
-        elif space["type"] == PropertyType.GO_TO_US:
-            player.position = 10
-            player.in_jail = True
-            self.set_message("Go to US! Sent to the Arctic! Pay $50 to fly back")
-            
-        elif space["type"] == PropertyType.JAIL:
-            if player.in_jail:
-                player.jail_turns += 1
-                self.set_message(f"{player.name} is in jail. Turn {player.jail_turns}/3")
-        
-        elif space["type"] == "tax":
-            if space["name"] == "Income Tax":
-                player.pay(200, None)
-                self.set_message("Paid $200 Income Tax")
-            else:
-                player.pay(100, None)
-                self.set_message("Paid $100 Luxury Tax")
-    
-    def handle_bankruptcy(self, player):
-        # Bazinga bailout rule:
-        # If the player is out of cash (<= 0), and the CURRENT selected dice type
-        # is Bazinga, grant +$200 up to 3 times before true bankruptcy.
-        if player.money <= 0 and self.dice.dice_type == DiceType.BAZINGA and player.bazinga_rescues_left > 0:
-            player.bazinga_rescues_left -= 1
-            player.receive(200)
-            self.set_message(
-                f"Bazinga save! {player.name} gets +$200 "
-                f"({player.bazinga_rescues_left} save(s) left)."
-            )
-            return
+    def set_message(self, text, duration=180):
+        super().set_message(text, duration)
+        self.message_timer_seen = None
 
-        self.players.remove(player)
-        if len(self.players) == 1:
-            self.game_over = True
-            self.winner = self.players[0]
-            self.set_message(f"{self.players[0].name} wins!", 100000)
+    def open_trade(self):
+        super().open_trade()
+        self.trade_dragging = None
 
-    def force_bankruptcy_if_needed(self):
-        # Safety net for any code path that accidentally drives a player below zero.
-        if self.game_over or not self.players:
-            return
-        current_player = self.players[self.current_player_index]
-        if current_player.money < 0:
-            current_player.money = 0
-            self.set_message(f"{current_player.name} went bankrupt!")
-            self.handle_bankruptcy(current_player)
+    def close_trade(self, message=None):
+        super().close_trade(message)
+        self.trade_dragging = None
 
-    def start_auction(self, prop):
-        self.auction_active = True
-        self.auction_property = prop
-        self.auction_current_bid = max(1, prop.price // 2)
-        self.auction_highest_bidder = None
-        self.auction_active_players = [p for p in self.players if p.money > 0]
-        self.auction_turn_index = 0
-        self.auction_timer = self.auction_turn_seconds * FPS
-        self.pending_property = None
-        self.waiting_for_action = False
-
-    def finish_auction(self):
-        if self.auction_highest_bidder:
-            self.auction_highest_bidder.pay(self.auction_current_bid)
-            self.auction_property.owner = self.auction_highest_bidder
-            self.auction_highest_bidder.properties.append(self.auction_property)
-            self.set_message(
-                f"{self.auction_highest_bidder.name} won {self.auction_property.name} for ${self.auction_current_bid}.")
-        else:
-            self.set_message(f"No bids for {self.auction_property.name}.")
-        self.auction_active = False
-        self.auction_property = None
-        self.auction_current_bid = 0
-        self.auction_highest_bidder = None
-        self.auction_active_players = []
-        self.auction_turn_index = 0
-        self.waiting_for_action = True
-
-    def get_current_auction_player(self):
-        if not self.auction_active_players:
-            return None
-        self.auction_turn_index %= len(self.auction_active_players)
-        return self.auction_active_players[self.auction_turn_index]
+    def on_player_moved(self, player, old_pos, new_pos):
+        self.tokens.start(player, old_pos, new_pos, pygame.time.get_ticks())
 
-    def advance_auction_turn(self):
-        if not self.auction_active_players:
-            self.finish_auction()
-            return
-        if len(self.auction_active_players) == 1:
-            self.finish_auction()
-            return
-        self.auction_turn_index = (self.auction_turn_index + 1) % len(self.auction_active_players)
-        self.auction_timer = self.auction_turn_seconds * FPS
+    def get_landing_probability(self, position):
+        return float(get_landing_probabilities(self.dice.dice_type)[position])
 
     def get_hovered_position(self, mouse_pos):
-        for position in range(len(board_spaces)):
-            if self.get_space_rect(position).collidepoint(mouse_pos):
-                return position
-        return None
+        return self.get_geometry().hit_test(mouse_pos)
 
     def get_hovered_property(self):
         if self.hovered_position is None:
             return None
-        space = board_spaces[self.hovered_position]
+        space = self.board.spaces[self.hovered_position]
         return space.get("property")
 
     def get_property_tooltip_lines(self, prop):
@@ -1079,6 +258,7 @@ class CanadaMonopoly:
         lines.append(f"Full set: {'Yes' if prop.owner and self.owns_color_set(prop.owner, prop) else 'No'}")
         lines.append(f"Houses: {prop.houses}/4  Hotel: {'Yes' if prop.hotel else 'No'}")
         lines.append(f"Mortgaged: {'Yes' if prop.mortgaged else 'No'}")
+        lines.append(f"Landing odds: {self.get_landing_probability(prop.position) * 100:.2f}% per roll")
         house_cost = prop.get_house_cost()
         hotel_cost = prop.get_hotel_cost()
         lines.append(f"Next House Cost: ${house_cost}" if house_cost else "Next House Cost: N/A")
@@ -1088,24 +268,26 @@ class CanadaMonopoly:
     def draw_hover_tooltip(self, mouse_pos):
         if self.hovered_position is None:
             return
-        space = board_spaces[self.hovered_position]
+        space = self.board.spaces[self.hovered_position]
         lines = [space["name"]]
         if "property" in space:
             prop = space["property"]
             lines = self.get_property_tooltip_lines(prop)
         else:
             lines.append(f"Type: {space['type']}")
+            lines.append(f"Landing odds: {self.get_landing_probability(self.hovered_position) * 100:.2f}% per roll")
         padding = 8
         line_height = 20
         width = max(self.font.size(line)[0] for line in lines) + padding * 2
         height = line_height * len(lines) + padding * 2
         tooltip_x = mouse_pos[0] + 14
         tooltip_y = mouse_pos[1] + 14
-        if tooltip_x + width > SCREEN_WIDTH:
+        if tooltip_x + width > self.screen_width:
             tooltip_x = mouse_pos[0] - width - 14
-        if tooltip_y + height > SCREEN_HEIGHT:
+        if tooltip_y + height > self.screen_height:
             tooltip_y = mouse_pos[1] - height - 14
         tooltip_rect = pygame.Rect(tooltip_x, tooltip_y, width, height)
+        self.overlay_rects.append(tooltip_rect)
         tip_bg   = DM_SURFACE  if self.dark_mode else CANADA_WHITE
         tip_bord = DM_BORDER   if self.dark_mode else BLACK
         tip_txt  = DM_TEXT     if self.dark_mode else BLACK
@@ -1115,180 +297,58 @@ class CanadaMonopoly:
             surf = self.font.render(line, True, tip_txt)
             self.screen.blit(surf, (tooltip_x + padding, tooltip_y + padding + i * line_height))
 
-    def try_buy_house(self, player, prop):
-        if prop is None or prop.owner != player:
-            self.set_message("You can only build on your own properties.")
-            return
-        if not self.owns_color_set(player, prop):
-            self.set_message("You need the full color set to build here.")
-            return
-        house_cost = prop.get_house_cost()
-        if house_cost is None:
-            self.set_message("Cannot build a house here.")
-            return
-        same_color_props = [p for p in [s.get("property") for s in board_spaces] if p and p.property_type == PropertyType.PROPERTY and p.color == prop.color]
-        counts = [(5 if p.hotel else p.houses) for p in same_color_props]
-        min_houses = min(counts) if counts else 0
-        if (5 if prop.hotel else prop.houses) != min_houses:
-            self.set_message("Must build evenly across the color set.")
-            return
-        if HOUSE_POOL <= 0:
-            self.set_message("No houses available in the bank.")
-            return
-        if player.pay(house_cost):
-            prop.build_house()
-            self.set_message(f"Built a house on {prop.name} for ${house_cost}.")
-        else:
-            self.set_message("Not enough money to buy a house.")
-
-    def try_buy_hotel(self, player, prop):
-        if prop is None or prop.owner != player:
-            self.set_message("You can only build on your own properties.")
-            return
-        if not self.owns_color_set(player, prop):
-            self.set_message("You need the full color set to build here.")
-            return
-        hotel_cost = prop.get_hotel_cost()
-        if hotel_cost is None:
-            self.set_message("Need 4 houses before buying a hotel.")
-            return
-        if HOTEL_POOL <= 0:
-            self.set_message("No hotels available in the bank.")
-            return
-        if player.pay(hotel_cost):
-            prop.build_hotel()
-            self.set_message(f"Built a hotel on {prop.name} for ${hotel_cost}.")
-        else:
-            self.set_message("Not enough money to buy a hotel.")
-
-    def owns_color_set(self, player, prop):
-        if prop.property_type != PropertyType.PROPERTY:
-            return False
-        same_color_props = [
-            space["property"] for space in board_spaces
-            if space.get("property") and space["property"].property_type == PropertyType.PROPERTY
-            and space["property"].color == prop.color
-        ]
-        return same_color_props and all(p.owner == player for p in same_color_props)
+    def get_geometry(self):
+        """Space rects and hit testing for the current board_rect, rebuilt only when it changes."""
+        if self.geometry is None or self.geometry.board_rect != self.board_rect:
+            self.geometry = BoardGeometry(self.board_rect)
+        return self.geometry
 
-    def open_trade(self):
-        self.trade_active = True
-        self.trade_stage = "select"
-        self.trade_partner_index = None
-        self.trade_offer_props = set()
-        self.trade_request_props = set()
-        self.trade_offer_cash = 0
-        self.trade_request_cash = 0
-        self.trade_dragging = None
-        self.waiting_for_action = False
+    def get_board_metrics(self):
+        return self.get_geometry().metrics
 
-    def close_trade(self, message=None):
-        if message:
-            self.set_message(message)
-        self.trade_active = False
-        self.trade_partner_index = None
-        self.trade_offer_props = set()
-        self.trade_request_props = set()
-        self.trade_offer_cash = 0
-        self.trade_request_cash = 0
-        self.trade_dragging = None
-        self.trade_stage = "select"
-        self.waiting_for_action = True
-
-    def apply_trade(self, current_player, partner):
-        if self.trade_offer_cash > current_player.money or self.trade_request_cash > partner.money:
-            self.set_message("Trade failed: not enough cash.")
-            return False
-        if any(p.owner != current_player for p in self.trade_offer_props):
-            self.set_message("Trade failed: you no longer own some offered properties.")
-            return False
-        if any(p.owner != partner for p in self.trade_request_props):
-            self.set_message("Trade failed: partner no longer owns some requested properties.")
-            return False
-        current_player.money -= self.trade_offer_cash
-        partner.money += self.trade_offer_cash
-        partner.money -= self.trade_request_cash
-        current_player.money += self.trade_request_cash
-        for prop in list(self.trade_offer_props):
-            prop.owner = partner
-            if prop in current_player.properties:
-                current_player.properties.remove(prop)
-            if prop not in partner.properties:
-                partner.properties.append(prop)
-        for prop in list(self.trade_request_props):
-            prop.owner = current_player
-            if prop in partner.properties:
-                partner.properties.remove(prop)
-            if prop not in current_player.properties:
-                current_player.properties.append(prop)
-        return True
-    
-    def next_turn(self):
-        # Apply market effects each turn
-        apply_market_effects()
+    def get_space_center(self, position):
+        return self.get_geometry().centers[position]
 
-        # Fluctuate every property value by a random ±5% each turn
-        for prop in properties:
-            multiplier = random.uniform(0.95, 1.05)
-            prop.stock_value = max(10, int(round(prop.stock_value * multiplier)))
+    def get_space_rect(self, position):
+        return self.get_geometry().rects[position]
 
-        if hasattr(self, 'extra_turn') and self.extra_turn:
-            self.extra_turn = False
-            return
-        if hasattr(self, 'lose_turn') and self.lose_turn:
-            self.lose_turn = False
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            return
-        if self.is_double and not self.dice.double_count >= 3:
-            return
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
-        self.dice_rolled = False
+    def get_local_space_rect(self, position):
+        """Space rect relative to the board's top-left (for the cached board layer)."""
+        return self.get_geometry().local_rects[position]
 
-    def get_board_metrics(self):
-        left = float(self.board_rect.left)
-        top = float(self.board_rect.top)
-        side = float(self.board_rect.width)
-        corner = side * 0.135
-        edge = (side - (2 * corner)) / 9.0
-        right = left + side
-        bottom = top + side
-        return left, top, right, bottom, corner, edge
+    def get_center_rect(self):
+        return self.get_geometry().center_rect
 
-    def get_space_center(self, position):
-        rect = self.get_space_rect(position)
-        return rect.center
+    def get_panel_rect(self):
+        """Everything right of the board: info panel, action buttons, Stats/Settings."""
+        return pygame.Rect(self.board_rect.right, 0, self.screen_width - self.board_rect.right, self.screen_height)
 
-    def get_space_rect(self, position):
-        left, top, right, bottom, corner, edge = self.get_board_metrics()
-        if position == 0:
-            x, y, w, h = left, bottom - corner, corner, corner
-        elif 1 <= position <= 9:
-            x, y, w, h = left + corner + (position - 1) * edge, bottom - corner, edge, corner
-        elif position == 10:
-            x, y, w, h = right - corner, bottom - corner, corner, corner
-        elif 11 <= position <= 19:
-            offset = position - 10
-            x, y, w, h = right - corner, bottom - corner - offset * edge, corner, edge
-        elif position == 20:
-            x, y, w, h = right - corner, top, corner, corner
-        elif 21 <= position <= 29:
-            offset = position - 20
-            x, y, w, h = right - corner - offset * edge, top, edge, corner
-        elif position == 30:
-            x, y, w, h = left, top, corner, corner
-        else:
-            offset = position - 31
-            x, y, w, h = left, top + corner + offset * edge, corner, edge
-        return pygame.Rect(int(round(x)), int(round(y)), int(round(w)), int(round(h)))
+    # ── Board layer drawing (board-local coordinates; cached by BoardLayer) ──
+    def draw_static_board(self, surface):
+        """Everything on the board that only changes with the theme: spaces, art, card deck."""
+        dm = self.dark_mode
+        board_bg = DM_SURFACE if dm else LIGHT_GRAY
+        border_col = DM_BORDER if dm else BLACK
+        surface.fill(board_bg)
+        pygame.draw.rect(surface, border_col, surface.get_rect(), 2)
+        center_rect = self.get_center_rect().move(-self.board_rect.left, -self.board_rect.top)
+        pygame.draw.rect(surface, board_bg, center_rect)
+        pygame.draw.rect(surface, border_col, center_rect, 2)
+        for position in range(BOARD_SIZE):
+            with self.profiler.section("draw_space"):
+                self.draw_space(surface, position)
+        if self.board_overlay_image:
+            surface.blit(self.board_overlay_image, (0, 0))
+        self.draw_center_card_deck(surface)
 
-    def draw_space(self, position):
-        space = board_spaces[position]
-        rect = self.get_space_rect(position)
+    def draw_space(self, surface, position):
+        space = self.board.spaces[position]
+        rect = self.get_local_space_rect(position)
         dm = self.dark_mode
         sp_bg   = DM_SURFACE  if dm else CANADA_WHITE
         sp_bord = DM_BORDER   if dm else BLACK
-        pygame.draw.rect(self.screen, sp_bg,   rect)
-        pygame.draw.rect(self.screen, sp_bord, rect, 2)
+        pygame.draw.rect(surface, sp_bg,   rect)
+        pygame.draw.rect(surface, sp_bord, rect, 2)
         if 0 < position < 10:
             bar_rect = pygame.Rect(rect.x, rect.y, rect.width, 14)
         elif 10 < position < 20:
@@ -1300,31 +360,71 @@ class CanadaMonopoly:
         else:
             bar_rect = None
         if bar_rect and space["type"] in [PropertyType.PROPERTY, PropertyType.TRAIN_STATION, PropertyType.UTILITY]:
-            pygame.draw.rect(self.screen, space["color"], bar_rect)
-            pygame.draw.rect(self.screen, BLACK, bar_rect, 1)
+            pygame.draw.rect(surface, space["color"], bar_rect)
+            pygame.draw.rect(surface, BLACK, bar_rect, 1)
+
+    def get_space_marks(self, prop):
+        """The parts of a space that change in play (owner outline, building tag, heatmap cell), or None."""
+        owner_color = prop.owner.color if prop.owner is not None else None
+        label = "HOTEL" if prop.hotel else (f"H{prop.houses}" if prop.houses > 0 else None)
+        heat = self.get_heat_mark(prop.position) if self.heatmap_open else None
+        if owner_color is None and label is None and heat is None:
+            return None
+        return owner_color, label, heat
+
+    def get_heat_mark(self, position):
+        """(tint level or None, dollar label) for the heatmap, read from the incrementally kept rent table."""
+        value = float(self.rent_table.values[position])
+        level = min(len(HEAT_COLORS) - 1, int(math.log2(1.0 + 2.0 * value))) if value > 0 else None
+        return level, (f"${value:.2f}" if value < 10 else f"${value:.0f}")
+
+    def get_heat_tile(self, size, level):
+        key = (*size, level)
+        tile = self.heat_tiles.get(key)
+        if tile is None:
+            if len(self.heat_tiles) > 4 * len(HEAT_COLORS):
+                # Tiles for earlier window sizes
+                self.heat_tiles.clear()
+            tile = pygame.Surface(size, pygame.SRCALPHA)
+            tile.fill((*HEAT_COLORS[level], HEAT_ALPHA))
+            self.heat_tiles[key] = tile
+        return tile
+
+    def draw_space_marks(self, surface, position, marks):
+        owner_color, label, heat = marks
+        rect = self.get_local_space_rect(position)
+        if heat is not None:
+            level, text = heat
+            if level is not None:
+                surface.blit(self.get_heat_tile(rect.size, level), rect.topleft)
+            tag = self.heat_font.render(text, True, DM_TEXT if self.dark_mode else BLACK)
+            surface.blit(tag, tag.get_rect(center=(rect.centerx, rect.centery + 16)))
         # Coloured outline showing which player owns this space
-        if "property" in space:
-            prop = space["property"]
-            if prop.owner is not None:
-                pygame.draw.rect(self.screen, prop.owner.color, rect, 5)
-            label = "HOTEL" if prop.hotel else (f"H{prop.houses}" if prop.houses > 0 else None)
-            if label:
-                tag = self.font.render(label, True, RED)
-                self.screen.blit(tag, tag.get_rect(center=rect.center))
-
-    def draw_player_circles(self):
+        if owner_color is not None:
+            pygame.draw.rect(surface, owner_color, rect, 5)
+        if label:
+            tag = self.font.render(label, True, RED)
+            surface.blit(tag, tag.get_rect(center=rect.center))
+
+    def draw_hover_highlight(self, surface, position):
+        pygame.draw.rect(surface, GOLD, self.get_local_space_rect(position), 3)
+
+    def get_token_rect(self, center):
+        return pygame.Rect(center[0] - 10, center[1] - 10, 21, 21)
+
+    def draw_token(self, surface, color, center):
+        pygame.draw.circle(surface, color, center, 10)
+        pygame.draw.circle(surface, BLACK, center, 2)
+
+    def get_token_draws(self):
+        """[(color, (x, y))] for every token this frame, in screen coordinates."""
+        draws = []
+        centers = self.get_geometry().centers
         players_by_position = {}
         for player in self.players:
-            # Use animated position if animation is in progress
-            if player in self.player_animations:
-                anim = self.player_animations[player]
-                display_pos = anim["start_pos"]
-            else:
-                display_pos = player.position
-            players_by_position.setdefault(display_pos, []).append(player)
-        
+            players_by_position.setdefault(player.position, []).append(player)
+
         for position, players_on_space in players_by_position.items():
-            center_x, center_y = self.get_space_center(position)
             count = len(players_on_space)
             for index, player in enumerate(players_on_space):
                 if count == 1:
@@ -1332,72 +432,41 @@ class CanadaMonopoly:
                 else:
                     angle = (2 * math.pi * index) / count
                     offset_x, offset_y = math.cos(angle) * 12, math.sin(angle) * 12
-                
-                draw_x = int(center_x + offset_x)
-                draw_y = int(center_y + offset_y)
-                
-                # Apply jump animation if active
-                if player in self.player_animations:
-                    anim = self.player_animations[player]
-                    progress = anim["progress"] / float(self.animation_duration)
-                    
-                    # Interpolate position from start to end
-                    start_center = self.get_space_center(anim["start_pos"])
-                    end_center = self.get_space_center(anim["end_pos"])
-                    
-                    anim_x = start_center[0] + (end_center[0] - start_center[0]) * progress
-                    anim_y = start_center[1] + (end_center[1] - start_center[1]) * progress
-                    
-                    # Add vertical jump using sine wave
-                    jump_height = 30
-                    jump_offset = -jump_height * math.sin(progress * math.pi)
-                    
-                    draw_x = int(anim_x + offset_x)
-                    draw_y = int(anim_y + offset_y + jump_offset)
-                
-                pygame.draw.circle(self.screen, player.color, (draw_x, draw_y), 10)
-                pygame.draw.circle(self.screen, BLACK, (draw_x, draw_y), 2)
-    
-    def update_animations(self):
-        """Update all player movement animations."""
-        for player in list(self.player_animations.keys()):
-            anim = self.player_animations[player]
-            anim["progress"] += 1
-            
-            if anim["progress"] >= self.animation_duration:
-                # Animation complete
-                del self.player_animations[player]
-    
+
+                # A moving token hops along the board, already at its slot on the destination space
+                center_x, center_y = self.tokens.point(player, centers) or centers[position]
+                draws.append((player.color, (int(center_x + offset_x), int(center_y + offset_y))))
+        return draws
+
+    def update_animations(self, now):
+        """Advance token movement to `now` (ms from get_ticks)."""
+        self.tokens.update(now)
+
     def draw_board(self):
-        mouse_pos = pygame.mouse.get_pos()
+        models = self.get_modal_models()
+        if models and self.modals.base_key == self.get_modal_base_key(models):
+            # Board and panel are frozen under the open modals: erase last frame's popups and recomposite
+            for rect in self.last_overlay_rects:
+                self.screen.blit(self.modals.base, rect, rect)
+            # Popups frozen into the base (a message box) are still on screen and must be erased when it thaws
+            self.overlay_rects.extend(self.modals.base_overlay_rects)
+            self.draw_modals(models)
+            if self.settings_open:
+                self.draw_settings_panel()
+            return
+
+        self.screen.fill(DM_BG if self.dark_mode else CANADA_WHITE)
+        # No hover highlight or tooltips under a modal
+        mouse_pos = pygame.mouse.get_pos() if not models else (-1, -1)
         self.hovered_position = self.get_hovered_position(mouse_pos)
         dm = self.dark_mode
 
-        bg_col = DM_BG if dm else CANADA_WHITE
-        board_bg = DM_SURFACE if dm else LIGHT_GRAY
-        border_col = DM_BORDER if dm else BLACK
-
-        pygame.draw.rect(self.screen, board_bg, self.board_rect)
-        pygame.draw.rect(self.screen, border_col, self.board_rect, 2)
-        _, _, _, _, corner, _ = self.get_board_metrics()
-        center_rect = pygame.Rect(
-            int(round(self.board_rect.left + corner)),
-            int(round(self.board_rect.top + corner)),
-            int(round(self.board_rect.width - 2 * corner)),
-            int(round(self.board_rect.height - 2 * corner)),
-        )
-        pygame.draw.rect(self.screen, board_bg, center_rect)
-        pygame.draw.rect(self.screen, border_col, center_rect, 2)
-        for position in range(len(board_spaces)):
-            self.draw_space(position)
-        if self.board_overlay_image:
-            self.screen.blit(self.board_overlay_image, self.board_rect.topleft)
-        if self.hovered_position is not None:
-            pygame.draw.rect(self.screen, GOLD, self.get_space_rect(self.hovered_position), 3)
-        self.draw_player_circles()
-
-        # Draw card deck in board center
-        self.draw_center_card_deck()
+        # Spaces, art, card deck, ownership marks, hover and tokens all come from the cached board layer
+        if self.heatmap_open:
+            # Only the lots whose rent inputs changed are recomputed; marks then repaint just those spaces
+            self.rent_table.update(self)
+        self.dirty_rects.extend(self.board_layer.update(self))
+        self.screen.blit(self.board_layer.surface, self.board_rect.topleft)
 
         txt_col = DM_TEXT if dm else BLACK
 
@@ -1426,8 +495,8 @@ class CanadaMonopoly:
         market_fx_rect = None
 
         # Show active market effects count
-        if active_market_effects:
-            eff_text = self.font.render(f"Market FX active: {len(active_market_effects)}", True, RED)
+        if self.active_market_effects:
+            eff_text = self.font.render(f"Market FX active: {len(self.active_market_effects)}", True, RED)
             market_fx_pos = (info_x, info_y + 95)
             market_fx_rect = eff_text.get_rect(topleft=market_fx_pos)
             self.screen.blit(eff_text, market_fx_pos)
@@ -1455,7 +524,7 @@ class CanadaMonopoly:
 
         if market_fx_rect and market_fx_rect.collidepoint(mouse_pos):
             fx_lines = ["Current Market FX:"]
-            for effect in active_market_effects:
+            for effect in self.active_market_effects:
                 action = effect.get("action", "")
                 amount = effect.get("amount", 0)
                 turns_left = effect.get("turns_left", 0)
@@ -1472,12 +541,13 @@ class CanadaMonopoly:
             tip_h = sum(s.get_height() for s in tip_surfaces) + 12
             tip_x = mouse_pos[0] + 12
             tip_y = mouse_pos[1] + 12
-            if tip_x + tip_w > SCREEN_WIDTH - 10:
-                tip_x = SCREEN_WIDTH - tip_w - 10
-            if tip_y + tip_h > SCREEN_HEIGHT - 10:
-                tip_y = SCREEN_HEIGHT - tip_h - 10
+            if tip_x + tip_w > self.screen_width - 10:
+                tip_x = self.screen_width - tip_w - 10
+            if tip_y + tip_h > self.screen_height - 10:
+                tip_y = self.screen_height - tip_h - 10
 
             tip_rect = pygame.Rect(tip_x, tip_y, tip_w, tip_h)
+            self.overlay_rects.append(tip_rect)
             tip_bg = DM_SURFACE2 if dm else LIGHT_GRAY
             pygame.draw.rect(self.screen, tip_bg, tip_rect, border_radius=8)
             pygame.draw.rect(self.screen, DM_BORDER if dm else BLACK, tip_rect, 2, border_radius=8)
@@ -1487,6 +557,7 @@ class CanadaMonopoly:
                 self.screen.blit(surf, (tip_x + 8, line_y))
                 line_y += surf.get_height()
 
+        self.profiler.start("prob_panel")
         if self.probability_panel_open:
             expected_roll = self.get_expected_roll(self.dice.dice_type)
             roll_variance = self.get_roll_variance(self.dice.dice_type)
@@ -1496,10 +567,16 @@ class CanadaMonopoly:
 
             recent_text = ", ".join(str(x) for x in self.last_rolls[-6:]) if self.last_rolls else "None"
 
+            landing_probs = get_landing_probabilities(self.dice.dice_type)
             top_visits = sorted(self.position_visit_counts.items(), key=lambda item: item[1], reverse=True)
-            hot_spaces = [f"{board_spaces[idx]['name']} ({count})" for idx, count in top_visits if count > 0][:3]
+            hot_spaces = [
+                f"{self.board.spaces[idx]['name']} ({count}, expected {landing_probs[idx] * 100:.1f}%)"
+                for idx, count in top_visits if count > 0
+            ][:3]
             if not hot_spaces:
                 hot_spaces = ["No landed spaces recorded yet"]
+            likely_spaces = sorted(range(BOARD_SIZE), key=lambda idx: landing_probs[idx], reverse=True)[:3]
+            expected_spaces = [f"{self.board.spaces[idx]['name']} ({landing_probs[idx] * 100:.2f}%)" for idx in likely_spaces]
 
             stats_lines = [
                 "Probability Panel",
@@ -1509,13 +586,14 @@ class CanadaMonopoly:
                 f"Expected doubles: {expected_doubles:.1f}%   Observed doubles: {observed_doubles:.1f}%",
                 f"Recent rolls: {recent_text}",
                 "Most visited spaces:",
-            ] + hot_spaces
+            ] + hot_spaces + ["Expected landing frequency (exact):"] + expected_spaces
 
             panel_w = 610
             panel_h = 26 + len(stats_lines) * 19
             panel_x = 36
-            panel_y = SCREEN_HEIGHT - panel_h - 20
+            panel_y = self.screen_height - panel_h - 20
             panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+            self.overlay_rects.append(panel_rect)
             panel_bg = DM_SURFACE2 if dm else LIGHT_GRAY
             pygame.draw.rect(self.screen, panel_bg, panel_rect, border_radius=8)
             pygame.draw.rect(self.screen, DM_BORDER if dm else BLACK, panel_rect, 2, border_radius=8)
@@ -1527,6 +605,8 @@ class CanadaMonopoly:
                 self.screen.blit(surf, (panel_x + 10, line_y))
                 line_y += 19
 
+        self.profiler.stop("prob_panel")
+
         if dice_text_rect.collidepoint(mouse_pos):
             if self.dice.dice_type == DiceType.REGULAR:
                 dice_lines = [
@@ -1576,12 +656,13 @@ class CanadaMonopoly:
             dice_tip_h = sum(s.get_height() for s in dice_tip_surfaces) + 12
             dice_tip_x = mouse_pos[0] + 12
             dice_tip_y = mouse_pos[1] + 12
-            if dice_tip_x + dice_tip_w > SCREEN_WIDTH - 10:
-                dice_tip_x = SCREEN_WIDTH - dice_tip_w - 10
-            if dice_tip_y + dice_tip_h > SCREEN_HEIGHT - 10:
-                dice_tip_y = SCREEN_HEIGHT - dice_tip_h - 10
+            if dice_tip_x + dice_tip_w > self.screen_width - 10:
+                dice_tip_x = self.screen_width - dice_tip_w - 10
+            if dice_tip_y + dice_tip_h > self.screen_height - 10:
+                dice_tip_y = self.screen_height - dice_tip_h - 10
 
             dice_tip_rect = pygame.Rect(dice_tip_x, dice_tip_y, dice_tip_w, dice_tip_h)
+            self.overlay_rects.append(dice_tip_rect)
             dice_tip_bg = DM_SURFACE2 if dm else LIGHT_GRAY
             pygame.draw.rect(self.screen, dice_tip_bg, dice_tip_rect, border_radius=8)
             pygame.draw.rect(self.screen, DM_BORDER if dm else BLACK, dice_tip_rect, 2, border_radius=8)
@@ -1629,11 +710,12 @@ class CanadaMonopoly:
             die1, die2 = self.dice.roll_result
             dice_x = roll_pos[0] + roll_surface.get_width() + 14
             dice_y = roll_pos[1] - 4
+            dice_atlas = self.assets.get_dice_atlas(self.dice_face_size)
             for idx, die_value in enumerate((die1, die2)):
-                die_img = self.dice_face_images.get(die_value)
                 draw_x = dice_x + idx * (self.dice_face_size + 8)
-                if die_img:
-                    self.screen.blit(die_img, (draw_x, dice_y))
+                if dice_atlas:
+                    atlas, cells = dice_atlas
+                    self.screen.blit(atlas, (draw_x, dice_y), cells[die_value])
                 else:
                     fallback_rect = pygame.Rect(draw_x, dice_y, self.dice_face_size, self.dice_face_size)
                     pygame.draw.rect(self.screen, CANADA_WHITE, fallback_rect, border_radius=6)
@@ -1668,11 +750,11 @@ class CanadaMonopoly:
             msg_surf = self.font.render(self.message, True, txt_col)
             msg_rect = msg_surf.get_rect(center=(board_cx, notif_y))
             pad_rect = msg_rect.inflate(24, 14)
+            self.overlay_rects.append(pad_rect)
             msg_bg = DM_SURFACE2 if dm else LIGHT_GRAY
             pygame.draw.rect(self.screen, msg_bg,  pad_rect, border_radius=8)
             pygame.draw.rect(self.screen, DM_BORDER if dm else BLACK, pad_rect, 2, border_radius=8)
             self.screen.blit(msg_surf, msg_rect)
-            self.message_timer -= 1
 
         prop_y = info_y + 450
         if self.pending_property:
@@ -1706,11 +788,12 @@ class CanadaMonopoly:
             height = line_height * len(lines) + padding * 2
             tooltip_x = mouse_pos[0] + 14
             tooltip_y = mouse_pos[1] + 14
-            if tooltip_x + width > SCREEN_WIDTH:
+            if tooltip_x + width > self.screen_width:
                 tooltip_x = mouse_pos[0] - width - 14
-            if tooltip_y + height > SCREEN_HEIGHT:
+            if tooltip_y + height > self.screen_height:
                 tooltip_y = mouse_pos[1] - height - 14
             tooltip_rect = pygame.Rect(tooltip_x, tooltip_y, width, height)
+            self.overlay_rects.append(tooltip_rect)
             tip_bg = DM_SURFACE if self.dark_mode else CANADA_WHITE
             tip_bord = DM_BORDER if self.dark_mode else BLACK
             tip_txt = DM_TEXT if self.dark_mode else BLACK
@@ -1720,205 +803,310 @@ class CanadaMonopoly:
                 surf = self.font.render(line, True, tip_txt)
                 self.screen.blit(surf, (tooltip_x + padding, tooltip_y + padding + i * line_height))
 
-        self.draw_hover_tooltip(mouse_pos)
+        # The info panel is only pushed to the display when something it shows has changed
+        panel_signature = (
+            dm, self.probability_panel_open, current_player.name, current_player.color, current_player.money,
+            self.dice.dice_type, len(self.active_market_effects),
+            self.pending_property, self.auction_active, self.hackathon_pending, self.evaporator_pending,
+            self.dice_rolled, self.roll_value, self.dice.roll_result, self.is_double,
+            hovered_prop if can_manage_prop else None,
+            (hovered_prop.get_house_cost(), hovered_prop.get_hotel_cost()) if can_build_now else None,
+            tuple((prop.name, prop.stock_value, prop.houses, prop.hotel) for prop in current_player.properties[:max_entries]),
+            prop_y,
+        )
+        if panel_signature != self.panel_signature:
+            self.panel_signature = panel_signature
+            self.dirty_rects.append(self.get_panel_rect())
+
+        with self.profiler.section("tooltip"):
+            self.draw_hover_tooltip(mouse_pos)
+
+        if models:
+            # Freeze what is under the popups; later frames only composite the modals over it
+            self.modals.freeze(self.screen, self.get_modal_base_key(models), self.overlay_rects)
+        else:
+            self.modals.thaw()
+        self.draw_modals(models)
+
+        if self.settings_open:
+            self.draw_settings_panel()
+    
+    # ── Modal popups (drawn in screen coordinates into a ModalCompositor layer) ──
+    def draw_hackathon_modal(self, surface):
+        """Hackathon Laptop: pick a number 1-12. Returns the popup rect."""
+        dm = self.dark_mode
+        txt_col = DM_TEXT if dm else BLACK
+        popup_w, popup_h = 500, 160
+        popup_x = (self.screen_width - popup_w) // 2
+        popup_y = (self.screen_height - popup_h) // 2
+        popup_bg = DM_SURFACE if dm else CANADA_WHITE
+        pygame.draw.rect(surface, popup_bg, (popup_x, popup_y, popup_w, popup_h))
+        pygame.draw.rect(surface, DM_BORDER if dm else BLACK, (popup_x, popup_y, popup_w, popup_h), 2)
+        surface.blit(self.big_font.render("Hackathon Laptop: Pick a number 1–12", True, txt_col), (popup_x + 15, popup_y + 12))
+        self.hackathon_buttons = []
+        for n in range(1, 13):
+            col = (n - 1) % 6
+            row = (n - 1) // 6
+            btn_rect = pygame.Rect(popup_x + 20 + col * 75, popup_y + 60 + row * 50, 60, 36)
+            pygame.draw.rect(surface, BLUE, btn_rect)
+            lbl = self.font.render(str(n), True, CANADA_WHITE)
+            surface.blit(lbl, lbl.get_rect(center=btn_rect.center))
+            self.hackathon_buttons.append((btn_rect, n))
+        return pygame.Rect(popup_x, popup_y, popup_w, popup_h)
+
+    def draw_evaporator_modal(self, surface):
+        """Evaporator: pick a property to lose a house. Returns the popup rect."""
+        dm = self.dark_mode
+        txt_col = DM_TEXT if dm else BLACK
+        buildable = self.get_evaporator_targets()
+        popup_w, popup_h = 500, min(400, 60 + len(buildable) * 36 + 20)
+        popup_x = (self.screen_width - popup_w) // 2
+        popup_y = (self.screen_height - popup_h) // 2
+        popup_bg = DM_SURFACE if dm else CANADA_WHITE
+        pygame.draw.rect(surface, popup_bg, (popup_x, popup_y, popup_w, popup_h))
+        pygame.draw.rect(surface, DM_BORDER if dm else BLACK, (popup_x, popup_y, popup_w, popup_h), 2)
+        surface.blit(self.big_font.render("Evaporator: Pick property to remove house", True, txt_col), (popup_x + 10, popup_y + 10))
+        self.evaporator_prop_rects = []
+        for idx, prop in enumerate(buildable):
+            btn_rect = pygame.Rect(popup_x + 20, popup_y + 50 + idx * 36, popup_w - 40, 30)
+            pygame.draw.rect(surface, prop.color if prop.color != CANADA_WHITE else LIGHT_GRAY, btn_rect)
+            building_str = "Hotel" if prop.hotel else f"{prop.houses} house(s)"
+            lbl = self.font.render(f"{prop.name} [{building_str}] – owner: {prop.owner.name}", True, CANADA_WHITE if prop.color not in [CANADA_WHITE, YELLOW, GOLD] else BLACK)
+            surface.blit(lbl, (btn_rect.x + 6, btn_rect.y + 6))
+            self.evaporator_prop_rects.append((btn_rect, prop))
+        return pygame.Rect(popup_x, popup_y, popup_w, popup_h)
+
+    def draw_trade_modal(self, surface):
+        """Trade popup: partner choice, then offer/request lists and cash sliders. Returns the popup rect."""
+        dm = self.dark_mode
+        txt_col = DM_TEXT if dm else BLACK
+        current_player = self.players[self.current_player_index]
+        popup_width = 720
+        popup_height = 380
+        popup_x = (self.screen_width - popup_width) // 2
+        popup_y = (self.screen_height - popup_height) // 2
+        popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
+        popup_bg = DM_SURFACE if dm else CANADA_WHITE
+        popup_bord = DM_BORDER if dm else BLACK
+        pygame.draw.rect(surface, popup_bg,   popup_rect)
+        pygame.draw.rect(surface, popup_bord, popup_rect, 2)
+        surface.blit(self.big_font.render("Trade", True, txt_col), (popup_x + 20, popup_y + 10))
+        if self.trade_partner_index is None:
+            surface.blit(self.font.render("Choose a player to trade with:", True, txt_col), (popup_x + 20, popup_y + 60))
+            self.trade_partner_rects = []
+            for i, player in enumerate(self.players):
+                if i == self.current_player_index:
+                    continue
+                btn_rect = pygame.Rect(popup_x + 20, popup_y + 90 + len(self.trade_partner_rects) * 40, 240, 32)
+                pygame.draw.rect(surface, player.color, btn_rect)
+                surface.blit(self.font.render(player.name, True, CANADA_WHITE), (btn_rect.x + 10, btn_rect.y + 6))
+                self.trade_partner_rects.append((btn_rect, i))
+        else:
+            partner = self.players[self.trade_partner_index]
+            left_x = popup_x + 20
+            right_x = popup_x + 380
+            list_top = popup_y + 70
+            surface.blit(self.font.render(f"You: {current_player.name}", True, txt_col), (left_x, list_top))
+            surface.blit(self.font.render(f"Partner: {partner.name}", True, txt_col), (right_x, list_top))
+            self.trade_offer_prop_rects = []
+            self.trade_request_prop_rects = []
+            sel_col  = DM_SURFACE2 if dm else LIGHT_GRAY
+            unsel_col = DM_SURFACE if dm else CANADA_WHITE
+            for idx, prop in enumerate(current_player.properties):
+                row_y = list_top + 30 + idx * 24
+                row_rect = pygame.Rect(left_x, row_y, 320, 20)
+                selected = prop in self.trade_offer_props
+                pygame.draw.rect(surface, sel_col if selected else unsel_col, row_rect)
+                surface.blit(self.font.render(prop.name, True, prop.color), (row_rect.x + 4, row_rect.y + 2))
+                self.trade_offer_prop_rects.append((row_rect, prop))
+            for idx, prop in enumerate(partner.properties):
+                row_y = list_top + 30 + idx * 24
+                row_rect = pygame.Rect(right_x, row_y, 320, 20)
+                selected = prop in self.trade_request_props
+                pygame.draw.rect(surface, sel_col if selected else unsel_col, row_rect)
+                surface.blit(self.font.render(prop.name, True, prop.color), (row_rect.x + 4, row_rect.y + 2))
+                self.trade_request_prop_rects.append((row_rect, prop))
+            slider_y = popup_y + popup_height - 90
+            slider_width = 260
+            slider_height = 6
+            offer_slider = pygame.Rect(left_x, slider_y, slider_width, slider_height)
+            request_slider = pygame.Rect(right_x, slider_y, slider_width, slider_height)
+            pygame.draw.rect(surface, GRAY, offer_slider)
+            pygame.draw.rect(surface, GRAY, request_slider)
+            offer_max = max(0, current_player.money)
+            request_max = max(0, partner.money)
+            offer_ratio = 0 if offer_max == 0 else self.trade_offer_cash / offer_max
+            request_ratio = 0 if request_max == 0 else self.trade_request_cash / request_max
+            offer_knob_x = offer_slider.x + int(offer_ratio * slider_width)
+            request_knob_x = request_slider.x + int(request_ratio * slider_width)
+            offer_knob = pygame.Rect(offer_knob_x - 6, slider_y - 6, 12, 18)
+            request_knob = pygame.Rect(request_knob_x - 6, slider_y - 6, 12, 18)
+            pygame.draw.rect(surface, BLUE, offer_knob)
+            pygame.draw.rect(surface, BLUE, request_knob)
+            surface.blit(self.font.render(f"You give: ${self.trade_offer_cash}", True, txt_col), (left_x, slider_y - 24))
+            surface.blit(self.font.render(f"You get: ${self.trade_request_cash}", True, txt_col), (right_x, slider_y - 24))
+            self.trade_offer_slider = offer_slider
+            self.trade_request_slider = request_slider
+            self.trade_offer_knob = offer_knob
+            self.trade_request_knob = request_knob
+            if self.trade_stage == "select":
+                self.trade_propose_button = pygame.Rect(popup_x + popup_width - 160, popup_y + popup_height - 50, 140, 32)
+                pygame.draw.rect(surface, GREEN, self.trade_propose_button)
+                surface.blit(self.font.render("Propose", True, CANADA_WHITE), (self.trade_propose_button.x + 28, self.trade_propose_button.y + 6))
+            else:
+                self.trade_accept_button = pygame.Rect(popup_x + popup_width - 300, popup_y + popup_height - 50, 120, 32)
+                self.trade_decline_button = pygame.Rect(popup_x + popup_width - 160, popup_y + popup_height - 50, 120, 32)
+                pygame.draw.rect(surface, GREEN, self.trade_accept_button)
+                pygame.draw.rect(surface, RED, self.trade_decline_button)
+                surface.blit(self.font.render("Accept", True, CANADA_WHITE), (self.trade_accept_button.x + 22, self.trade_accept_button.y + 6))
+                surface.blit(self.font.render("Decline", True, CANADA_WHITE), (self.trade_decline_button.x + 18, self.trade_decline_button.y + 6))
+        return popup_rect
+
+    def get_auction_timer_style(self):
+        """(seconds left, fraction of the bidder's time left, bar color) for the countdown widget."""
+        secs_left = max(0, math.ceil(self.auction_timer / FPS))
+        ratio = self.auction_timer / max(1, self.auction_turn_seconds * FPS)
+        if ratio > 0.5:
+            bar_color = GREEN
+        elif ratio > 0.2:
+            bar_color = ORANGE
+        else:
+            bar_color = RED
+        return secs_left, ratio, bar_color
+
+    def get_auction_timer_rect(self):
+        tw, th = 160, 52
+        return pygame.Rect(self.screen_width - tw - 10, 10, tw, th)
 
-        # ── Hackathon Laptop UI ───────────────────────────────────────────────
+    def get_auction_bar_rect(self):
+        timer_rect = self.get_auction_timer_rect()
+        return pygame.Rect(timer_rect.x + 8, timer_rect.y + 28, timer_rect.width - 16, 12)
+
+    def draw_auction_timer(self, surface):
+        """Auction countdown widget, top-right corner, without the filled part of the bar."""
+        dm = self.dark_mode
+        txt_col = DM_TEXT if dm else BLACK
+        secs_left, _, bar_color = self.get_auction_timer_style()
+        tx, ty, tw, th = self.get_auction_timer_rect()
+        timer_bg = DM_SURFACE if dm else (240, 240, 240)
+        timer_bord = DM_BORDER if dm else (80, 80, 80)
+        pygame.draw.rect(surface, timer_bg,   (tx, ty, tw, th), border_radius=8)
+        pygame.draw.rect(surface, bar_color,  (tx, ty, tw, th), 2, border_radius=8)
+
+        label = self.font.render("Time to bid:", True, txt_col)
+        surface.blit(label, (tx + 8, ty + 6))
+
+        # Arc-style countdown bar; the filled part moves every frame and is drawn over the cached widget
+        pygame.draw.rect(surface, timer_bord, self.get_auction_bar_rect(), border_radius=5)
+        num = self.font.render(f"{secs_left}s", True, bar_color)
+        surface.blit(num, (tx + tw - num.get_width() - 6, ty + 6))
+        return pygame.Rect(tx, ty, tw, th)
+
+    def draw_auction_bar_fill(self):
+        _, ratio, bar_color = self.get_auction_timer_style()
+        bar_rect = self.get_auction_bar_rect()
+        filled_w = max(0, int(bar_rect.width * ratio))
+        if filled_w > 0:
+            pygame.draw.rect(self.screen, bar_color, (bar_rect.x, bar_rect.y, filled_w, bar_rect.height), border_radius=5)
+
+    def draw_auction_modal(self, surface):
+        """Auction popup: property, current bid, bidder and raise/leave buttons. Returns the popup rect."""
+        dm = self.dark_mode
+        txt_col = DM_TEXT if dm else BLACK
+        popup_width = 420
+        popup_height = 200
+        popup_x = (self.screen_width - popup_width) // 2
+        popup_y = (self.screen_height - popup_height) // 2
+        popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
+        popup_bg = DM_SURFACE if dm else CANADA_WHITE
+        popup_bord = DM_BORDER if dm else BLACK
+        pygame.draw.rect(surface, popup_bg,   popup_rect)
+        pygame.draw.rect(surface, popup_bord, popup_rect, 2)
+        current_bidder = self.get_current_auction_player()
+        surface.blit(self.big_font.render("Auction", True, txt_col), (popup_x + 20, popup_y + 10))
+        surface.blit(self.font.render(self.auction_property.name, True, txt_col), (popup_x + 20, popup_y + 50))
+        surface.blit(self.font.render(f"Current bid: ${self.auction_current_bid}", True, txt_col), (popup_x + 20, popup_y + 75))
+        if current_bidder:
+            surface.blit(self.font.render(f"{current_bidder.name}'s turn (cash ${current_bidder.money})", True, txt_col), (popup_x + 20, popup_y + 100))
+
+        self.raise_5_button   = pygame.Rect(popup_x + 20,  popup_y + 130, 90,  36)
+        self.raise_20_button  = pygame.Rect(popup_x + 120, popup_y + 130, 90,  36)
+        self.raise_100_button = pygame.Rect(popup_x + 220, popup_y + 130, 110, 36)
+        self.leave_auction_button = pygame.Rect(popup_x + 340, popup_y + 130, 60, 36)
+        pygame.draw.rect(surface, GREEN, self.raise_5_button)
+        pygame.draw.rect(surface, GREEN, self.raise_20_button)
+        pygame.draw.rect(surface, GREEN, self.raise_100_button)
+        pygame.draw.rect(surface, GRAY,  self.leave_auction_button)
+        surface.blit(self.font.render("+5",    True, CANADA_WHITE), (self.raise_5_button.x + 28,   self.raise_5_button.y + 8))
+        surface.blit(self.font.render("+20",   True, CANADA_WHITE), (self.raise_20_button.x + 22,  self.raise_20_button.y + 8))
+        surface.blit(self.font.render("+100",  True, CANADA_WHITE), (self.raise_100_button.x + 20, self.raise_100_button.y + 8))
+        surface.blit(self.font.render("Leave", True, CANADA_WHITE), (self.leave_auction_button.x + 6, self.leave_auction_button.y + 8))
+        return popup_rect
+
+    def get_modal_models(self):
+        """{modal name: model} for the open modals; a modal is re-rendered only when its model changes."""
+        size = self.screen.get_size()
+        dm = self.dark_mode
+        models = {}
         if self.hackathon_pending:
-            popup_w, popup_h = 500, 160
-            popup_x = (SCREEN_WIDTH - popup_w) // 2
-            popup_y = (SCREEN_HEIGHT - popup_h) // 2
-            popup_bg = DM_SURFACE if dm else CANADA_WHITE
-            pygame.draw.rect(self.screen, popup_bg, (popup_x, popup_y, popup_w, popup_h))
-            pygame.draw.rect(self.screen, DM_BORDER if dm else BLACK, (popup_x, popup_y, popup_w, popup_h), 2)
-            self.screen.blit(self.big_font.render("Hackathon Laptop: Pick a number 1–12", True, txt_col), (popup_x + 15, popup_y + 12))
-            self.hackathon_buttons = []
-            for n in range(1, 13):
-                col = (n - 1) % 6
-                row = (n - 1) // 6
-                btn_rect = pygame.Rect(popup_x + 20 + col * 75, popup_y + 60 + row * 50, 60, 36)
-                pygame.draw.rect(self.screen, BLUE, btn_rect)
-                lbl = self.font.render(str(n), True, CANADA_WHITE)
-                self.screen.blit(lbl, lbl.get_rect(center=btn_rect.center))
-                self.hackathon_buttons.append((btn_rect, n))
-
-        # ── Evaporator UI ─────────────────────────────────────────────────────
+            models["hackathon"] = (size, dm)
         if self.evaporator_pending:
-            buildable = [p for p in properties if (p.houses > 0 or p.hotel) and p.owner is not None]
-            popup_w, popup_h = 500, min(400, 60 + len(buildable) * 36 + 20)
-            popup_x = (SCREEN_WIDTH - popup_w) // 2
-            popup_y = (SCREEN_HEIGHT - popup_h) // 2
-            popup_bg = DM_SURFACE if dm else CANADA_WHITE
-            pygame.draw.rect(self.screen, popup_bg, (popup_x, popup_y, popup_w, popup_h))
-            pygame.draw.rect(self.screen, DM_BORDER if dm else BLACK, (popup_x, popup_y, popup_w, popup_h), 2)
-            self.screen.blit(self.big_font.render("Evaporator: Pick property to remove house", True, txt_col), (popup_x + 10, popup_y + 10))
-            self.evaporator_prop_rects = []
-            for idx, prop in enumerate(buildable):
-                btn_rect = pygame.Rect(popup_x + 20, popup_y + 50 + idx * 36, popup_w - 40, 30)
-                pygame.draw.rect(self.screen, prop.color if prop.color != CANADA_WHITE else LIGHT_GRAY, btn_rect)
-                building_str = "Hotel" if prop.hotel else f"{prop.houses} house(s)"
-                lbl = self.font.render(f"{prop.name} [{building_str}] – owner: {prop.owner.name}", True, CANADA_WHITE if prop.color not in [CANADA_WHITE, YELLOW, GOLD] else BLACK)
-                self.screen.blit(lbl, (btn_rect.x + 6, btn_rect.y + 6))
-                self.evaporator_prop_rects.append((btn_rect, prop))
-
+            # Buildings and owners are what the target list is made of; compare the board arrays, not the properties
+            state = self.board.state
+            models["evaporator"] = (size, dm, state.houses.tobytes(), state.hotel.tobytes(), state.owner.tobytes())
         if self.trade_active:
-            popup_width = 720
-            popup_height = 380
-            popup_x = (SCREEN_WIDTH - popup_width) // 2
-            popup_y = (SCREEN_HEIGHT - popup_height) // 2
-            popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-            popup_bg = DM_SURFACE if dm else CANADA_WHITE
-            popup_bord = DM_BORDER if dm else BLACK
-            pygame.draw.rect(self.screen, popup_bg,   popup_rect)
-            pygame.draw.rect(self.screen, popup_bord, popup_rect, 2)
-            self.screen.blit(self.big_font.render("Trade", True, txt_col), (popup_x + 20, popup_y + 10))
-            if self.trade_partner_index is None:
-                self.screen.blit(self.font.render("Choose a player to trade with:", True, txt_col), (popup_x + 20, popup_y + 60))
-                self.trade_partner_rects = []
-                for i, player in enumerate(self.players):
-                    if i == self.current_player_index:
-                        continue
-                    btn_rect = pygame.Rect(popup_x + 20, popup_y + 90 + len(self.trade_partner_rects) * 40, 240, 32)
-                    pygame.draw.rect(self.screen, player.color, btn_rect)
-                    self.screen.blit(self.font.render(player.name, True, CANADA_WHITE), (btn_rect.x + 10, btn_rect.y + 6))
-                    self.trade_partner_rects.append((btn_rect, i))
-            else:
-                partner = self.players[self.trade_partner_index]
-                left_x = popup_x + 20
-                right_x = popup_x + 380
-                list_top = popup_y + 70
-                self.screen.blit(self.font.render(f"You: {current_player.name}", True, txt_col), (left_x, list_top))
-                self.screen.blit(self.font.render(f"Partner: {partner.name}", True, txt_col), (right_x, list_top))
-                self.trade_offer_prop_rects = []
-                self.trade_request_prop_rects = []
-                sel_col  = DM_SURFACE2 if dm else LIGHT_GRAY
-                unsel_col = DM_SURFACE if dm else CANADA_WHITE
-                for idx, prop in enumerate(current_player.properties):
-                    row_y = list_top + 30 + idx * 24
-                    row_rect = pygame.Rect(left_x, row_y, 320, 20)
-                    selected = prop in self.trade_offer_props
-                    pygame.draw.rect(self.screen, sel_col if selected else unsel_col, row_rect)
-                    self.screen.blit(self.font.render(prop.name, True, prop.color), (row_rect.x + 4, row_rect.y + 2))
-                    self.trade_offer_prop_rects.append((row_rect, prop))
-                for idx, prop in enumerate(partner.properties):
-                    row_y = list_top + 30 + idx * 24
-                    row_rect = pygame.Rect(right_x, row_y, 320, 20)
-                    selected = prop in self.trade_request_props
-                    pygame.draw.rect(self.screen, sel_col if selected else unsel_col, row_rect)
-                    self.screen.blit(self.font.render(prop.name, True, prop.color), (row_rect.x + 4, row_rect.y + 2))
-                    self.trade_request_prop_rects.append((row_rect, prop))
-                slider_y = popup_y + popup_height - 90
-                slider_width = 260
-                slider_height = 6
-                offer_slider = pygame.Rect(left_x, slider_y, slider_width, slider_height)
-                request_slider = pygame.Rect(right_x, slider_y, slider_width, slider_height)
-                pygame.draw.rect(self.screen, GRAY, offer_slider)
-                pygame.draw.rect(self.screen, GRAY, request_slider)
-                offer_max = max(0, current_player.money)
-                request_max = max(0, partner.money)
-                offer_ratio = 0 if offer_max == 0 else self.trade_offer_cash / offer_max
-                request_ratio = 0 if request_max == 0 else self.trade_request_cash / request_max
-                offer_knob_x = offer_slider.x + int(offer_ratio * slider_width)
-                request_knob_x = request_slider.x + int(request_ratio * slider_width)
-                offer_knob = pygame.Rect(offer_knob_x - 6, slider_y - 6, 12, 18)
-                request_knob = pygame.Rect(request_knob_x - 6, slider_y - 6, 12, 18)
-                pygame.draw.rect(self.screen, BLUE, offer_knob)
-                pygame.draw.rect(self.screen, BLUE, request_knob)
-                self.screen.blit(self.font.render(f"You give: ${self.trade_offer_cash}", True, txt_col), (left_x, slider_y - 24))
-                self.screen.blit(self.font.render(f"You get: ${self.trade_request_cash}", True, txt_col), (right_x, slider_y - 24))
-                self.trade_offer_slider = offer_slider
-                self.trade_request_slider = request_slider
-                self.trade_offer_knob = offer_knob
-                self.trade_request_knob = request_knob
-                if self.trade_stage == "select":
-                    self.trade_propose_button = pygame.Rect(popup_x + popup_width - 160, popup_y + popup_height - 50, 140, 32)
-                    pygame.draw.rect(self.screen, GREEN, self.trade_propose_button)
-                    self.screen.blit(self.font.render("Propose", True, CANADA_WHITE), (self.trade_propose_button.x + 28, self.trade_propose_button.y + 6))
-                else:
-                    self.trade_accept_button = pygame.Rect(popup_x + popup_width - 300, popup_y + popup_height - 50, 120, 32)
-                    self.trade_decline_button = pygame.Rect(popup_x + popup_width - 160, popup_y + popup_height - 50, 120, 32)
-                    pygame.draw.rect(self.screen, GREEN, self.trade_accept_button)
-                    pygame.draw.rect(self.screen, RED, self.trade_decline_button)
-                    self.screen.blit(self.font.render("Accept", True, CANADA_WHITE), (self.trade_accept_button.x + 22, self.trade_accept_button.y + 6))
-                    self.screen.blit(self.font.render("Decline", True, CANADA_WHITE), (self.trade_decline_button.x + 18, self.trade_decline_button.y + 6))
-
-        # ── Auction timer — top-right corner widget ──────────────────────────
+            current_player = self.players[self.current_player_index]
+            partner = self.players[self.trade_partner_index] if self.trade_partner_index is not None else None
+            models["trade"] = (
+                size, dm, self.current_player_index, self.trade_partner_index, self.trade_stage,
+                tuple(prop.position for prop in self.trade_offer_props),
+                tuple(prop.position for prop in self.trade_request_props),
+                self.trade_offer_cash, self.trade_request_cash, current_player.money,
+                partner.money if partner else None, self.board.state.owner.tobytes(),
+            )
         if self.auction_active:
-            secs_left = max(0, math.ceil(self.auction_timer / FPS))
-            total_secs = self.auction_turn_seconds
-            ratio = self.auction_timer / max(1, total_secs * FPS)
-            if ratio > 0.5:
-                bar_color = GREEN
-            elif ratio > 0.2:
-                bar_color = ORANGE
+            secs_left, _, bar_color = self.get_auction_timer_style()
+            models["auction_timer"] = (size, dm, secs_left, bar_color)
+            bidder = self.get_current_auction_player()
+            models["auction"] = (
+                size, dm, self.auction_property.position, self.auction_current_bid,
+                bidder.name if bidder else None, bidder.money if bidder else None,
+            )
+        return models
+
+    def draw_modals(self, models):
+        modal_draws = {
+            "hackathon": self.draw_hackathon_modal,
+            "evaporator": self.draw_evaporator_modal,
+            "trade": self.draw_trade_modal,
+            "auction_timer": self.draw_auction_timer,
+            "auction": self.draw_auction_modal,
+        }
+        for name, draw in modal_draws.items():
+            if name in models:
+                self.overlay_rects.append(self.modals.draw(self.screen, name, models[name], draw))
+                if name == "auction_timer":
+                    self.draw_auction_bar_fill()
             else:
-                bar_color = RED
-
-            tw, th = 160, 52
-            tx = SCREEN_WIDTH - tw - 10
-            ty = 10
-            timer_bg = DM_SURFACE if dm else (240, 240, 240)
-            timer_bord = DM_BORDER if dm else (80, 80, 80)
-            pygame.draw.rect(self.screen, timer_bg,   (tx, ty, tw, th), border_radius=8)
-            pygame.draw.rect(self.screen, bar_color,  (tx, ty, tw, th), 2, border_radius=8)
-
-            label = self.font.render("Time to bid:", True, txt_col)
-            self.screen.blit(label, (tx + 8, ty + 6))
-
-            # Arc-style countdown bar
-            bar_x, bar_y = tx + 8, ty + 28
-            bar_w, bar_h = tw - 16, 12
-            pygame.draw.rect(self.screen, timer_bord, (bar_x, bar_y, bar_w, bar_h), border_radius=5)
-            filled_w = max(0, int(bar_w * ratio))
-            if filled_w > 0:
-                pygame.draw.rect(self.screen, bar_color, (bar_x, bar_y, filled_w, bar_h), border_radius=5)
-            num = self.font.render(f"{secs_left}s", True, bar_color)
-            self.screen.blit(num, (tx + tw - num.get_width() - 6, ty + 6))
-
-        if self.auction_active:
-            popup_width = 420
-            popup_height = 200
-            popup_x = (SCREEN_WIDTH - popup_width) // 2
-            popup_y = (SCREEN_HEIGHT - popup_height) // 2
-            popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-            popup_bg = DM_SURFACE if dm else CANADA_WHITE
-            popup_bord = DM_BORDER if dm else BLACK
-            pygame.draw.rect(self.screen, popup_bg,   popup_rect)
-            pygame.draw.rect(self.screen, popup_bord, popup_rect, 2)
-            current_bidder = self.get_current_auction_player()
-            self.screen.blit(self.big_font.render("Auction", True, txt_col), (popup_x + 20, popup_y + 10))
-            self.screen.blit(self.font.render(self.auction_property.name, True, txt_col), (popup_x + 20, popup_y + 50))
-            self.screen.blit(self.font.render(f"Current bid: ${self.auction_current_bid}", True, txt_col), (popup_x + 20, popup_y + 75))
-            if current_bidder:
-                self.screen.blit(self.font.render(f"{current_bidder.name}'s turn (cash ${current_bidder.money})", True, txt_col), (popup_x + 20, popup_y + 100))
-
-            # Tick the timer and end auction on expiry
-            if self.auction_active:
-                self.auction_timer -= 1
-                if self.auction_timer <= 0:
-                    self.finish_auction()
-
-            self.raise_5_button   = pygame.Rect(popup_x + 20,  popup_y + 130, 90,  36)
-            self.raise_20_button  = pygame.Rect(popup_x + 120, popup_y + 130, 90,  36)
-            self.raise_100_button = pygame.Rect(popup_x + 220, popup_y + 130, 110, 36)
-            self.leave_auction_button = pygame.Rect(popup_x + 340, popup_y + 130, 60, 36)
-            pygame.draw.rect(self.screen, GREEN, self.raise_5_button)
-            pygame.draw.rect(self.screen, GREEN, self.raise_20_button)
-            pygame.draw.rect(self.screen, GREEN, self.raise_100_button)
-            pygame.draw.rect(self.screen, GRAY,  self.leave_auction_button)
-            self.screen.blit(self.font.render("+5",    True, CANADA_WHITE), (self.raise_5_button.x + 28,   self.raise_5_button.y + 8))
-            self.screen.blit(self.font.render("+20",   True, CANADA_WHITE), (self.raise_20_button.x + 22,  self.raise_20_button.y + 8))
-            self.screen.blit(self.font.render("+100",  True, CANADA_WHITE), (self.raise_100_button.x + 20, self.raise_100_button.y + 8))
-            self.screen.blit(self.font.render("Leave", True, CANADA_WHITE), (self.leave_auction_button.x + 6, self.leave_auction_button.y + 8))
+                self.modals.close(name)
+
+    def get_modal_base_key(self, models):
+        """Everything the board and info panel under an open modal depend on; the frozen copy is kept while it matches."""
+        shown_message = self.message if self.message_timer > 0 else None
+        return (
+            self.screen.get_size(), self.dark_mode, self.assets.generation, id(self.board), self.game_over,
+            tuple(models), shown_message, self.current_player_index, tuple(p.money for p in self.players),
+            self.board.state.owner.tobytes(), self.board.state.houses.tobytes(), self.board.state.hotel.tobytes(),
+            self.dice.dice_type, self.dice_rolled, self.roll_value, self.probability_panel_open,
+            len(self.active_market_effects),
+        )
 
-        if self.settings_open:
-            self.draw_settings_panel()
-    
-    def draw_center_card_deck(self):
-        """Draw an animated card deck with CHANCE label in the board center."""
+    def draw_center_card_deck(self, surface):
+        """Draw the card deck with CHANCE label in the board center (board-local coordinates)."""
         dm = self.dark_mode
         _, _, _, _, corner, _ = self.get_board_metrics()
-        cx = int(self.board_rect.left + corner + (self.board_rect.width  - 2*corner) / 2)
-        cy = int(self.board_rect.top  + corner + (self.board_rect.height - 2*corner) / 2)
+        cx = int(corner + (self.board_rect.width  - 2*corner) / 2)
+        cy = int(corner + (self.board_rect.height - 2*corner) / 2)
 
         card_w, card_h = 90, 126
         stack_offsets = [(4,4), (2,2), (0,0)]
@@ -1926,48 +1114,39 @@ class CanadaMonopoly:
         for ox, oy in stack_offsets:
             cr = pygame.Rect(cx - card_w//2 + ox, cy - card_h//2 + oy, card_w, card_h)
             back_col = (20, 60, 140) if not dm else (30, 80, 180)
-            pygame.draw.rect(self.screen, back_col, cr, border_radius=8)
+            pygame.draw.rect(surface, back_col, cr, border_radius=8)
             # Subtle matching border — no gold
-            pygame.draw.rect(self.screen, (40, 80, 160) if not dm else (50, 100, 200), cr, 2, border_radius=8)
+            pygame.draw.rect(surface, (40, 80, 160) if not dm else (50, 100, 200), cr, 2, border_radius=8)
 
         # Top card face
         face_r = pygame.Rect(cx - card_w//2, cy - card_h//2, card_w, card_h)
         face_col = (245, 245, 255) if not dm else (45, 45, 70)
-        pygame.draw.rect(self.screen, face_col, face_r, border_radius=8)
+        pygame.draw.rect(surface, face_col, face_r, border_radius=8)
         # Blue outline in dark mode, plain dark outline in light mode
         face_outline = (80, 160, 255) if dm else (60, 60, 120)
-        pygame.draw.rect(self.screen, face_outline, face_r, 2, border_radius=8)
+        pygame.draw.rect(surface, face_outline, face_r, 2, border_radius=8)
 
         # Inner decorative border — no gold
         inner = face_r.inflate(-10, -10)
         inner_border = (50, 130, 220) if dm else (80, 80, 160)
-        pygame.draw.rect(self.screen, inner_border, inner, 1, border_radius=5)
+        pygame.draw.rect(surface, inner_border, inner, 1, border_radius=5)
 
         # "?" symbol
-        futura_path = os.path.join("assets", "Futura.ttf")
-        try:
-            q_font = pygame.font.Font(futura_path, 52)
-        except Exception:
-            q_font = pygame.font.Font(None, 52)
+        q_font = self.fonts.get(52)
         q_col = (220, 60, 60) if not dm else (255, 100, 100)
         q_surf = q_font.render("?", True, q_col)
-        self.screen.blit(q_surf, q_surf.get_rect(center=(cx, cy - 18)))
+        surface.blit(q_surf, q_surf.get_rect(center=(cx, cy - 18)))
 
         # "CHANCE" label
-        futura_path = os.path.join("assets", "Futura.ttf")
-        try:
-            label_font = pygame.font.Font(futura_path, 20)
-        except Exception:
-            label_font = pygame.font.Font(None, 20)
         text_col = (40, 40, 100) if not dm else (180, 200, 255)
-        lbl = label_font.render("CHANCE", True, text_col)
-        self.screen.blit(lbl, lbl.get_rect(center=(cx, cy + 28)))
+        lbl = self.font.render("CHANCE", True, text_col)
+        surface.blit(lbl, lbl.get_rect(center=(cx, cy + 28)))
 
     def draw_settings_panel(self):
         """Draw the floating settings panel."""
         dm = self.dark_mode
         panel_w, panel_h = 260, 132
-        panel_x = SCREEN_WIDTH - panel_w - 10
+        panel_x = self.screen_width - panel_w - 10
         panel_y = 48
 
         bg   = DM_SURFACE  if dm else CANADA_WHITE
@@ -1975,6 +1154,7 @@ class CanadaMonopoly:
         txt  = DM_TEXT     if dm else BLACK
 
         panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+        self.overlay_rects.append(panel_rect)
         pygame.draw.rect(self.screen, bg,   panel_rect, border_radius=8)
         pygame.draw.rect(self.screen, bord, panel_rect, 2, border_radius=8)
 
@@ -1995,78 +1175,357 @@ class CanadaMonopoly:
         self.screen.blit(hint_lbl, (panel_x + 12, panel_y + 88))
 
     def draw_game_over(self):
-        overlay = pygame.Surface((WIDTH, HEIGHT))
+        overlay = pygame.Surface((self.screen_width, self.screen_height))
+        self.overlay_rects.append(overlay.get_rect())
         overlay.set_alpha(200)
         overlay.fill((0, 0, 0))
         self.screen.blit(overlay, (0, 0))
         box_width, box_height = 400, 200
-        box_x = (WIDTH - box_width) // 2
-        box_y = (HEIGHT - box_height) // 2
+        box_x = (self.screen_width - box_width) // 2
+        box_y = (self.screen_height - box_height) // 2
         pygame.draw.rect(self.screen, CANADA_WHITE, (box_x, box_y, box_width, box_height))
         pygame.draw.rect(self.screen, CANADA_RED, (box_x, box_y, box_width, box_height), 3)
         winner_text = self.big_font.render(f"{self.winner.name} Wins!", True, CANADA_RED)
-        self.screen.blit(winner_text, winner_text.get_rect(center=(WIDTH // 2, box_y + 60)))
+        self.screen.blit(winner_text, winner_text.get_rect(center=(self.screen_width // 2, box_y + 60)))
         restart_button = pygame.Rect(box_x + 100, box_y + 120, 200, 50)
         pygame.draw.rect(self.screen, CANADA_RED, restart_button)
         restart_text = self.font.render("Restart Game", True, CANADA_WHITE)
         self.screen.blit(restart_text, restart_text.get_rect(center=restart_button.center))
         return restart_button
     
+    def begin_frame(self):
+        self.dirty_rects = []
+        self.overlay_rects = []
+
+    def end_frame(self):
+        """Screen rects to push this frame: changed regions plus current and just-closed overlays."""
+        screen_rect = self.screen.get_rect()
+        frame_key = (self.dark_mode, self.game_over, id(self.board), screen_rect.size, self.assets.generation)
+        if frame_key != self.frame_key:
+            # Theme switch, game over, a new game, a resize or art arriving: everything changed
+            self.frame_key = frame_key
+            dirty = [screen_rect]
+        else:
+            dirty = [rect.clip(screen_rect) for rect in self.dirty_rects + self.overlay_rects + self.last_overlay_rects]
+        self.last_overlay_rects = self.overlay_rects
+        return [rect for rect in dirty if rect.width and rect.height]
+
+    # ── Diagnostics ──
+    def toggle_profiler_overlay(self):
+        self.profiler_overlay = not self.profiler_overlay
+        if self.profiler_overlay:
+            self.profiler.enable()
+        elif self.profiler.trace is None:
+            self.profiler.disable()
+        self.profiler_surface = None
+
+    def toggle_profiler_trace(self):
+        if self.profiler.trace is None:
+            self.profiler.start_trace(PROFILE_TRACE_PATH)
+            self.set_message(f"Recording frame timings to {PROFILE_TRACE_PATH} (F4 to stop).", 120)
+        else:
+            self.profiler.stop_trace()
+            if not self.profiler_overlay:
+                self.profiler.disable()
+            self.set_message(f"Frame timings saved to {PROFILE_TRACE_PATH}.", 120)
+
+    def get_overlay_font(self):
+        if self.profiler_font is None:
+            self.profiler_font = pygame.font.SysFont("dejavusansmono,couriernew,monospace", 14)
+        return self.profiler_font
+
+    def draw_profiler_overlay(self, now):
+        """Rolling frame-time percentiles and per-frame counts, bottom-right; the numbers refresh a few times a second.
+
+        Returns the overlay's screen rect.
+        """
+        if self.profiler_surface is None or now >= self.profiler_refresh_at:
+            self.profiler_surface = self.render_overlay_lines(self.profiler.report_lines())
+            self.profiler_refresh_at = now + PROFILER_REFRESH_MS
+        rect = self.profiler_surface.get_rect(bottomright=(self.screen_width - 10, self.screen_height - 10))
+        self.overlay_rects.append(rect)
+        self.screen.blit(self.profiler_surface, rect)
+        return rect
+
+    def render_overlay_lines(self, lines):
+        """A dark monospace box holding lines, for the diagnostics and advisor overlays."""
+        font = self.get_overlay_font()
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 16
+        surface = pygame.Surface((width, line_height * len(lines) + 12))
+        surface.fill(DM_BG)
+        pygame.draw.rect(surface, DM_BORDER, surface.get_rect(), 1)
+        for i, line in enumerate(lines):
+            surface.blit(font.render(line, True, DM_TEXT), (8, 6 + i * line_height))
+        return surface
+
+    # ── Rollout advisor ──
+    def toggle_advisor(self):
+        self.advisor_enabled = not self.advisor_enabled
+        if self.advisor_enabled:
+            if self.advisor is None:
+                self.advisor = Advisor()
+            self.set_message("Advisor on: rollouts rate each choice you face (A to turn off).", 120)
+        else:
+            self.advisor.cancel()
+            self.advisor.key = None
+            self.set_message("Advisor off.", 120)
+
+    def get_decision_key(self):
+        """Changes whenever the open decision or the position behind it does."""
+        state = self.board.state
+        return (self.turn_count, self.roll_count, self.current_player_index, self.dice.dice_type,
+                self.pending_property, self.hackathon_pending, self.trade_active,
+                self.auction_active, self.auction_current_bid, self.auction_turn_index,
+                tuple(state.cash.tolist()), int(state.houses.sum()), int(state.hotel.sum()))
+
+    def update_advisor(self):
+        """Restart the advisor when a person faces a new decision, and collect finished rollouts."""
+        if not self.advisor_enabled:
+            return
+        player = None if self.game_over else self.get_prompted_player()
+        key = None if player is None or self.is_bot(player) else self.get_decision_key()
+        if key != self.advisor.key:
+            self.advisor.start(self, key)
+        self.advisor.poll()
+
+    def draw_advisor_panel(self, above=None):
+        """Each choice's expected net-worth change, bottom-right (above the diagnostics overlay if shown)."""
+        advisor = self.advisor
+        if not advisor.stats:
+            return
+        drawn = (advisor.generation, advisor.busy)
+        if self.advisor_surface is None or self.advisor_drawn != drawn:
+            player = self.board.seats[advisor.seat]
+            status = "thinking..." if advisor.busy else "done"
+            lines = [f"Advisor: {player.name}, {advisor.kind} ({status})",
+                     f"{'choice':<26}{'net worth':>10}{'+/-':>7}{'runs':>6}"]
+            for label, mean, stderr, n in advisor.results():
+                error = f"{stderr:>7.0f}" if stderr != float("inf") else f"{'-':>7}"
+                lines.append(f"{label[:25]:<26}{mean:>+10.0f}{error}{n:>6}")
+            for label, _ in advisor.failures():
+                lines.append(f"{label[:25]:<26}{'advisor error':>23}")
+            self.advisor_surface = self.render_overlay_lines(lines)
+            self.advisor_drawn = drawn
+        bottom = (above.top if above is not None else self.screen_height) - 10
+        rect = self.advisor_surface.get_rect(bottomright=(self.screen_width - 10, bottom))
+        self.overlay_rects.append(rect)
+        self.screen.blit(self.advisor_surface, rect)
+
+    def quick_save(self):
+        try:
+            save_game(self, QUICKSAVE_PATH)
+            self.set_message(f"Game saved to {QUICKSAVE_PATH}.", 120)
+        except OSError as e:
+            self.set_message(f"Save failed: {e}", 180)
+
+    def quick_load(self):
+        try:
+            load_game(QUICKSAVE_PATH, self)
+        except (OSError, SaveFormatError) as e:
+            self.set_message(f"Load failed: {e}", 180)
+            return
+        self.hovered_position = None
+        self.trade_dragging = None
+        self.tokens.clear()
+        self.replay = None
+        ActionLog().begin(self)
+        self.set_message("Game loaded.", 120)
+
     def restart_game(self):
-        self.game_over = False
-        self.winner = None
-        self.message = ""
-        self.message_timer = 0
-        self.waiting_for_action = True
-        self.dice_rolled = False
-        self.roll_value = 0
-        self.is_double = False
-        self.pending_property = None
         self.hovered_position = None
-        self.auction_active = False
-        self.auction_property = None
-        self.auction_current_bid = 0
-        self.auction_highest_bidder = None
-        self.auction_turn_index = 0
-        self.auction_active_players = []
-        self.trade_active = False
-        self.trade_stage = "select"
-        self.trade_partner_index = None
-        self.trade_offer_props = set()
-        self.trade_request_props = set()
-        self.trade_offer_cash = 0
-        self.trade_request_cash = 0
-        self.hackathon_pending = False
-        self.hackathon_player = None
-        self.evaporator_pending = False
-        self.evaporator_player = None
-        self.roll_count = 0
-        self.roll_sum_total = 0
-        self.doubles_count = 0
-        self.roll_total_counts = {n: 0 for n in range(2, 13)}
-        self.last_rolls = []
-        self.position_visit_counts = {i: 0 for i in range(len(board_spaces))}
-        active_market_effects.clear()
-        for prop in properties:
-            prop.owner = None
-            prop.houses = 0
-            prop.hotel = False
-            prop.stock_value = prop.price
-        self.players = []
-        self.num_players = ask_player_count()
-        self.setup_game()
-        self.current_player_index = 0
+        self.trade_dragging = None
+        self.tokens.clear()
+        humans = ask_player_count()
+        self.bot_count = ask_bot_count(humans)
+        self.num_players = humans + self.bot_count
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.replay = None
+        ActionLog().begin(self)
+
+    # ── Replays ──
+    def save_replay_file(self):
+        try:
+            save_replay(self.action_log, REPLAY_PATH, self)
+            self.set_message(f"Replay saved to {REPLAY_PATH}.", 120)
+        except OSError as e:
+            self.set_message(f"Replay save failed: {e}", 180)
+
+    def start_replay(self, log):
+        """Play a recorded game back one action every REPLAY_STEP_MS; the board only watches until it ends."""
+        start_replay(log, self)
+        self.policies = {}
+        self.hovered_position = None
+        self.trade_dragging = None
+        self.tokens.clear()
+        # Record the playback too, so the game can carry on from where the recording stops
+        ActionLog().begin(self)
+        self.replay = log
+        self.replay_index = 0
+        self.replay_at = None
+        self.set_message(f"Replaying {len(log)} actions...", 120)
+        if not log.actions:
+            self.finish_replay()
+
+    def update_replay(self, now):
+        """Apply the next recorded action once the tokens have landed and REPLAY_STEP_MS has passed."""
+        if self.replay is None or self.tokens:
+            self.replay_at = None
+            return
+        if self.replay_at is None:
+            self.replay_at = now + REPLAY_STEP_MS
+            return
+        if now < self.replay_at:
+            return
+        self.replay_at = None
+        apply_action(self, self.replay.actions[self.replay_index])
+        self.replay_index += 1
+        if self.replay_index == len(self.replay):
+            self.finish_replay()
+
+    def finish_replay(self):
+        matched = matches_recording(self.replay, self)
+        self.replay = None
+        if matched is None:
+            self.set_message("Replay finished.", 240)
+        elif matched:
+            self.set_message("Replay finished: the final position matches the recording.", 240)
+        else:
+            self.set_message("Replay finished: the final position DIFFERS from the recording!", 600)
+
+    # ── Computer players ──
+    def setup_game(self):
+        super().setup_game()
+        self.policies = {}
+        for player in self.players[len(self.players) - self.bot_count:]:
+            player.name = f"CPU {player.seat + 1}"
+            self.set_policy(player, POLICIES[BOT_POLICY])
+
+    def is_bot(self, player):
+        return player is not None and player.seat in self.policies
+
+    def get_prompted_player(self):
+        """The player the game is waiting on: whoever must answer the open prompt, else the current player."""
+        if self.hackathon_pending:
+            return self.hackathon_player
+        if self.evaporator_pending:
+            return self.evaporator_player
+        if self.trade_active and self.trade_stage == "confirm":
+            return self.players[self.trade_partner_index]
+        if self.auction_active:
+            return self.get_current_auction_player()
+        return self.players[self.current_player_index]
+
+    def update_bots(self, now):
+        """Make the next computer move once BOT_DELAY_MS has passed since it became due."""
+        player = None if self.game_over or self.tokens else self.get_prompted_player()
+        can_roll = self.waiting_for_action and not self.dice_rolled and not self.trade_active
+        if not self.is_bot(player) or not (self.answer_due() or can_roll):
+            self.bot_move_at = None
+            return
+        if self.bot_move_at is None:
+            self.bot_move_at = now + BOT_DELAY_MS
+            return
+        if now < self.bot_move_at:
+            return
+        self.bot_move_at = None
+        if not self.answer_prompt():
+            self.decide_builds(player)
+            if player.in_jail:
+                # Raise the fare if short, as in play_turn; the roll itself is the next move
+                self.pay_jail_fare(player)
+            else:
+                self.roll_dice()
+
+    def answer_due(self):
+        """True if a prompt that answer_prompt() handles is open."""
+        return (self.hackathon_pending or self.evaporator_pending or self.pending_property is not None
+                or self.auction_active or (self.trade_active and self.trade_stage == "confirm"))
     
+    # ── Timers and frame pacing ──
+    def update_timers(self, now):
+        """Advance the message, auction and end-of-turn timers to `now` (ms from get_ticks)."""
+        # Engine durations are in frames at FPS; set_message, restore and reset all write message_timer
+        if self.message_timer != self.message_timer_seen:
+            self.message_deadline = now + self.message_timer * 1000 // FPS
+        self.message_timer = max(0, math.ceil((self.message_deadline - now) * FPS / 1000))
+        self.message_timer_seen = self.message_timer
+
+        if not self.auction_active:
+            self.auction_deadline = None
+        elif self.auction_deadline is None:
+            self.reset_auction_timer()
+        else:
+            self.auction_timer = max(0, math.ceil((self.auction_deadline - now) * FPS / 1000))
+            if self.auction_timer <= 0 and self.replay is None:
+                self.finish_auction()
+
+        if not (self.can_end_turn() and self.message_timer <= 0):
+            self.end_turn_at = None
+        elif self.end_turn_at is None:
+            self.end_turn_at = now + END_TURN_DELAY_MS
+        elif now >= self.end_turn_at and self.replay is None:
+            self.end_turn_at = None
+            self.end_turn()
+
+    def is_animating(self):
+        """True while the screen changes without input: token hops, the auction countdown or the advisor
+        collecting rollouts. A message on show only needs a frame when it expires (see wait_for_next_frame)."""
+        return bool(self.tokens) or self.auction_active or (self.advisor_enabled and self.advisor.busy)
+
+    def wait_for_next_frame(self, now):
+        """Tick at FPS while animating; otherwise sleep until an event arrives or the next deadline."""
+        if self.is_animating():
+            self.clock.tick(FPS)
+            return
+        timeout = IDLE_WAIT_MS
+        message_deadline = self.message_deadline if self.message_timer > 0 else None
+        for deadline in (message_deadline, self.end_turn_at, self.bot_move_at, self.replay_at):
+            if deadline is not None:
+                timeout = min(timeout, max(1, deadline - now))
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            self.pending_events.append(event)
+        self.clock.tick()
+
+    def handle_panel_click(self, mouse_pos):
+        """Stats panel, settings and dark mode toggles, which work whoever's turn it is."""
+        if self.stats_button.collidepoint(mouse_pos):
+            self.probability_panel_open = not self.probability_panel_open
+
+        if self.settings_button.collidepoint(mouse_pos):
+            self.settings_open = not self.settings_open
+
+        if self.settings_open and self.settings_darkmode_btn.collidepoint(mouse_pos):
+            self.dark_mode = not self.dark_mode
+
+    def get_events(self):
+        events = self.pending_events + pygame.event.get()
+        self.pending_events = []
+        return events
+
     def run(self):
         running = True
         while running:
-            if not self.game_over:
+            now = pygame.time.get_ticks()
+            self.profiler.begin_frame()
+            self.profiler.start("rules")
+            self.assets.poll()
+            if not self.game_over and self.replay is None:
                 self.force_bankruptcy_if_needed()
+            self.update_timers(now)
+            self.update_bots(now)
+            self.update_replay(now)
+            self.update_advisor()
             
-            # Update animations
-            self.update_animations()
+            self.update_animations(now)
+            self.profiler.stop("rules")
             
-            for event in pygame.event.get():
+            self.profiler.start("events")
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     running = False
                     
@@ -2075,24 +1534,23 @@ class CanadaMonopoly:
 
                     if self.game_over:
                         box_width, box_height = 400, 200
-                        box_x = (WIDTH - box_width) // 2
-                        box_y = (HEIGHT - box_height) // 2
+                        box_x = (self.screen_width - box_width) // 2
+                        box_y = (self.screen_height - box_height) // 2
                         restart_button = pygame.Rect(box_x + 100, box_y + 120, 200, 50)
                         if restart_button.collidepoint(mouse_pos):
                             self.restart_game()
                         continue
 
+                    # Computer players (and replays) make their own moves; meanwhile only the panel toggles respond
+                    if self.replay is not None or self.is_bot(self.get_prompted_player()):
+                        self.handle_panel_click(mouse_pos)
+                        continue
+
                     # ── Hackathon Laptop pick ──────────────────────────────────
                     if self.hackathon_pending:
                         for btn_rect, n in self.hackathon_buttons:
                             if btn_rect.collidepoint(mouse_pos):
-                                player = self.hackathon_player
-                                player.position = n % len(board_spaces)
-                                self.hackathon_pending = False
-                                self.hackathon_player = None
-                                self.waiting_for_action = True
-                                self.set_message(f"Hackathon Laptop: moved to space {n}!")
-                                self.handle_landing(player, player.position)
+                                self.choose_hackathon_space(n)
                                 break
                         continue
 
@@ -2100,20 +1558,7 @@ class CanadaMonopoly:
                     if self.evaporator_pending:
                         for btn_rect, prop in self.evaporator_prop_rects:
                             if btn_rect.collidepoint(mouse_pos):
-                                if prop.hotel:
-                                    prop.hotel = False
-                                    prop.houses = 0
-                                    global HOTEL_POOL
-                                    HOTEL_POOL += 1
-                                    self.set_message(f"Evaporator destroyed the hotel on {prop.name}!")
-                                elif prop.houses > 0:
-                                    prop.houses -= 1
-                                    global HOUSE_POOL
-                                    HOUSE_POOL += 1
-                                    self.set_message(f"Evaporator removed a house from {prop.name}!")
-                                self.evaporator_pending = False
-                                self.evaporator_player = None
-                                self.waiting_for_action = True
+                                self.evaporate(prop)
                                 break
                         continue
 
@@ -2146,14 +1591,15 @@ class CanadaMonopoly:
                             elif self.trade_request_knob.collidepoint(mouse_pos):
                                 self.trade_dragging = "request"
                             if self.trade_propose_button.collidepoint(mouse_pos):
-                                self.trade_stage = "confirm"
+                                self.propose_trade(self.trade_partner_index, self.trade_offer_props,
+                                                   self.trade_request_props, self.trade_offer_cash,
+                                                   self.trade_request_cash)
                             continue
                         if self.trade_stage == "confirm":
                             if self.trade_accept_button.collidepoint(mouse_pos):
-                                success = self.apply_trade(self.players[self.current_player_index], partner)
-                                self.close_trade("Trade completed." if success else "Trade failed.")
+                                self.answer_trade(True)
                             elif self.trade_decline_button.collidepoint(mouse_pos):
-                                self.close_trade("Trade declined.")
+                                self.answer_trade(False)
                             continue
 
                     if self.auction_active:
@@ -2162,8 +1608,7 @@ class CanadaMonopoly:
                             self.finish_auction()
                             continue
                         if self.leave_auction_button.collidepoint(mouse_pos):
-                            self.auction_active_players = [p for p in self.auction_active_players if p != current_bidder]
-                            self.advance_auction_turn()
+                            self.leave_auction()
                             continue
                         increment = None
                         if self.raise_5_button.collidepoint(mouse_pos):
@@ -2173,37 +1618,18 @@ class CanadaMonopoly:
                         elif self.raise_100_button.collidepoint(mouse_pos):
                             increment = 100
                         if increment is not None:
-                            new_bid = self.auction_current_bid + increment
-                            if new_bid <= current_bidder.money:
-                                self.auction_current_bid = new_bid
-                                self.auction_highest_bidder = current_bidder
-                                self.advance_auction_turn()
-                            else:
-                                self.set_message("You cannot bid more than your cash.")
+                            self.place_bid(increment)
                             continue
 
                     if self.pending_property:
-                        player = self.players[self.current_player_index]
                         if self.buy_button.collidepoint(mouse_pos):
-                            prop = self.pending_property
-                            if player.pay(prop.price):
-                                prop.owner = player
-                                player.properties.append(prop)
-                                self.set_message(f"Bought {prop.name} for ${prop.price}!")
-                            else:
-                                self.set_message("Not enough money. Starting auction.")
-                                self.start_auction(prop)
-                            self.pending_property = None
-                            self.waiting_for_action = True
+                            self.buy_pending_property()
                             continue
                         if self.skip_button.collidepoint(mouse_pos):
-                            self.set_message("Skipped property purchase.")
-                            self.pending_property = None
-                            self.waiting_for_action = True
+                            self.skip_pending_property()
                             continue
                         if self.auction_button.collidepoint(mouse_pos):
-                            self.set_message(f"Starting auction for {self.pending_property.name}.")
-                            self.start_auction(self.pending_property)
+                            self.auction_pending_property()
                             continue
 
                     hovered_prop = self.get_hovered_property()
@@ -2217,126 +1643,55 @@ class CanadaMonopoly:
                             self.try_buy_hotel(player, hovered_prop)
                             continue
                         if self.sell_house_button.collidepoint(mouse_pos):
-                            gain = hovered_prop.sell_house()
-                            if gain and gain > 0:
-                                player.receive(gain)
-                                self.set_message(f"Sold house/hotel on {hovered_prop.name} for ${gain}.")
-                            else:
-                                self.set_message("No houses or hotel to sell.")
+                            self.sell_building(player, hovered_prop)
                             continue
                         if self.sell_property_button.collidepoint(mouse_pos):
-                            if hovered_prop.houses > 0 or hovered_prop.hotel:
-                                self.set_message("Sell houses/hotel first before selling property.")
-                                continue
-                            if hovered_prop.mortgaged:
-                                self.set_message("Cannot sell a mortgaged property. Unmortgage first.")
-                                continue
-                            amt = hovered_prop.sell_property_to_bank()
-                            if amt is not None:
-                                player.receive(amt)
-                                if hovered_prop in player.properties:
-                                    player.properties.remove(hovered_prop)
-                                hovered_prop.owner = None
-                                self.set_message(f"Sold {hovered_prop.name} to bank for ${amt}.")
+                            self.sell_property(player, hovered_prop)
                             continue
                         if self.mortgage_button.collidepoint(mouse_pos):
-                            if hovered_prop.mortgaged:
-                                cost = hovered_prop.get_unmortgage_cost()
-                                if player.pay(cost):
-                                    hovered_prop.unmortgage()
-                                    self.set_message(f"Unmortgaged {hovered_prop.name} for ${cost}.")
-                                else:
-                                    self.set_message("Not enough money to unmortgage.")
-                            else:
-                                val = hovered_prop.mortgage()
-                                if val is None:
-                                    self.set_message("Cannot mortgage while houses or a hotel are present.")
-                                else:
-                                    player.receive(val)
-                                    self.set_message(f"Mortgaged {hovered_prop.name} for ${val}.")
+                            self.toggle_mortgage(player, hovered_prop)
                             continue
                     
                     if self.roll_button.collidepoint(mouse_pos) and not self.dice_rolled and self.waiting_for_action:
-                        player = self.players[self.current_player_index]
-                        if player.in_jail:
-                            if player.pay(50, None):
-                                player.in_jail = False
-                                player.jail_turns = 0
-                                self.set_message("Paid $50 to fly back from the Arctic!")
-                        else:
-                            self.roll_value, self.is_double = self.dice.roll()
-                            if player.next_roll_max_one:
-                                self.roll_value = min(self.roll_value, 1)
-                                self.is_double = False
-                                player.next_roll_max_one = False
-                            self.dice_rolled = True
-                            if self.is_double:
-                                player.consecutive_doubles += 1
-                                if player.consecutive_doubles >= 3:
-                                    player.position = 10
-                                    player.in_jail = True
-                                    player.consecutive_doubles = 0
-                                    self.record_roll_stats(self.roll_value, self.is_double, player.position)
-                                    self.set_message("Three doubles! Go to the Arctic!")
-                                else:
-                                    old_pos = player.position
-                                    new_pos = player.move(self.roll_value)
-                                    self.record_roll_stats(self.roll_value, self.is_double, new_pos)
-                                    self.player_animations[player] = {
-                                        "start_pos": old_pos,
-                                        "end_pos": new_pos,
-                                        "progress": 0
-                                    }
-                                    self.just_passed_go = new_pos < self.roll_value
-                                    if self.just_passed_go:
-                                        player.receive(200)
-                                        self.set_message("Passed GO! Received $200")
-                                    self.handle_landing(player, new_pos)
-                            else:
-                                player.consecutive_doubles = 0
-                                old_pos = player.position
-                                new_pos = player.move(self.roll_value)
-                                self.record_roll_stats(self.roll_value, self.is_double, new_pos)
-                                self.player_animations[player] = {
-                                    "start_pos": old_pos,
-                                    "end_pos": new_pos,
-                                    "progress": 0
-                                }
-                                self.just_passed_go = new_pos < self.roll_value
-                                if self.just_passed_go:
-                                    player.receive(200)
-                                    self.set_message("Passed GO! Received $200")
-                                self.handle_landing(player, new_pos)
+                        self.roll_dice()
                     
                     if self.dice_button.collidepoint(mouse_pos) and self.waiting_for_action:
-                        new_dice = self.dice.change_dice_type()
-                        self.set_message(f"Dice changed to: {new_dice.value}", 120)
+                        self.change_dice_type()
 
                     if self.trade_button.collidepoint(mouse_pos) and self.waiting_for_action and not self.dice_rolled:
                         self.open_trade()
 
                     if self.bankrupt_button.collidepoint(mouse_pos) and self.waiting_for_action:
-                        current_player = self.players[self.current_player_index]
-                        self.set_message(f"{current_player.name} declared bankruptcy.")
-                        self.handle_bankruptcy(current_player)
-
-                    # ── Settings button ───────────────────────────────────────
-                    if self.stats_button.collidepoint(mouse_pos):
-                        self.probability_panel_open = not self.probability_panel_open
+                        self.declare_bankruptcy()
 
-                    if self.settings_button.collidepoint(mouse_pos):
-                        self.settings_open = not self.settings_open
-
-                    if self.settings_open and self.settings_darkmode_btn.collidepoint(mouse_pos):
-                        self.dark_mode = not self.dark_mode
+                    self.handle_panel_click(mouse_pos)
 
                 elif event.type == pygame.MOUSEBUTTONUP:
                     if self.trade_dragging:
                         self.trade_dragging = None
 
+                elif event.type == pygame.VIDEORESIZE:
+                    self.resize(event.size)
+
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_p:
                         self.probability_panel_open = not self.probability_panel_open
+                    elif event.key == pygame.K_h:
+                        self.heatmap_open = not self.heatmap_open
+                        if self.heatmap_open:
+                            self.set_message("Heatmap: expected rent an opponent pays per turn on each lot (H to hide).", 150)
+                    elif event.key == pygame.K_F5:
+                        self.quick_save()
+                    elif event.key == pygame.K_F9:
+                        self.quick_load()
+                    elif event.key == pygame.K_F6:
+                        self.save_replay_file()
+                    elif event.key == pygame.K_F3:
+                        self.toggle_profiler_overlay()
+                    elif event.key == pygame.K_F4:
+                        self.toggle_profiler_trace()
+                    elif event.key == pygame.K_a:
+                        self.toggle_advisor()
 
                 elif event.type == pygame.MOUSEMOTION:
                     if self.trade_active and self.trade_dragging:
@@ -2356,28 +1711,37 @@ class CanadaMonopoly:
                             max_cash = max(0, partner.money)
                             self.trade_request_cash = int(round((relative / slider.width) * max_cash)) if max_cash > 0 else 0
             
-            self.screen.fill(DM_BG if self.dark_mode else CANADA_WHITE)
-            self.draw_board()
+            self.profiler.stop("events")
+            self.begin_frame()
+            with self.profiler.section("draw_board"):
+                self.draw_board()
             
             if self.game_over:
                 self.draw_game_over()
+            profiler_rect = self.draw_profiler_overlay(now) if self.profiler_overlay else None
+            if self.advisor_enabled:
+                self.draw_advisor_panel(profiler_rect)
             
-            if self.dice_rolled and self.waiting_for_action and self.message_timer <= 0:
-                pygame.time.wait(1000)
-                self.next_turn()
-                self.dice_rolled = False
-                self.waiting_for_action = True
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            dirty = self.end_frame()
+            with self.profiler.section("flip"):
+                if dirty:
+                    pygame.display.update(dirty)
+            self.profiler.end_frame()
+            self.wait_for_next_frame(now)
         
+        if self.advisor is not None:
+            self.advisor.shutdown()
+        try:
+            save_replay(self.action_log, REPLAY_PATH, self)
+        except OSError:
+            pass
         pygame.quit()
 
 
 def ask_player_count():
     while True:
         try:
-            raw_value = input("How many players? (1-4): ").strip()
+            raw_value = input("How many human players? (1-4): ").strip()
             num_players = int(raw_value)
             if 1 <= num_players <= 4:
                 return num_players
@@ -2388,6 +1752,32 @@ def ask_player_count():
             print("Please enter a valid whole number.")
 
 
+def ask_bot_count(humans):
+    """Computer opponents to add; a lone human gets at least one."""
+    low, high = (1 if humans == 1 else 0), MAX_PLAYERS - humans
+    if low == high:
+        return low
+    while True:
+        try:
+            raw_value = input(f"How many computer players? ({low}-{high}): ").strip()
+            bots = int(raw_value)
+            if low <= bots <= high:
+                return bots
+            print(f"Please enter a number between {low} and {high}.")
+        except EOFError:
+            return low
+        except ValueError:
+            print("Please enter a valid whole number.")
+
+
 if __name__ == "__main__":
-    game = CanadaMonopoly(ask_player_count())
+    if len(sys.argv) == 3 and sys.argv[1] == "--replay":
+        log = load_replay(sys.argv[2])
+        # Logs of batch_dice games carry their pre-drawn dice, which only a batch_dice engine restores
+        game = CanadaMonopoly(len(log.start.seats), batch_dice=log.start.rng[2] is not None)
+        game.start_replay(log)
+    else:
+        humans = ask_player_count()
+        bots = ask_bot_count(humans)
+        game = CanadaMonopoly(humans + bots, bots)
     game.run()
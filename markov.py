@@ -0,0 +1,147 @@
+"""Exact landing probabilities for each DiceType via a Markov chain.
+
+A token's state between rolls is (position, consecutive doubles, Outlier
+Clamp pending). One roll moves it with the exact two-dice distribution
+from DICE_FACE_WEIGHTS, then resolves the landing:
+
+- three doubles in a row send the token straight to the Arctic (10),
+- Go to US (30) sends it to the Arctic, keeping its doubles streak,
+- the Arctic's $50 fare is paid on the next Roll press before rolling, so a
+  jailed token rolls exactly like one just visiting,
+- Item Chest tiles arm the Outlier Clamp with the deck's rigged_dice share,
+- Chance tiles draw the Hackathon Laptop with its weighted-deck share and
+  jump to a space 1-12 (modelled as a uniform pick).
+
+The stationary distribution of that chain gives the long-run frequency of
+each landing, i.e. what position_visit_counts converges to.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from monopoly_engine import (
+    BOARD_SIZE, CHANCE_CATEGORIES, CHANCE_DICE_BUFF_ACTIONS, DICE_FACE_WEIGHTS,
+    ITEM_CHEST_CARDS, JAIL_POSITION, DiceType, PropertyType, create_board,
+)
+
+MAX_DOUBLES = 3
+HACKATHON_CHOICES = range(1, 13)
+# Chance -> Hackathon -> Chance chains are followed this deep; the leftover mass is ~1e-20.
+HACKATHON_DEPTH = 16
+
+
+def get_roll_outcome_distribution(dice_type):
+    """Return {(total, is_double): probability} for one roll of the dice."""
+    weights = DICE_FACE_WEIGHTS[dice_type]
+    total_outcomes = sum(weights.values()) ** 2
+    outcomes = {}
+    for a, wa in weights.items():
+        for b, wb in weights.items():
+            key = (a + b, a == b)
+            outcomes[key] = outcomes.get(key, 0.0) + (wa * wb) / total_outcomes
+    return outcomes
+
+
+def get_hackathon_probability(dice_type):
+    """Chance of drawing Hackathon Laptop on a Chance tile under this dice type."""
+    if dice_type == DiceType.CHANCE:
+        return CHANCE_DICE_BUFF_ACTIONS.count("hackathon_laptop") / len(CHANCE_DICE_BUFF_ACTIONS)
+    total_weight = sum(category["weight"] for category in CHANCE_CATEGORIES.values())
+    probability = 0.0
+    for category in CHANCE_CATEGORIES.values():
+        cards = category["cards"]
+        hits = sum(1 for card in cards if card["action"] == "hackathon_laptop")
+        probability += (category["weight"] / total_weight) * hits / len(cards)
+    return probability
+
+
+def state_index(position, doubles, clamped):
+    return (position * MAX_DOUBLES + doubles) * 2 + clamped
+
+
+def build_landing_resolver(dice_type):
+    """Map each raw landing square to {(resting position, clamp armed): probability}."""
+    spaces = create_board()
+    clamp_probability = sum(1 for card in ITEM_CHEST_CARDS if card["action"] == "rigged_dice") / len(ITEM_CHEST_CARDS)
+    hackathon_probability = get_hackathon_probability(dice_type)
+
+    def resolve(position, depth):
+        space_type = spaces[position]["type"]
+        if space_type == PropertyType.GO_TO_US:
+            return {(JAIL_POSITION, False): 1.0}
+        if space_type == PropertyType.CHEST:
+            return {(position, True): clamp_probability, (position, False): 1.0 - clamp_probability}
+        if space_type == PropertyType.CHANCE and hackathon_probability > 0 and depth < HACKATHON_DEPTH:
+            outcome = {(position, False): 1.0 - hackathon_probability}
+            share = hackathon_probability / len(HACKATHON_CHOICES)
+            for n in HACKATHON_CHOICES:
+                for key, p in resolve(n % BOARD_SIZE, depth + 1).items():
+                    outcome[key] = outcome.get(key, 0.0) + share * p
+            return outcome
+        return {(position, False): 1.0}
+
+    return [resolve(position, 0) for position in range(BOARD_SIZE)]
+
+
+def build_transition_matrix(dice_type):
+    """Return (transition, landing) matrices over the (position, doubles, clamp) states.
+
+    transition[s, t] is the chance of resting in state t after one roll from s;
+    landing[s, j] is the chance that roll is recorded as a landing on space j.
+    """
+    num_states = BOARD_SIZE * MAX_DOUBLES * 2
+    transition = np.zeros((num_states, num_states))
+    landing = np.zeros((num_states, BOARD_SIZE))
+    outcomes = get_roll_outcome_distribution(dice_type)
+    resolver = build_landing_resolver(dice_type)
+
+    for position in range(BOARD_SIZE):
+        for doubles in range(MAX_DOUBLES):
+            for clamped in (0, 1):
+                s = state_index(position, doubles, clamped)
+                if clamped:
+                    # Outlier Clamp: every total is capped to 1 and never counts as a double.
+                    moves = [(1, False, 1.0)]
+                else:
+                    moves = [(total, is_double, p) for (total, is_double), p in outcomes.items()]
+                for total, is_double, p in moves:
+                    streak = doubles + 1 if is_double else 0
+                    if streak >= MAX_DOUBLES:
+                        transition[s, state_index(JAIL_POSITION, 0, 0)] += p
+                        landing[s, JAIL_POSITION] += p
+                        continue
+                    target = (position + total) % BOARD_SIZE
+                    landing[s, target] += p
+                    for (resting, armed), q in resolver[target].items():
+                        transition[s, state_index(resting, streak, int(armed))] += p * q
+    return transition, landing
+
+
+def solve_stationary(transition):
+    """Stationary distribution pi with pi @ transition == pi and sum(pi) == 1."""
+    num_states = transition.shape[0]
+    system = np.vstack([transition.T - np.eye(num_states), np.ones(num_states)])
+    rhs = np.zeros(num_states + 1)
+    rhs[-1] = 1.0
+    pi, *_ = np.linalg.lstsq(system, rhs, rcond=None)
+    pi = np.clip(pi, 0.0, None)
+    return pi / pi.sum()
+
+
+@lru_cache(maxsize=None)
+def get_landing_probabilities(dice_type):
+    """Long-run share of rolls that land on each of the 40 spaces (read-only array)."""
+    transition, landing = build_transition_matrix(dice_type)
+    probabilities = solve_stationary(transition) @ landing
+    probabilities.setflags(write=False)
+    return probabilities
+
+
+@lru_cache(maxsize=None)
+def get_resting_probabilities(dice_type):
+    """Long-run share of time a token sits on each space between rolls (read-only array)."""
+    transition, _ = build_transition_matrix(dice_type)
+    pi = solve_stationary(transition)
+    probabilities = pi.reshape(BOARD_SIZE, MAX_DOUBLES * 2).sum(axis=1)
+    probabilities.setflags(write=False)
+    return probabilities
@@ -0,0 +1,1993 @@
+"""Display-free rules engine for Canada Monopoly.
+
+Everything in here runs without pygame so complete games can be played
+programmatically (see MonopolyEngine.play_game). main2.CanadaMonopoly
+subclasses MonopolyEngine and only adds input handling and drawing.
+"""
+import random
+from enum import Enum
+from functools import lru_cache, wraps
+
+import numpy as np
+
+# Constants
+BOARD_SIZE = 40
+JAIL_POSITION = 10
+JAIL_FARE = 50                   # paid to fly back from the Arctic
+
+# Colors
+CANADA_RED = (255, 51, 51)
+CANADA_WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (128, 128, 128)
+LIGHT_GRAY = (200, 200, 200)
+GOLD = (255, 215, 0)
+SILVER = (192, 192, 192)
+BROWN = (139, 69, 19)
+SKY_BLUE = (135, 206, 235)
+PINK = (255, 182, 193)
+ORANGE = (255, 165, 0)
+RED = (255, 0, 0)
+YELLOW = (255, 255, 0)
+GREEN = (0, 128, 0)
+BLUE = (0, 0, 255)
+
+PLAYER_COLORS = [CANADA_RED, BLUE, GREEN, GOLD]
+PLAYER_TOKENS = ["▲", "●", "■", "♦"]
+MAX_PLAYERS = len(PLAYER_COLORS)
+STARTING_MONEY = 500
+
+# Dice Types
+class DiceType(Enum):
+    REGULAR = "Regular Dice"
+    STABLE = "Stable Dice (3s & 4s)"
+    CHANCE = "Chance Dice (1,1,1,4,5,6)"
+    BAZINGA = "Bazinga Dice (1,2,3,3,4,4)"
+    HIGH_EXPLOSIVE = "High Explosives!!"
+    pass
+
+# Physical faces of each die variant. Dice.roll, roll_dice_batch and the exact
+# distributions all read from this table so they can never disagree.
+DICE_FACES = {
+    # Standard fair 1..6 dice
+    DiceType.REGULAR: (1, 2, 3, 4, 5, 6),
+    # Mid-variance profile concentrated around 3 and 4
+    DiceType.STABLE: (3, 3, 3, 4, 4, 4),
+    # Buff-leaning chance profile
+    DiceType.CHANCE: (1, 1, 1, 4, 5, 6),
+    # Low-to-mid profile + bankruptcy protection synergy
+    DiceType.BAZINGA: (1, 2, 3, 3, 4, 4),
+    # High-variance profile with extreme 1/6 faces only
+    DiceType.HIGH_EXPLOSIVE: (1, 1, 1, 6, 6, 6),
+}
+
+# Per-face multiplicity model for each custom die variant ({face: copies on the die}).
+DICE_FACE_WEIGHTS = {
+    dice_type: {face: faces.count(face) for face in sorted(set(faces))}
+    for dice_type, faces in DICE_FACES.items()
+}
+DICE_FACE_ARRAYS = {dice_type: np.array(faces, dtype=np.int8) for dice_type, faces in DICE_FACES.items()}
+
+
+def roll_dice_batch(dice_type, n, generator):
+    """Roll the dice n times at once from a numpy Generator.
+
+    Returns int8 arrays (die1, die2, total) and a bool array is_double.
+    """
+    faces = DICE_FACE_ARRAYS[dice_type]
+    die1, die2 = faces[generator.integers(0, len(faces), size=(2, n))]
+    return die1, die2, die1 + die2, die1 == die2
+
+# Typical rent/prices matrix (user-provided) used as baseline rent tiers per board position
+TYPICAL_RENTS = [["no"], [2, 10, 30, 90, 160, 250], ["no"],
+        [4, 20, 60, 180, 320, 450], ["no"], [25, 50, 100, 200],
+        [6, 30, 90, 270, 400, 550], ["no"], [6, 30, 90, 270, 400, 550],
+        [8, 40, 100, 300, 450, 600], ["no"], [10, 50, 150, 450, 625, 750],
+        [4, 10], [10, 50, 150, 450, 625, 750], [12, 60, 180, 500, 700, 900],
+        [25, 50, 100, 200], [14, 70, 200, 550, 750, 950], ["no"],
+        [14, 70, 200, 550, 750, 950], [16, 80, 220, 600, 800, 1000], ["no"],
+        [18, 90, 250, 700, 875, 1050], ["no"], [18, 90, 250, 700, 875, 1050],
+        [20, 100, 300, 750, 925, 1100], [25, 50, 100, 200],
+        [22, 110, 330, 800, 975, 1150], [22, 110, 330, 800, 975, 1150],
+        [4, 10], [24, 120, 360, 850, 1025], ["no"],
+        [26, 130, 390, 900, 1100, 1275], [26, 130, 390, 900, 1100, 1275],
+        ["no"], [28, 150, 450, 1000, 1200, 1400], [25, 50, 100, 200], ["no"],
+        [35, 175, 500, 1100, 1300, 1500], ["no"],
+        [50, 200, 600, 1400, 1700, 2000]]
+
+# House/Hotel pool (bank supply at the start of a game)
+HOUSE_POOL = 32
+HOTEL_POOL = 12
+
+# Building levels index the per-position rent/cost tables: 0-4 houses, then the hotel
+HOTEL_LEVEL = 5
+BUILDING_LEVELS = HOTEL_LEVEL + 1
+# Each house raises build cost and income by 30%; a hotel (which replaces the houses) doubles income
+INCOME_MULTIPLIERS = tuple(1.3 ** n for n in range(HOTEL_LEVEL)) + (2.0,)
+
+# Property Types
+class PropertyType(Enum):
+    PROPERTY = "property"
+    TRAIN_STATION = "train_station"
+    UTILITY = "utility"
+    CHEST = "chest"
+    CHANCE = "chance"
+    JAIL = "jail"
+    GO = "go"
+    GO_TO_US = "go_to_us"
+    FREE_PARKING = "free_parking"
+
+# Owner slot value for properties held by the bank
+NO_OWNER = -1
+# Stock values never fall below MIN_STOCK_VALUE; the cap keeps runaway inflation inside int64
+MIN_STOCK_VALUE = 10
+MAX_STOCK_VALUE = 10 ** 15
+MARKET_NOISE_TURNS = 64          # turns of price noise drawn per market_rng call
+
+
+class BoardState:
+    """Struct-of-arrays game state: one slot per board position and one per player seat.
+
+    Property and Player objects are thin views over these arrays, so copying a game,
+    snapshotting it or updating every stock price at once is a handful of array operations.
+    """
+
+    def __init__(self, num_seats=MAX_PLAYERS):
+        # Per position (only purchasable positions are ever written)
+        self.owner = np.full(BOARD_SIZE, NO_OWNER, dtype=np.int8)
+        self.houses = np.zeros(BOARD_SIZE, dtype=np.int8)
+        self.hotel = np.zeros(BOARD_SIZE, dtype=np.bool_)
+        self.mortgaged = np.zeros(BOARD_SIZE, dtype=np.bool_)
+        self.stock_value = np.zeros(BOARD_SIZE, dtype=np.int64)
+        # Per seat
+        self.cash = np.zeros(num_seats, dtype=np.int64)
+        self.position = np.zeros(num_seats, dtype=np.int8)
+        # Bank's building supply
+        self.house_pool = HOUSE_POOL
+        self.hotel_pool = HOTEL_POOL
+
+    def copy(self):
+        clone = BoardState.__new__(BoardState)
+        for name in ("owner", "houses", "hotel", "mortgaged", "stock_value", "cash", "position"):
+            setattr(clone, name, getattr(self, name).copy())
+        clone.house_pool = self.house_pool
+        clone.hotel_pool = self.hotel_pool
+        return clone
+
+
+# Property Class
+class Property:
+    __slots__ = ("name", "price", "color", "property_type", "base_rent", "position", "board")
+
+    def __init__(self, name, price, color, property_type=PropertyType.PROPERTY, base_rent=0, position=None, board=None):
+        self.name = name
+        self.price = price
+        self.color = color
+        self.property_type = property_type
+        self.base_rent = base_rent
+        self.position = position
+        # Board whose BoardState holds this lot's owner, buildings and stock value
+        self.board = board
+        self.stock_value = price
+
+    # ── State views ──
+    @property
+    def owner(self):
+        seat = self.board.state.owner.item(self.position)
+        return None if seat == NO_OWNER else self.board.seats[seat]
+
+    @owner.setter
+    def owner(self, player):
+        self.board.state.owner[self.position] = NO_OWNER if player is None else player.seat
+
+    @property
+    def houses(self):
+        return self.board.state.houses.item(self.position)
+
+    @houses.setter
+    def houses(self, value):
+        self.board.state.houses[self.position] = value
+
+    @property
+    def hotel(self):
+        return self.board.state.hotel.item(self.position)
+
+    @hotel.setter
+    def hotel(self, value):
+        self.board.state.hotel[self.position] = value
+
+    @property
+    def mortgaged(self):
+        return self.board.state.mortgaged.item(self.position)
+
+    @mortgaged.setter
+    def mortgaged(self, value):
+        self.board.state.mortgaged[self.position] = value
+
+    @property
+    def stock_value(self):
+        return self.board.state.stock_value.item(self.position)
+
+    @stock_value.setter
+    def stock_value(self, value):
+        self.board.state.stock_value[self.position] = value
+
+    def get_base_build_cost(self):
+        return max(50, self.price // 4)
+
+    def get_building_level(self):
+        return HOTEL_LEVEL if self.hotel else self.houses
+
+    def get_house_cost(self):
+        if self.property_type != PropertyType.PROPERTY or self.hotel or self.houses >= 4:
+            return None
+        return self.board.build_costs[self.position][self.houses]
+
+    def get_hotel_cost(self):
+        if self.property_type != PropertyType.PROPERTY or self.hotel or self.houses != 4:
+            return None
+        return self.board.build_costs[self.position][4]
+
+    def get_income_multiplier(self):
+        return INCOME_MULTIPLIERS[self.get_building_level()]
+
+    def get_rent(self, dice_total=0):
+        if self.mortgaged:
+            return 0
+
+        if self.property_type == PropertyType.TRAIN_STATION:
+            stations = self.board.index.count(self.owner, PropertyType.TRAIN_STATION)
+            return 25 * (2 ** (max(1, stations) - 1))
+
+        elif self.property_type == PropertyType.UTILITY:
+            utilities = self.board.index.count(self.owner, PropertyType.UTILITY)
+            multiplier = 10 if utilities == 2 else 4
+            return multiplier * max(1, dice_total)
+
+        else:
+            tier_value = self.board.rent_tiers[self.position][self.get_building_level()]
+            return max(0, int(round(tier_value * (self.stock_value / max(1, self.price)))))
+
+    def build_house(self):
+        board = self.board
+        if self.property_type == PropertyType.PROPERTY and self.houses < 4 and not self.hotel and board.house_pool > 0:
+            self.houses += 1
+            board.house_pool -= 1
+            return True
+        return False
+
+    def build_hotel(self):
+        board = self.board
+        if self.property_type == PropertyType.PROPERTY and self.houses == 4 and not self.hotel and board.hotel_pool > 0:
+            self.hotel = True
+            self.houses = 0
+            board.hotel_pool -= 1
+            board.house_pool += 4
+            return True
+        return False
+
+    def update_stock_value(self, percent_change):
+        self.stock_value = int(self.stock_value * (1 + percent_change / 100))
+        self.stock_value = max(MIN_STOCK_VALUE, self.stock_value)
+
+    def get_mortgage_value(self):
+        return self.price // 2
+
+    def get_unmortgage_cost(self):
+        return int(round(self.get_mortgage_value() * 1.1))
+
+    def mortgage(self):
+        if self.mortgaged:
+            return None
+        if self.houses > 0 or self.hotel:
+            return None
+        self.mortgaged = True
+        return self.get_mortgage_value()
+
+    def unmortgage(self):
+        if not self.mortgaged:
+            return None
+        cost = self.get_unmortgage_cost()
+        self.mortgaged = False
+        return cost
+
+    def sell_house(self):
+        board = self.board
+        if self.houses > 0:
+            gain = board.build_costs[self.position][self.houses - 1] // 2
+            self.houses -= 1
+            board.house_pool += 1
+            return gain
+        if self.hotel:
+            if board.house_pool < 4:
+                return 0
+            gain = board.build_costs[self.position][4] // 2
+            self.hotel = False
+            self.houses = 4
+            board.hotel_pool += 1
+            board.house_pool -= 4
+            return gain
+        return 0
+
+    def sell_property_to_bank(self):
+        if self.houses > 0 or self.hotel:
+            return None
+        sell_amount = self.price // 2
+        if self.mortgaged:
+            return None
+        return sell_amount
+
+
+# Player Class
+class Player:
+    __slots__ = ("name", "color", "token", "board", "seat",
+                 "in_jail", "jail_turns", "consecutive_doubles", "get_out_of_jail_free", "next_roll_max_one",
+                 "bazinga_rescues_left")
+
+    def __init__(self, name, color, token, board):
+        # Core identity/state
+        self.name = name
+        self.color = color
+        self.token = token
+
+        # Economy + ownership state live in the board's BoardState, indexed by seat
+        self.board = board
+        self.seat = board.seat_player(self)
+        self.position = 0
+        self.money = STARTING_MONEY
+
+        # Jail / turn-modifier state
+        self.in_jail = False
+        self.jail_turns = 0
+        self.consecutive_doubles = 0
+        self.get_out_of_jail_free = 0
+        self.next_roll_max_one = False
+
+        # Bazinga safety-net charges: when cash is <= 0 and Bazinga dice is active,
+        # this player can be rescued by +$200 up to 3 times.
+        self.bazinga_rescues_left = 3
+
+    def move(self, spaces):
+        self.position = (self.position + spaces) % BOARD_SIZE
+        return self.position
+
+    def pay(self, amount, recipient=None):
+        if self.money >= amount:
+            self.money -= amount
+            if recipient:
+                recipient.money += amount
+            return True
+        return False
+
+    def receive(self, amount):
+        self.money += amount
+
+    # ── State views ──
+    @property
+    def position(self):
+        return self.board.state.position.item(self.seat)
+
+    @position.setter
+    def position(self, value):
+        self.board.state.position[self.seat] = value
+
+    @property
+    def money(self):
+        return self.board.state.cash.item(self.seat)
+
+    @money.setter
+    def money(self, value):
+        self.board.state.cash[self.seat] = value
+
+    @property
+    def properties(self):
+        """This player's properties in board order (a fresh list; change ownership via Board.transfer)."""
+        spaces = self.board.spaces
+        return [spaces[pos]["property"] for pos in np.flatnonzero(self.board.state.owner == self.seat)]
+
+
+# Random streams
+# Every subsystem draws from its own stream, derived from the one game seed, so a
+# change in how often one subsystem draws (an extra roll, a new card) leaves the
+# others' sequences untouched.
+RNG_STREAMS = ("dice", "cards", "chest", "market")
+
+
+def stream_seed(seed, stream):
+    """64-bit seed of one subsystem's stream in the game seeded with `seed`."""
+    return random.Random(f"{seed}:{stream}").getrandbits(64)
+
+
+# Dice Class
+class Dice:
+    def __init__(self, rng=None, generator=None, batch_size=1024):
+        # Active dice variant controls the probability model used in roll().
+        self.dice_type = DiceType.REGULAR
+        self.roll_result = (0, 0)
+        self.double_count = 0
+        self.rng = rng if rng is not None else random.Random()
+        # With a numpy Generator, rolls are pre-drawn in blocks by roll_dice_batch.
+        self.generator = generator
+        self.batch_size = batch_size
+        self._batch = []
+        self._batch_index = 0
+        self._batch_type = None
+        # (die1, die2) pairs handed out before any random roll; rollouts use it to stratify their first roll
+        self.preset_rolls = []
+
+    def roll(self):
+        if self.preset_rolls:
+            die1, die2 = self.preset_rolls.pop(0)
+        elif self.generator is not None:
+            if self._batch_index >= len(self._batch) or self._batch_type != self.dice_type:
+                die1s, die2s, _, _ = roll_dice_batch(self.dice_type, self.batch_size, self.generator)
+                self._batch = list(zip(die1s.tolist(), die2s.tolist()))
+                self._batch_index = 0
+                self._batch_type = self.dice_type
+            die1, die2 = self._batch[self._batch_index]
+            self._batch_index += 1
+        else:
+            faces = DICE_FACES[self.dice_type]
+            die1 = self.rng.choice(faces)
+            die2 = self.rng.choice(faces)
+
+        self.roll_result = (die1, die2)
+        return die1 + die2, die1 == die2
+
+    def change_dice_type(self):
+        types = list(DiceType)
+        current_index = types.index(self.dice_type)
+        self.dice_type = types[(current_index + 1) % len(types)]
+        return self.dice_type
+
+
+# Game Board Spaces
+def create_board():
+    spaces = [
+        {"name": "GO (MathHacks)", "type": PropertyType.GO, "color": GOLD},
+        {"name": "STC", "type": PropertyType.PROPERTY, "price": 60, "color": BROWN, "base_rent": 4},
+        {"name": "Item Chest", "type": PropertyType.CHEST, "color": LIGHT_GRAY},
+        {"name": "Fairview Mall", "type": PropertyType.PROPERTY, "price": 60, "color": BROWN, "base_rent": 2},
+        {"name": "Income Tax", "type": "tax", "color": GRAY},
+        {"name": "York University", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
+        {"name": "Little Italy", "type": PropertyType.PROPERTY, "price": 100, "color": SKY_BLUE, "base_rent": 6},
+        {"name": "Chance", "type": PropertyType.CHANCE, "color": LIGHT_GRAY},
+        {"name": "Chinatown", "type": PropertyType.PROPERTY, "price": 100, "color": SKY_BLUE, "base_rent": 6},
+        {"name": "Greektown", "type": PropertyType.PROPERTY, "price": 120, "color": SKY_BLUE, "base_rent": 8},
+        {"name": "Jail (Arctic)", "type": PropertyType.JAIL, "color": GRAY},
+        {"name": "Harvey's", "type": PropertyType.PROPERTY, "price": 140, "color": PINK, "base_rent": 10},
+        {"name": "407 ETR", "type": PropertyType.UTILITY, "price": 150, "color": GRAY},
+        {"name": "Frankie Tomatto's", "type": PropertyType.PROPERTY, "price": 140, "color": PINK, "base_rent": 10},
+        {"name": "Distillery District", "type": PropertyType.PROPERTY, "price": 160, "color": PINK, "base_rent": 12},
+        {"name": "University of Toronto", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
+        {"name": "Marineland", "type": PropertyType.PROPERTY, "price": 220, "color": RED, "base_rent": 18},
+        {"name": "Item Chest", "type": PropertyType.CHEST, "color": LIGHT_GRAY},
+        {"name": "Scarborough", "type": PropertyType.PROPERTY, "price": 180, "color": ORANGE, "base_rent": 14},
+        {"name": "Markham", "type": PropertyType.PROPERTY, "price": 200, "color": ORANGE, "base_rent": 16},
+        {"name": "Free Parking", "type": PropertyType.FREE_PARKING, "color": GRAY},
+        {"name": "Canada's Wonderland", "type": PropertyType.PROPERTY, "price": 220, "color": RED, "base_rent": 18},
+        {"name": "Chance", "type": PropertyType.CHANCE, "color": LIGHT_GRAY},
+        {"name": "Vaughan", "type": PropertyType.PROPERTY, "price": 180, "color": ORANGE, "base_rent": 14},
+        {"name": "Calgary Stampede", "type": PropertyType.PROPERTY, "price": 240, "color": RED, "base_rent": 20},
+        {"name": "TMU", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
+        {"name": "Toronto Raptors", "type": PropertyType.PROPERTY, "price": 260, "color": YELLOW, "base_rent": 22},
+        {"name": "Maple Leafs", "type": PropertyType.PROPERTY, "price": 260, "color": YELLOW, "base_rent": 22},
+        {"name": "401", "type": PropertyType.UTILITY, "price": 150, "color": GRAY},
+        {"name": "Blue Jays", "type": PropertyType.PROPERTY, "price": 280, "color": YELLOW, "base_rent": 24},
+        {"name": "Go to US", "type": PropertyType.GO_TO_US, "color": GRAY},
+        {"name": "Ripley's Aquarium", "type": PropertyType.PROPERTY, "price": 300, "color": GREEN, "base_rent": 26},
+        {"name": "Centre Island", "type": PropertyType.PROPERTY, "price": 300, "color": GREEN, "base_rent": 26},
+        {"name": "Item Chest", "type": PropertyType.CHEST, "color": LIGHT_GRAY},
+        {"name": "Ontario Science Centre", "type": PropertyType.PROPERTY, "price": 320, "color": GREEN, "base_rent": 28},
+        {"name": "University of Waterloo", "type": PropertyType.TRAIN_STATION, "price": 200, "color": BLACK},
+        {"name": "Chance", "type": PropertyType.CHANCE, "color": LIGHT_GRAY},
+        {"name": "CN Tower", "type": PropertyType.PROPERTY, "price": 350, "color": BLUE, "base_rent": 35},
+        {"name": "Luxury Tax", "type": "tax", "color": GRAY},
+        {"name": "Rogers Centre", "type": PropertyType.PROPERTY, "price": 400, "color": BLUE, "base_rent": 50}
+    ]
+    return spaces
+
+
+@lru_cache(maxsize=None)
+def get_rent_tiers(position, base_rent):
+    """Unadjusted rent at each building level for the lot at `position`.
+
+    Rows of TYPICAL_RENTS marked "no" (or missing) fall back to base_rent scaled by the
+    income multipliers; short rows repeat their last tier, which is also the hotel rent.
+    """
+    row = TYPICAL_RENTS[position] if 0 <= position < len(TYPICAL_RENTS) else ["no"]
+    if row[0] == "no":
+        return tuple(base_rent * multiplier for multiplier in INCOME_MULTIPLIERS)
+    houses = tuple(row[min(n, len(row) - 1)] for n in range(HOTEL_LEVEL))
+    return houses + (row[-1],)
+
+
+@lru_cache(maxsize=None)
+def get_build_costs(price):
+    """(house 1..4 cost, hotel cost) for a lot of this price."""
+    base_cost = max(50, price // 4)
+    houses = tuple(int(round(base_cost * (1.3 ** n))) for n in range(4))
+    return houses + (int(round(base_cost * (1.3 ** 4) * 2)),)
+
+
+class OwnershipIndex:
+    """Ownership tallies kept up to date by Board.transfer so rent and monopoly checks never scan the board.
+
+    type_counts[(owner, property_type)] counts an owner's stations, utilities and lots;
+    color_counts[(owner, color)] counts how much of a color group they hold.
+    """
+
+    def __init__(self, properties):
+        self.type_counts = {}
+        self.color_counts = {}
+        self.color_sizes = {}
+        for prop in properties:
+            if prop.property_type == PropertyType.PROPERTY:
+                self.color_sizes[prop.color] = self.color_sizes.get(prop.color, 0) + 1
+
+    def add(self, prop, owner):
+        key = (owner, prop.property_type)
+        self.type_counts[key] = self.type_counts.get(key, 0) + 1
+        if prop.property_type == PropertyType.PROPERTY:
+            key = (owner, prop.color)
+            self.color_counts[key] = self.color_counts.get(key, 0) + 1
+
+    def remove(self, prop, owner):
+        self.type_counts[(owner, prop.property_type)] -= 1
+        if prop.property_type == PropertyType.PROPERTY:
+            self.color_counts[(owner, prop.color)] -= 1
+
+    def count(self, owner, property_type):
+        return self.type_counts.get((owner, property_type), 0)
+
+    def owns_color_set(self, owner, color):
+        return owner is not None and self.color_counts.get((owner, color), 0) == self.color_sizes.get(color, -1)
+
+
+class Board:
+    """One game's board: the spaces, their purchasable properties and the bank's building supply."""
+
+    def __init__(self):
+        self.spaces = create_board()
+        self.properties = []
+        self.state = BoardState()
+        # Seat number -> Player; seats are never reused within a game
+        self.seats = []
+        for i, space in enumerate(self.spaces):
+            if space["type"] == PropertyType.PROPERTY:
+                prop = Property(space["name"], space["price"], space["color"],
+                                PropertyType.PROPERTY, space["base_rent"], position=i, board=self)
+                self.properties.append(prop)
+                space["property"] = prop
+            elif space["type"] in [PropertyType.TRAIN_STATION, PropertyType.UTILITY]:
+                prop = Property(space["name"], space["price"], space["color"], space["type"], position=i, board=self)
+                self.properties.append(prop)
+                space["property"] = prop
+
+        # Color group -> its lots in board order, for even-building checks
+        self.color_groups = {}
+        for prop in self.properties:
+            if prop.property_type == PropertyType.PROPERTY:
+                self.color_groups.setdefault(prop.color, []).append(prop)
+        self.index = OwnershipIndex(self.properties)
+        self.property_positions = np.array([prop.position for prop in self.properties], dtype=np.intp)
+
+        # Position -> tuple by building level (None on non-lots); rent is one multiply by stock_value/price
+        self.rent_tiers = [None] * BOARD_SIZE
+        self.build_costs = [None] * BOARD_SIZE
+        for group in self.color_groups.values():
+            for prop in group:
+                self.rent_tiers[prop.position] = get_rent_tiers(prop.position, prop.base_rent)
+                self.build_costs[prop.position] = get_build_costs(prop.price)
+
+    @property
+    def house_pool(self):
+        return self.state.house_pool
+
+    @house_pool.setter
+    def house_pool(self, value):
+        self.state.house_pool = value
+
+    @property
+    def hotel_pool(self):
+        return self.state.hotel_pool
+
+    @hotel_pool.setter
+    def hotel_pool(self, value):
+        self.state.hotel_pool = value
+
+    def update_stock_values(self, percent_changes=(), noise=None):
+        """Reprice every property at once.
+
+        Each percent change is applied in turn with Property.update_stock_value's
+        truncation, then `noise` (one multiplier per property, in self.properties
+        order) is applied with round-half-even; both keep the floor of MIN_STOCK_VALUE.
+        """
+        positions = self.property_positions
+        values = self.state.stock_value[positions]
+        for percent_change in percent_changes:
+            values = np.maximum(MIN_STOCK_VALUE, (values * (1 + percent_change / 100)).astype(np.int64))
+        if noise is not None:
+            values = np.maximum(MIN_STOCK_VALUE, np.rint(values * noise).astype(np.int64))
+        self.state.stock_value[positions] = np.minimum(values, MAX_STOCK_VALUE)
+
+    def seat_player(self, player):
+        """Give a new player the next free seat in the state arrays and return it."""
+        if len(self.seats) >= len(self.state.cash):
+            raise ValueError(f"A board seats at most {len(self.state.cash)} players")
+        self.seats.append(player)
+        return len(self.seats) - 1
+
+    def transfer(self, prop, new_owner):
+        """Move a property to new_owner (None = the bank), keeping the ownership index in step."""
+        old_owner = prop.owner
+        if old_owner is new_owner:
+            return
+        if old_owner is not None:
+            self.index.remove(prop, old_owner)
+        prop.owner = new_owner
+        if new_owner is not None:
+            self.index.add(prop, new_owner)
+
+    def rebuild_index(self):
+        """Recount the ownership index from the owner array (after the state is replaced wholesale)."""
+        self.index = OwnershipIndex(self.properties)
+        for prop in self.properties:
+            owner = prop.owner
+            if owner is not None:
+                self.index.add(prop, owner)
+
+
+# Item Chest Cards
+ITEM_CHEST_CARDS = [
+    {"name": "Outlier Clamp", "description": "Force your next outcome to be at most 1",
+     "action": "rigged_dice"},
+    {"name": "Variance Eraser", "description": "Delete one house placed on someone's property",
+     "action": "evaporator"},
+    {"name": "Bernoulli Trial", "description": "Flip a fair coin: Heads = extra turn, Tails = lose turn",
+     "action": "coin_flip"},
+    {"name": "Compound Growth", "description": "Gain a 10% wealth boost",
+     "action": "coin_bag"}
+]
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CHANCE / FATE CARDS  (weighted draw system)
+# 35%  →  Market-effect cards  (inflation / market_drop)
+# 35%  →  Money-transfer cards  (canada_gold, friend_money, bake_sale, jackpot,
+#                                 mr_monopoly_tax, wheel_fortune, concert_tickets,
+#                                 spare_money, party_money, huge_apology)
+# 30%  →  Special-action cards  (hackathon_laptop, evaporator_chance,
+#                                 coin_flip_chance, coin_bag_chance)
+# ─────────────────────────────────────────────────────────────────────────────
+
+CHANCE_CATEGORIES = {
+    "market": {
+        "weight": 35,
+        "cards": [
+            {
+                "name": "Inflation",
+                "description": "Housing prices increase +50% to +100% for 2–4 turns!",
+                "action": "inflation"
+            },
+            {
+                "name": "Market Drop",
+                "description": "Housing prices decrease -25% to -50% for 2–4 turns!",
+                "action": "market_drop"
+            },
+        ]
+    },
+    "money": {
+        "weight": 35,
+        "cards": [
+            {
+                "name": "Canada Wins Gold!",
+                "description": "Gain $100.",
+                "action": "canada_gold"
+            },
+            {
+                "name": "Your Friend Needs Money",
+                "description": "Lose $25.",
+                "action": "friend_money"
+            },
+            {
+                "name": "School Bake Sale",
+                "description": "Your school hosted a bake sale. Gain $10.",
+                "action": "bake_sale"
+            },
+            {
+                "name": "Jackpot!",
+                "description": "You hit the jackpot! Gain $200.",
+                "action": "jackpot"
+            },
+            {
+                "name": "Mr. Monopoly's Tax",
+                "description": "Mr. Monopoly is taxing you. Lose $100.",
+                "action": "mr_monopoly_tax"
+            },
+            {
+                "name": "Wheel of Fortune",
+                "description": "You spun the wheel of fortune! Gain $50.",
+                "action": "wheel_fortune"
+            },
+            {
+                "name": "Concert Tickets",
+                "description": "You bought concert tickets. Lose $50.",
+                "action": "concert_tickets"
+            },
+            {
+                "name": "Spare Change",
+                "description": "You collected some spare money. Collect $10 from each player.",
+                "action": "spare_money"
+            },
+            {
+                "name": "Party Host",
+                "description": "You need money to host a party. Collect $25 from each player.",
+                "action": "party_money"
+            },
+            {
+                "name": "Huge Apology",
+                "description": "You owe a huge apology to the world. Pay $50 to each player.",
+                "action": "huge_apology"
+            },
+        ]
+    },
+    "special": {
+        "weight": 30,
+        "cards": [
+            {
+                "name": "Hackathon Laptop",
+                "description": "Pick a roll number between 1 and 12. Move to that space!",
+                "action": "hackathon_laptop"
+            },
+            {
+                "name": "Evaporator",
+                "description": "Delete one house from any property on the board!",
+                "action": "evaporator_chance"
+            },
+            {
+                "name": "Coin Flip",
+                "description": "Flip a coin: Heads = extra turn, Tails = lose a turn.",
+                "action": "coin_flip_chance"
+            },
+            {
+                "name": "Coin Bag",
+                "description": "Gives you 10% more money!",
+                "action": "coin_bag_chance"
+            },
+        ]
+    },
+}
+
+# With Chance Dice active, Chance tiles only ever draw one of these buffs.
+CHANCE_DICE_BUFF_ACTIONS = [
+    "canada_gold",
+    "bake_sale",
+    "jackpot",
+    "wheel_fortune",
+    "spare_money",
+    "party_money",
+    "coin_bag_chance",
+]
+
+
+def draw_chance_card(rng=random):
+    """Pick a weighted category, then a random card from that category."""
+    categories = list(CHANCE_CATEGORIES.keys())
+    weights = [CHANCE_CATEGORIES[c]["weight"] for c in categories]
+    chosen_category = rng.choices(categories, weights=weights, k=1)[0]
+    card = rng.choice(CHANCE_CATEGORIES[chosen_category]["cards"])
+    return card
+
+
+def player_action(method):
+    """Mark an engine method as a player action: calls made from outside the engine go to engine.action_log.
+
+    Actions the engine takes on its own inside another action (an auction started by a
+    purchase, a bankruptcy forced by rent) are not logged, since replaying the outer
+    action repeats them. See replay.py.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def logged(self, *args):
+        if self.action_log is None or self.action_depth:
+            return method(self, *args)
+        self.action_log.record(self, name, args)
+        self.action_depth += 1
+        try:
+            return method(self, *args)
+        finally:
+            self.action_depth -= 1
+    return logged
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# DECISIONS
+# The built-in answers to every prompt a player faces. policies.py subclasses
+# Policy for computer players; seats without one are answered by DEFAULT_POLICY.
+# ─────────────────────────────────────────────────────────────────────────────
+class Policy:
+    """The decision interface, with the engine's built-in answers."""
+
+    def decide_purchase(self, engine, player, prop):
+        """Return "buy", "skip" or "auction" for the unowned prop player landed on."""
+        return "buy" if player.money >= prop.price else "auction"
+
+    def decide_bid(self, engine, player, prop, current_bid):
+        """Return a bid increment (5, 20 or 100), or None to leave the auction."""
+        if current_bid + 5 <= min(player.money, prop.price):
+            return 5
+        return None
+
+    def decide_hackathon(self, engine, player):
+        """Return the Hackathon Laptop destination (1-12)."""
+        for n in range(1, 13):
+            prop = engine.board.spaces[n].get("property")
+            if prop is not None and prop.owner is None and prop.price <= player.money:
+                return n
+        return JAIL_POSITION
+
+    def decide_evaporator(self, engine, player, targets):
+        """Return the property in targets that loses a building, preferring opponents' best-built lots."""
+        opponents = [p for p in targets if p.owner != player] or targets
+        return max(opponents, key=lambda p: (p.get_building_level(), p.price))
+
+    def decide_trade(self, engine, player, proposer):
+        """Return True to accept the trade proposer has set up (engine.trade_* fields)."""
+        return False
+
+    def decide_builds(self, engine, player):
+        """Build, sell or mortgage before rolling, through the engine's try_* and sell_* methods."""
+
+    def decide_raise_funds(self, engine, player, amount):
+        """Mortgage, then sell buildings, until player holds amount or has nothing left to raise it with."""
+        for prop in sorted(player.properties, key=lambda p: p.price):
+            if player.money >= amount:
+                return
+            if not prop.mortgaged and prop.get_building_level() == 0:
+                engine.toggle_mortgage(player, prop)
+        built = [p for p in player.properties if p.get_building_level() > 0]
+        while player.money < amount and built:
+            # Sell from the best-built lot down, mortgaging each lot once it is bare
+            prop = max(built, key=lambda p: (p.get_building_level(), p.price))
+            money = player.money
+            engine.sell_building(player, prop)
+            if prop.get_building_level() == 0:
+                engine.toggle_mortgage(player, prop)
+                built.remove(prop)
+            elif player.money == money:
+                # A hotel the bank has no houses to break it into
+                built.remove(prop)
+
+
+DEFAULT_POLICY = Policy()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SNAPSHOTS
+# Players are stored by seat and properties by position, so a snapshot holds
+# no live objects and can be restored into any engine, any number of times.
+# ─────────────────────────────────────────────────────────────────────────────
+# Plain engine attributes copied as-is
+SNAPSHOT_ENGINE_FIELDS = (
+    "current_player_index", "turn_count", "game_over", "message", "message_timer",
+    "waiting_for_action", "dice_rolled", "roll_value", "is_double", "just_passed_go",
+    "extra_turn", "lose_turn",
+    "auction_active", "auction_current_bid", "auction_turn_index",
+    "trade_active", "trade_stage", "trade_partner_index", "trade_offer_cash", "trade_request_cash",
+    "hackathon_pending", "evaporator_pending",
+    "roll_count", "roll_sum_total", "doubles_count",
+)
+# Engine attributes holding a single Player / Property (or None)
+SNAPSHOT_PLAYER_REFS = ("turn_player", "winner", "auction_highest_bidder", "hackathon_player", "evaporator_player")
+SNAPSHOT_PROPERTY_REFS = ("pending_property", "auction_property")
+# Per-player rule state kept outside the BoardState arrays
+SNAPSHOT_PLAYER_FIELDS = ("in_jail", "jail_turns", "consecutive_doubles", "get_out_of_jail_free",
+                          "next_roll_max_one", "bazinga_rescues_left")
+
+
+class GameSnapshot:
+    """Frozen copy of one game position, made by MonopolyEngine.snapshot().
+
+    The BoardState arrays are read-only; restore() copies them, so one snapshot
+    can seed any number of forks.
+    """
+    __slots__ = ("state", "seats", "player_fields", "players", "engine_fields", "player_refs", "property_refs",
+                 "auction_active_players", "trade_offer_props", "trade_request_props",
+                 "active_market_effects", "item_chest_cards", "bankruptcies",
+                 "roll_total_counts", "last_rolls", "position_visit_counts",
+                 "dice", "rng")
+
+
+# Rules Engine Class
+class MonopolyEngine:
+    """All game rules with no display attached.
+
+    Player actions are plain method calls (roll_dice, buy_pending_property,
+    place_bid, ...). Headless games resolve prompts through the decide_*
+    hooks; the pygame front end resolves them from mouse clicks instead.
+    """
+
+    def __init__(self, num_players=2, seed=None, batch_dice=False):
+        self.num_players = num_players
+        # Unseeded games pick a seed anyway, so any game can be replayed from its log
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.dice_rng = random.Random(stream_seed(self.seed, "dice"))
+        self.card_rng = random.Random(stream_seed(self.seed, "cards"))     # chance cards and their amounts
+        self.chest_rng = random.Random(stream_seed(self.seed, "chest"))    # item chest coin flips
+        # batch_dice pre-draws rolls in numpy blocks; simulations want it, the UI doesn't need it.
+        generator = np.random.default_rng(stream_seed(self.seed, "dice")) if batch_dice else None
+        self.dice = Dice(self.dice_rng, generator)
+        # Numpy stream for the per-turn price noise, drawn for the whole board and
+        # MARKET_NOISE_TURNS turns at once (see market_noise)
+        self.market_rng = np.random.default_rng(stream_seed(self.seed, "market"))
+        self.noise_block = None
+        self.noise_index = 0
+        self.noise_block_state = None    # market_rng's state before noise_block was drawn
+        # Seat number -> Policy answering that player's decide_* prompts; other seats use DEFAULT_POLICY
+        self.policies = {}
+        # ActionLog recording the player_action calls (replay.py), or None
+        self.action_log = None
+        self.action_depth = 0
+        # EventLog receiving the typed rule events passed to emit() (event_log.py), or None
+        self.event_log = None
+        self.reset()
+
+    def reset(self):
+        """Start a fresh game with a new board, deck and players (dice type is kept)."""
+        self.board = Board()
+        self.active_market_effects = []
+        self.item_chest_cards = list(ITEM_CHEST_CARDS)
+
+        self.players = []
+        self.current_player_index = 0
+        self.turn_player = None
+        self.turn_count = 0
+        self.game_over = False
+        self.winner = None
+        self.bankruptcies = []
+        self.message = ""
+        self.message_timer = 0
+        self.waiting_for_action = True
+        self.dice_rolled = False
+        self.roll_value = 0
+        self.is_double = False
+        self.just_passed_go = False
+        self.extra_turn = False
+        self.lose_turn = False
+        self.pending_property = None
+
+        self.auction_active = False
+        self.auction_property = None
+        self.auction_current_bid = 0
+        self.auction_highest_bidder = None
+        self.auction_turn_index = 0
+        self.auction_active_players = []
+
+        self.trade_active = False
+        self.trade_stage = "select"
+        self.trade_partner_index = None
+        self.trade_offer_props = set()
+        self.trade_request_props = set()
+        self.trade_offer_cash = 0
+        self.trade_request_cash = 0
+
+        # Hackathon laptop: pending position pick (1-12)
+        self.hackathon_pending = False
+        self.hackathon_player = None
+
+        # Evaporator (chance version): pending house removal
+        self.evaporator_pending = False
+        self.evaporator_player = None
+
+        self.roll_count = 0
+        self.roll_sum_total = 0
+        self.doubles_count = 0
+        self.roll_total_counts = {n: 0 for n in range(2, 13)}
+        self.last_rolls = []
+        self.position_visit_counts = {i: 0 for i in range(BOARD_SIZE)}
+
+        self.setup_game()
+
+    def set_message(self, text, duration=180):
+        self.message = text
+        self.message_timer = duration
+
+    def emit(self, event, *fields):
+        """Record a rule event, fields in event_log.EVENT_FIELDS order, if an event log is attached."""
+        if self.event_log is not None:
+            self.event_log.append(self.turn_count, event, fields)
+
+    def get_dice_total_distribution(self, dice_type):
+        weights = DICE_FACE_WEIGHTS[dice_type]
+        distribution = {}
+        total_outcomes = sum(weights.values()) ** 2
+        for a, wa in weights.items():
+            for b, wb in weights.items():
+                total = a + b
+                distribution[total] = distribution.get(total, 0.0) + (wa * wb) / total_outcomes
+        return distribution
+
+    def get_expected_roll(self, dice_type):
+        distribution = self.get_dice_total_distribution(dice_type)
+        return sum(total * prob for total, prob in distribution.items())
+
+    def get_roll_variance(self, dice_type):
+        distribution = self.get_dice_total_distribution(dice_type)
+        mean = self.get_expected_roll(dice_type)
+        return sum(((total - mean) ** 2) * prob for total, prob in distribution.items())
+
+    def get_doubles_probability(self, dice_type):
+        # Doubles probabilities depend on repeated faces in each profile.
+        if dice_type == DiceType.REGULAR:
+            return 1 / 6
+        if dice_type == DiceType.CHANCE:
+            return 1 / 3
+        if dice_type == DiceType.BAZINGA:
+            return 5 / 18
+        return 1 / 2
+
+    def record_roll_stats(self, roll_value, is_double, landing_pos):
+        self.roll_count += 1
+        self.roll_sum_total += roll_value
+        if roll_value in self.roll_total_counts:
+            self.roll_total_counts[roll_value] += 1
+        if is_double:
+            self.doubles_count += 1
+        self.last_rolls.append(roll_value)
+        if len(self.last_rolls) > 12:
+            self.last_rolls.pop(0)
+        if landing_pos is not None and landing_pos in self.position_visit_counts:
+            self.position_visit_counts[landing_pos] += 1
+
+    def setup_game(self):
+        for i in range(self.num_players):
+            player = Player(f"Player {i+1}", PLAYER_COLORS[i], PLAYER_TOKENS[i], self.board)
+            self.players.append(player)
+
+    def apply_market_effects(self, noise=None):
+        """Apply ongoing market effects (then the optional per-property noise) and decrement their timers.
+
+        Call once per turn.
+        """
+        percent_changes = []
+        expired = []
+        for effect in self.active_market_effects:
+            if effect["action"] == "inflation":
+                percent_changes.append(effect["amount"])
+            elif effect["action"] == "market_drop":
+                percent_changes.append(-effect["amount"])
+            effect["turns_left"] -= 1
+            if effect["turns_left"] <= 0:
+                expired.append(effect)
+        for e in expired:
+            self.active_market_effects.remove(e)
+            self.emit("market_expire", e["action"], e["amount"])
+        self.board.update_stock_values(percent_changes, noise)
+
+    def handle_item_chest(self, player):
+        card = self.item_chest_cards.pop(0)
+        self.item_chest_cards.append(card)
+
+        self.set_message(f"Item Chest Experiment: {card['name']}")
+        self.emit("card", player.seat, "chest", card['action'])
+
+        if card['action'] == "rigged_dice":
+            player.next_roll_max_one = True
+            self.set_message("Outlier Clamp! Your next roll is capped at 1.")
+
+        elif card['action'] == "evaporator":
+            self.set_message("Item Chest: Evaporator (not implemented) - no effect this turn")
+
+        elif card['action'] == "coin_flip":
+            result = self.chest_rng.choice(["Heads", "Tails"])
+            if result == "Heads":
+                self.set_message("Heads! You get an extra turn!")
+                self.extra_turn = True
+            else:
+                self.set_message("Tails! You lose a turn!")
+                self.lose_turn = True
+
+        elif card['action'] == "coin_bag":
+            bonus = int(player.money * 0.1)
+            player.receive(bonus)
+            self.set_message(f"Coin Bag: You got ${bonus} (10% bonus)!")
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # CHANCE / FATE CARD HANDLER
+    # ─────────────────────────────────────────────────────────────────────────
+    def handle_chance(self, player):
+        if self.dice.dice_type == DiceType.CHANCE:
+            action = self.card_rng.choice(CHANCE_DICE_BUFF_ACTIONS)
+            chance_dice_card_text = {
+                "canada_gold": ("Canada Wins Gold!", "Chance Dice boost: gain $100."),
+                "bake_sale": ("School Bake Sale", "Chance Dice boost: gain $10."),
+                "jackpot": ("Jackpot!", "Chance Dice boost: gain $200."),
+                "wheel_fortune": ("Wheel of Fortune", "Chance Dice boost: gain $50."),
+                "spare_money": ("Spare Change", "Chance Dice boost: collect $10 from each player."),
+                "party_money": ("Party Host", "Chance Dice boost: collect $25 from each player."),
+                "coin_bag_chance": ("Coin Bag", "Chance Dice boost: gain +10% money."),
+            }
+            name, description = chance_dice_card_text[action]
+            card = {"name": name, "description": description, "action": action}
+            deck = "chance_dice"
+        else:
+            card = draw_chance_card(self.card_rng)
+            deck = "chance"
+        action = card["action"]
+
+        # Show card name + description at the top
+        self.set_message(f"Stat Event – {card['name']}: {card['description']}", 240)
+        self.emit("card", player.seat, deck, action)
+
+        # ── Market effects (35%) ──────────────────────────────────────────────
+        if action == "inflation":
+            pct = self.card_rng.randint(50, 100)
+            turns = self.card_rng.randint(2, 4)
+            self.active_market_effects.append({"action": "inflation", "amount": pct, "turns_left": turns})
+            # Apply immediately this turn too
+            self.board.update_stock_values([pct])
+            self.set_message(f"Inflation! Property values +{pct}% for {turns} turns!", 240)
+            self.emit("market_start", "inflation", pct, turns)
+
+        elif action == "market_drop":
+            pct = self.card_rng.randint(25, 50)
+            turns = self.card_rng.randint(2, 4)
+            self.active_market_effects.append({"action": "market_drop", "amount": pct, "turns_left": turns})
+            self.board.update_stock_values([-pct])
+            self.set_message(f"Market Drop! Property values -{pct}% for {turns} turns!", 240)
+            self.emit("market_start", "market_drop", pct, turns)
+
+        # ── Money-transfer cards (35%) ────────────────────────────────────────
+        elif action == "canada_gold":
+            player.receive(100)
+            self.set_message("Canada Wins Gold! You gained $100!")
+
+        elif action == "friend_money":
+            amt = min(25, player.money)
+            player.pay(amt)
+            self.set_message("Your friend needs $25. You lost $25.")
+
+        elif action == "bake_sale":
+            player.receive(10)
+            self.set_message("School bake sale raised money! You gained $10.")
+
+        elif action == "jackpot":
+            player.receive(200)
+            self.set_message("JACKPOT! You gained $200!")
+
+        elif action == "mr_monopoly_tax":
+            amt = min(100, player.money)
+            player.pay(amt)
+            self.set_message("Mr. Monopoly is taxing you $100!")
+
+        elif action == "wheel_fortune":
+            player.receive(50)
+            self.set_message("Wheel of Fortune! You gained $50!")
+
+        elif action == "concert_tickets":
+            amt = min(50, player.money)
+            player.pay(amt)
+            self.set_message("You bought concert tickets. Lost $50.")
+
+        elif action == "spare_money":
+            collected = 0
+            for other in self.players:
+                if other != player:
+                    paid = min(10, other.money)
+                    other.pay(paid)
+                    player.receive(paid)
+                    collected += paid
+            self.set_message(f"Collected spare change! Got ${collected} total (${10} per player).")
+
+        elif action == "party_money":
+            collected = 0
+            for other in self.players:
+                if other != player:
+                    paid = min(25, other.money)
+                    other.pay(paid)
+                    player.receive(paid)
+                    collected += paid
+            self.set_message(f"Party time! Collected ${collected} total (${25} per player).")
+
+        elif action == "huge_apology":
+            total_paid = 0
+            for other in self.players:
+                if other != player:
+                    amt = min(50, player.money)
+                    if player.money >= 50:
+                        player.pay(50, other)
+                        total_paid += 50
+                    else:
+                        player.pay(player.money, other)
+                        total_paid += amt
+            self.set_message(f"Huge Apology! You paid $50 to each other player (${total_paid} total).")
+
+        # ── Special-action cards (30%) ────────────────────────────────────────
+        elif action == "hackathon_laptop":
+            self.set_message("Hackathon Laptop! Choose a number 1–12 to move to that space!", 999999)
+            self.hackathon_pending = True
+            self.hackathon_player = player
+            self.waiting_for_action = False
+
+        elif action == "evaporator_chance":
+            # Find all properties with houses/hotels
+            buildable = self.get_evaporator_targets()
+            if not buildable:
+                self.set_message("Evaporator: No houses on the board to remove!")
+            else:
+                self.set_message("Evaporator! Click a property to remove one house/hotel.", 999999)
+                self.evaporator_pending = True
+                self.evaporator_player = player
+                self.waiting_for_action = False
+
+        elif action == "coin_flip_chance":
+            result = self.card_rng.choice(["Heads", "Tails"])
+            if result == "Heads":
+                self.set_message(f"Coin Flip – Heads! {player.name} gets an extra turn!")
+                self.extra_turn = True
+            else:
+                self.set_message(f"Coin Flip – Tails! {player.name} loses a turn!")
+                self.lose_turn = True
+
+        elif action == "coin_bag_chance":
+            bonus = int(player.money * 0.1)
+            player.receive(bonus)
+            self.set_message(f"Coin Bag! You got +10% money (${bonus})!")
+
+    def handle_landing(self, player, position):
+        space = self.board.spaces[position]
+
+        if position == 0 and not self.just_passed_go:
+            player.receive(300)
+            self.set_message("Landed on GO! Received $300!")
+            self.emit("pass_go", player.seat, 300)
+
+        if "property" in space:
+            prop = space["property"]
+
+            if prop.owner is None:
+                if player.money < prop.price:
+                    self.set_message(f"{prop.name} costs ${prop.price}. Starting auction.")
+                    self.start_auction(prop)
+                else:
+                    self.waiting_for_action = False
+                    self.pending_property = prop
+                    self.set_message(f"{prop.name} is unowned. Buy for ${prop.price}, auction, or skip.", 100000)
+
+            elif prop.owner != player:
+                rent = prop.get_rent()
+                if player.pay(rent, prop.owner):
+                    self.set_message(f"Paid ${rent} rent to {prop.owner.name}")
+                    self.emit("rent", player.seat, prop.owner.seat, position, rent, True)
+                else:
+                    # Failed rent payment is treated as a bankruptcy event.
+                    # Set cash to 0 so Bazinga rescue logic can evaluate the <= 0 rule.
+                    player.money = 0
+                    self.set_message(f"{player.name} can't pay rent! Bankruptcy!")
+                    self.emit("rent", player.seat, prop.owner.seat, position, rent, False)
+                    self.handle_bankruptcy(player, "rent")
+
+        elif space["type"] == PropertyType.CHEST:
+            self.handle_item_chest(player)
+
+        elif space["type"] == PropertyType.CHANCE:
+            self.handle_chance(player)
+
+        elif space["type"] == PropertyType.GO_TO_US:
+            player.position = JAIL_POSITION
+            player.in_jail = True
+            self.set_message("Go to US! Sent to the Arctic! Pay $50 to fly back")
+            self.emit("move", player.seat, position, JAIL_POSITION)
+
+        elif space["type"] == PropertyType.JAIL:
+            if player.in_jail:
+                player.jail_turns += 1
+                self.set_message(f"{player.name} is in jail. Turn {player.jail_turns}/3")
+
+        elif space["type"] == "tax":
+            if space["name"] == "Income Tax":
+                player.pay(200, None)
+                self.set_message("Paid $200 Income Tax")
+            else:
+                player.pay(100, None)
+                self.set_message("Paid $100 Luxury Tax")
+
+    def handle_bankruptcy(self, player, cause="declared"):
+        # Bazinga bailout rule:
+        # If the player is out of cash (<= 0), and the CURRENT selected dice type
+        # is Bazinga, grant +$200 up to 3 times before true bankruptcy.
+        if player.money <= 0 and self.dice.dice_type == DiceType.BAZINGA and player.bazinga_rescues_left > 0:
+            player.bazinga_rescues_left -= 1
+            player.receive(200)
+            self.set_message(
+                f"Bazinga save! {player.name} gets +$200 "
+                f"({player.bazinga_rescues_left} save(s) left)."
+            )
+            self.emit("bazinga_rescue", player.seat, 200, player.bazinga_rescues_left)
+            return
+
+        self.bankruptcies.append((player.name, cause, self.turn_count))
+        self.emit("bankruptcy", player.seat, cause)
+        self.release_properties(player)
+        removed_index = self.players.index(player)
+        self.players.remove(player)
+        # Keep the turn pointer on the same seat order after the removal.
+        if removed_index < self.current_player_index:
+            self.current_player_index -= 1
+        if self.players:
+            self.current_player_index %= len(self.players)
+        if len(self.players) == 1:
+            self.game_over = True
+            self.winner = self.players[0]
+            self.set_message(f"{self.players[0].name} wins!", 100000)
+
+    def release_properties(self, player):
+        """Hand a bankrupt player's lots back to the bank, buildings and mortgages cleared."""
+        board = self.board
+        for prop in list(player.properties):
+            if prop.hotel:
+                board.hotel_pool += 1
+            board.house_pool += prop.houses
+            prop.houses = 0
+            prop.hotel = False
+            prop.mortgaged = False
+            board.transfer(prop, None)
+
+    def force_bankruptcy_if_needed(self):
+        # Safety net for any code path that accidentally drives a player below zero.
+        if self.game_over or not self.players:
+            return
+        if self.players[self.current_player_index].money < 0:
+            self.force_bankruptcy()
+
+    @player_action
+    def force_bankruptcy(self):
+        current_player = self.players[self.current_player_index]
+        current_player.money = 0
+        self.set_message(f"{current_player.name} went bankrupt!")
+        self.handle_bankruptcy(current_player, "negative_cash")
+
+    @player_action
+    def fail_jail_fee(self):
+        """Stuck in the Arctic with no way to pay the fare."""
+        player = self.players[self.current_player_index]
+        player.money = 0
+        self.set_message(f"{player.name} can't pay the ${JAIL_FARE} fare! Bankruptcy!")
+        self.handle_bankruptcy(player, "jail_fee")
+
+    @player_action
+    def declare_bankruptcy(self):
+        current_player = self.players[self.current_player_index]
+        self.set_message(f"{current_player.name} declared bankruptcy.")
+        self.handle_bankruptcy(current_player, "declared")
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # TURN FLOW
+    # ─────────────────────────────────────────────────────────────────────────
+    @player_action
+    def roll_dice(self):
+        """Resolve a Roll Dice press: jail fee, roll, movement and landing."""
+        player = self.players[self.current_player_index]
+        if player.in_jail:
+            if player.pay(JAIL_FARE, None):
+                player.in_jail = False
+                player.jail_turns = 0
+                self.set_message("Paid $50 to fly back from the Arctic!")
+            return
+
+        self.roll_value, self.is_double = self.dice.roll()
+        if player.next_roll_max_one:
+            self.roll_value = min(self.roll_value, 1)
+            self.is_double = False
+            player.next_roll_max_one = False
+        self.dice_rolled = True
+        self.turn_player = player
+        die1, die2 = self.dice.roll_result
+        self.emit("roll", player.seat, die1, die2, self.roll_value)
+        if self.is_double:
+            player.consecutive_doubles += 1
+            if player.consecutive_doubles >= 3:
+                self.emit("move", player.seat, player.position, JAIL_POSITION)
+                player.position = JAIL_POSITION
+                player.in_jail = True
+                player.consecutive_doubles = 0
+                self.record_roll_stats(self.roll_value, self.is_double, player.position)
+                self.set_message("Three doubles! Go to the Arctic!")
+                return
+        else:
+            player.consecutive_doubles = 0
+        self.move_player(player, self.roll_value)
+
+    def move_player(self, player, steps):
+        old_pos = player.position
+        new_pos = player.move(steps)
+        self.record_roll_stats(self.roll_value, self.is_double, new_pos)
+        self.on_player_moved(player, old_pos, new_pos)
+        self.emit("move", player.seat, old_pos, new_pos)
+        self.just_passed_go = new_pos < steps
+        if self.just_passed_go:
+            player.receive(200)
+            self.set_message("Passed GO! Received $200")
+            self.emit("pass_go", player.seat, 200)
+        self.handle_landing(player, new_pos)
+
+    def on_player_moved(self, player, old_pos, new_pos):
+        """Hook for front ends that animate tokens; the engine itself does nothing."""
+
+    def can_end_turn(self):
+        return self.dice_rolled and self.waiting_for_action and not self.game_over
+
+    @player_action
+    def end_turn(self):
+        self.next_turn()
+        self.dice_rolled = False
+        self.waiting_for_action = True
+
+    def next_turn(self):
+        self.turn_count += 1
+
+        # Apply market effects and fluctuate every property value by a random ±5%, in one pass.
+        self.apply_market_effects(self.market_noise())
+
+        # The player who rolled went bankrupt: their seat is gone and the turn
+        # pointer already sits on the next player.
+        if self.turn_player is not None and self.turn_player not in self.players:
+            self.turn_player = None
+            self.extra_turn = False
+            self.lose_turn = False
+            self.dice_rolled = False
+            return
+        if self.extra_turn:
+            self.extra_turn = False
+            return
+        if self.lose_turn:
+            self.lose_turn = False
+            self.current_player_index = (self.current_player_index + 1) % len(self.players)
+            return
+        if self.is_double and not self.dice.double_count >= 3:
+            return
+        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self.dice_rolled = False
+
+    def market_noise(self):
+        """This turn's price multipliers, one per property, from a block of MARKET_NOISE_TURNS turns drawn ahead.
+
+        The values are exactly those of drawing one turn at a time, since every double takes one
+        step of market_rng; market_rng_state() gives the stream's position as if that were so.
+        """
+        if self.noise_block is None or self.noise_index == len(self.noise_block):
+            self.noise_block_state = self.market_rng.bit_generator.state
+            # Scaling random() in place gives exactly uniform(0.95, 1.05)'s values at a third of its cost
+            block = self.market_rng.random((MARKET_NOISE_TURNS, len(self.board.properties)))
+            block *= 1.05 - 0.95
+            block += 0.95
+            self.noise_block = block
+            self.noise_index = 0
+        noise = self.noise_block[self.noise_index]
+        self.noise_index += 1
+        return noise
+
+    def market_rng_state(self):
+        """market_rng's state after the noise handed out so far, as if drawn a turn at a time."""
+        if self.noise_block is None:
+            return self.market_rng.bit_generator.state
+        bit_generator = np.random.PCG64()
+        bit_generator.state = self.noise_block_state
+        bit_generator.advance(self.noise_index * self.noise_block.shape[1])
+        return bit_generator.state
+
+    @player_action
+    def change_dice_type(self):
+        new_dice = self.dice.change_dice_type()
+        self.set_message(f"Dice changed to: {new_dice.value}", 120)
+        return new_dice
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # PURCHASES & AUCTIONS
+    # ─────────────────────────────────────────────────────────────────────────
+    @player_action
+    def buy_pending_property(self):
+        player = self.players[self.current_player_index]
+        prop = self.pending_property
+        if player.pay(prop.price):
+            self.board.transfer(prop, player)
+            self.set_message(f"Bought {prop.name} for ${prop.price}!")
+            self.emit("buy", player.seat, prop.position, prop.price)
+        else:
+            self.set_message("Not enough money. Starting auction.")
+            self.start_auction(prop)
+        self.pending_property = None
+        self.waiting_for_action = True
+
+    @player_action
+    def skip_pending_property(self):
+        self.set_message("Skipped property purchase.")
+        self.pending_property = None
+        self.waiting_for_action = True
+
+    @player_action
+    def auction_pending_property(self):
+        self.set_message(f"Starting auction for {self.pending_property.name}.")
+        self.start_auction(self.pending_property)
+
+    def start_auction(self, prop):
+        self.auction_active = True
+        self.auction_property = prop
+        self.auction_current_bid = max(1, prop.price // 2)
+        self.auction_highest_bidder = None
+        self.auction_active_players = [p for p in self.players if p.money > 0]
+        self.auction_turn_index = 0
+        self.pending_property = None
+        self.waiting_for_action = False
+
+    @player_action
+    def finish_auction(self):
+        if self.auction_highest_bidder:
+            self.auction_highest_bidder.pay(self.auction_current_bid)
+            self.board.transfer(self.auction_property, self.auction_highest_bidder)
+            self.set_message(
+                f"{self.auction_highest_bidder.name} won {self.auction_property.name} for ${self.auction_current_bid}.")
+            self.emit("auction_end", self.auction_highest_bidder.seat, self.auction_property.position,
+                      self.auction_current_bid)
+        else:
+            self.set_message(f"No bids for {self.auction_property.name}.")
+            self.emit("auction_end", -1, self.auction_property.position, 0)
+        self.auction_active = False
+        self.auction_property = None
+        self.auction_current_bid = 0
+        self.auction_highest_bidder = None
+        self.auction_active_players = []
+        self.auction_turn_index = 0
+        self.waiting_for_action = True
+
+    def get_current_auction_player(self):
+        if not self.auction_active_players:
+            return None
+        self.auction_turn_index %= len(self.auction_active_players)
+        return self.auction_active_players[self.auction_turn_index]
+
+    def advance_auction_turn(self):
+        if not self.auction_active_players:
+            self.finish_auction()
+            return
+        if len(self.auction_active_players) == 1:
+            self.finish_auction()
+            return
+        self.auction_turn_index = (self.auction_turn_index + 1) % len(self.auction_active_players)
+
+    @player_action
+    def place_bid(self, increment):
+        """Raise the current bidder's offer; returns False if they can't cover it."""
+        current_bidder = self.get_current_auction_player()
+        new_bid = self.auction_current_bid + increment
+        if new_bid <= current_bidder.money:
+            self.auction_current_bid = new_bid
+            self.auction_highest_bidder = current_bidder
+            self.emit("bid", current_bidder.seat, self.auction_property.position, new_bid)
+            self.advance_auction_turn()
+            return True
+        self.set_message("You cannot bid more than your cash.")
+        return False
+
+    @player_action
+    def leave_auction(self):
+        current_bidder = self.get_current_auction_player()
+        self.auction_active_players = [p for p in self.auction_active_players if p != current_bidder]
+        self.advance_auction_turn()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # CARD PROMPTS
+    # ─────────────────────────────────────────────────────────────────────────
+    @player_action
+    def choose_hackathon_space(self, n):
+        player = self.hackathon_player
+        self.emit("move", player.seat, player.position, n % BOARD_SIZE)
+        player.position = n % BOARD_SIZE
+        self.hackathon_pending = False
+        self.hackathon_player = None
+        self.waiting_for_action = True
+        self.set_message(f"Hackathon Laptop: moved to space {n}!")
+        self.handle_landing(player, player.position)
+
+    def get_evaporator_targets(self):
+        return [p for p in self.board.properties if (p.houses > 0 or p.hotel) and p.owner is not None]
+
+    @player_action
+    def evaporate(self, prop):
+        board = self.board
+        if prop.hotel:
+            prop.hotel = False
+            prop.houses = 0
+            board.hotel_pool += 1
+            self.set_message(f"Evaporator destroyed the hotel on {prop.name}!")
+            self.emit("evaporate", self.evaporator_player.seat, prop.position, "hotel")
+        elif prop.houses > 0:
+            prop.houses -= 1
+            board.house_pool += 1
+            self.set_message(f"Evaporator removed a house from {prop.name}!")
+            self.emit("evaporate", self.evaporator_player.seat, prop.position, "house")
+        self.evaporator_pending = False
+        self.evaporator_player = None
+        self.waiting_for_action = True
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # BUILDINGS, SALES & MORTGAGES
+    # ─────────────────────────────────────────────────────────────────────────
+    @player_action
+    def try_buy_house(self, player, prop):
+        if prop is None or prop.owner != player:
+            self.set_message("You can only build on your own properties.")
+            return
+        if not self.owns_color_set(player, prop):
+            self.set_message("You need the full color set to build here.")
+            return
+        house_cost = prop.get_house_cost()
+        if house_cost is None:
+            self.set_message("Cannot build a house here.")
+            return
+        counts = [(5 if p.hotel else p.houses) for p in self.board.color_groups[prop.color]]
+        min_houses = min(counts) if counts else 0
+        if (5 if prop.hotel else prop.houses) != min_houses:
+            self.set_message("Must build evenly across the color set.")
+            return
+        if self.board.house_pool <= 0:
+            self.set_message("No houses available in the bank.")
+            return
+        if player.pay(house_cost):
+            prop.build_house()
+            self.set_message(f"Built a house on {prop.name} for ${house_cost}.")
+            self.emit("build", player.seat, prop.position, "house", house_cost)
+        else:
+            self.set_message("Not enough money to buy a house.")
+
+    @player_action
+    def try_buy_hotel(self, player, prop):
+        if prop is None or prop.owner != player:
+            self.set_message("You can only build on your own properties.")
+            return
+        if not self.owns_color_set(player, prop):
+            self.set_message("You need the full color set to build here.")
+            return
+        hotel_cost = prop.get_hotel_cost()
+        if hotel_cost is None:
+            self.set_message("Need 4 houses before buying a hotel.")
+            return
+        if self.board.hotel_pool <= 0:
+            self.set_message("No hotels available in the bank.")
+            return
+        if player.pay(hotel_cost):
+            prop.build_hotel()
+            self.set_message(f"Built a hotel on {prop.name} for ${hotel_cost}.")
+            self.emit("build", player.seat, prop.position, "hotel", hotel_cost)
+        else:
+            self.set_message("Not enough money to buy a hotel.")
+
+    def owns_color_set(self, player, prop):
+        if prop.property_type != PropertyType.PROPERTY:
+            return False
+        return self.board.index.owns_color_set(player, prop.color)
+
+    @player_action
+    def sell_building(self, player, prop):
+        gain = prop.sell_house()
+        if gain and gain > 0:
+            player.receive(gain)
+            self.set_message(f"Sold house/hotel on {prop.name} for ${gain}.")
+            self.emit("sell", player.seat, prop.position, "building", gain)
+        else:
+            self.set_message("No houses or hotel to sell.")
+
+    @player_action
+    def sell_property(self, player, prop):
+        if prop.houses > 0 or prop.hotel:
+            self.set_message("Sell houses/hotel first before selling property.")
+            return
+        if prop.mortgaged:
+            self.set_message("Cannot sell a mortgaged property. Unmortgage first.")
+            return
+        amt = prop.sell_property_to_bank()
+        if amt is not None:
+            player.receive(amt)
+            self.board.transfer(prop, None)
+            self.set_message(f"Sold {prop.name} to bank for ${amt}.")
+            self.emit("sell", player.seat, prop.position, "property", amt)
+
+    @player_action
+    def toggle_mortgage(self, player, prop):
+        if prop.mortgaged:
+            cost = prop.get_unmortgage_cost()
+            if player.pay(cost):
+                prop.unmortgage()
+                self.set_message(f"Unmortgaged {prop.name} for ${cost}.")
+                self.emit("mortgage", player.seat, prop.position, False, cost)
+            else:
+                self.set_message("Not enough money to unmortgage.")
+        else:
+            val = prop.mortgage()
+            if val is None:
+                self.set_message("Cannot mortgage while houses or a hotel are present.")
+            else:
+                player.receive(val)
+                self.set_message(f"Mortgaged {prop.name} for ${val}.")
+                self.emit("mortgage", player.seat, prop.position, True, val)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # TRADES
+    # ─────────────────────────────────────────────────────────────────────────
+    @player_action
+    def open_trade(self):
+        self.trade_active = True
+        self.trade_stage = "select"
+        self.trade_partner_index = None
+        self.trade_offer_props = set()
+        self.trade_request_props = set()
+        self.trade_offer_cash = 0
+        self.trade_request_cash = 0
+        self.waiting_for_action = False
+
+    @player_action
+    def propose_trade(self, partner_index, offer_props, request_props, offer_cash, request_cash):
+        """Put the terms to the partner; answer_trade() settles it."""
+        self.trade_partner_index = partner_index
+        self.trade_offer_props = set(offer_props)
+        self.trade_request_props = set(request_props)
+        self.trade_offer_cash = offer_cash
+        self.trade_request_cash = request_cash
+        self.trade_stage = "confirm"
+
+    def close_trade(self, message=None):
+        if message:
+            self.set_message(message)
+        self.trade_active = False
+        self.trade_partner_index = None
+        self.trade_offer_props = set()
+        self.trade_request_props = set()
+        self.trade_offer_cash = 0
+        self.trade_request_cash = 0
+        self.trade_stage = "select"
+        self.waiting_for_action = True
+
+    @player_action
+    def answer_trade(self, accept):
+        """The partner's answer to a proposed trade; closes the trade either way."""
+        if accept:
+            success = self.apply_trade(self.players[self.current_player_index], self.players[self.trade_partner_index])
+            self.close_trade("Trade completed." if success else "Trade failed.")
+        else:
+            self.close_trade("Trade declined.")
+
+    def apply_trade(self, current_player, partner):
+        if self.trade_offer_cash > current_player.money or self.trade_request_cash > partner.money:
+            self.set_message("Trade failed: not enough cash.")
+            return False
+        if any(p.owner != current_player for p in self.trade_offer_props):
+            self.set_message("Trade failed: you no longer own some offered properties.")
+            return False
+        if any(p.owner != partner for p in self.trade_request_props):
+            self.set_message("Trade failed: partner no longer owns some requested properties.")
+            return False
+        current_player.money -= self.trade_offer_cash
+        partner.money += self.trade_offer_cash
+        partner.money -= self.trade_request_cash
+        current_player.money += self.trade_request_cash
+        for prop in list(self.trade_offer_props):
+            self.board.transfer(prop, partner)
+        for prop in list(self.trade_request_props):
+            self.board.transfer(prop, current_player)
+        # Lots as bitmasks over board positions, so a trade stays one flat record
+        self.emit("trade", current_player.seat, partner.seat, self.trade_offer_cash, self.trade_request_cash,
+                  sum(1 << p.position for p in self.trade_offer_props),
+                  sum(1 << p.position for p in self.trade_request_props))
+        return True
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # HEADLESS PLAY
+    # ─────────────────────────────────────────────────────────────────────────
+    def set_policy(self, player, policy):
+        """Let `policy` (see policies.py) make player's decisions; None hands them back to the defaults."""
+        if policy is None:
+            self.policies.pop(player.seat, None)
+        else:
+            self.policies[player.seat] = policy
+
+    def policy_for(self, player):
+        return self.policies.get(player.seat, DEFAULT_POLICY)
+
+    def decide_purchase(self, player, prop):
+        """Return "buy", "skip" or "auction" for an unowned property."""
+        return self.policy_for(player).decide_purchase(self, player, prop)
+
+    def decide_bid(self, player, prop, current_bid):
+        """Return a bid increment, or None to leave the auction."""
+        return self.policy_for(player).decide_bid(self, player, prop, current_bid)
+
+    def decide_hackathon(self, player):
+        """Return the Hackathon Laptop destination (1-12)."""
+        return self.policy_for(player).decide_hackathon(self, player)
+
+    def decide_evaporator(self, player, targets):
+        """Return the property to lose a building."""
+        return self.policy_for(player).decide_evaporator(self, player, targets)
+
+    def decide_trade(self, player, proposer):
+        """Return True if player accepts the trade proposer has set up in the trade_* fields."""
+        return self.policy_for(player).decide_trade(self, player, proposer)
+
+    def decide_builds(self, player):
+        """Pre-roll management hook (build, sell, mortgage, trade); the default does nothing."""
+        self.policy_for(player).decide_builds(self, player)
+
+    def decide_raise_funds(self, player, amount):
+        """Let player mortgage or sell until they hold amount, if their holdings allow it."""
+        self.policy_for(player).decide_raise_funds(self, player, amount)
+
+    def answer_prompt(self):
+        """Answer one open prompt (card pick, trade, auction bid, purchase) through the decide_* hooks.
+
+        Returns False when nothing is waiting on an answer.
+        """
+        if self.hackathon_pending:
+            self.choose_hackathon_space(self.decide_hackathon(self.hackathon_player))
+        elif self.evaporator_pending:
+            targets = self.get_evaporator_targets()
+            self.evaporate(self.decide_evaporator(self.evaporator_player, targets))
+        elif self.trade_active and self.trade_stage == "confirm":
+            partner = self.players[self.trade_partner_index]
+            self.answer_trade(self.decide_trade(partner, self.players[self.current_player_index]))
+        elif self.pending_property:
+            player = self.players[self.current_player_index]
+            choice = self.decide_purchase(player, self.pending_property)
+            if choice == "buy":
+                self.buy_pending_property()
+            elif choice == "auction":
+                self.auction_pending_property()
+            else:
+                self.skip_pending_property()
+        elif self.auction_active:
+            bidder = self.get_current_auction_player()
+            if bidder is None:
+                self.finish_auction()
+                return True
+            increment = self.decide_bid(bidder, self.auction_property, self.auction_current_bid)
+            if increment is None or not self.place_bid(increment):
+                self.leave_auction()
+        else:
+            return False
+        return True
+
+    def resolve_pending(self):
+        """Answer every open prompt through the decide_* hooks."""
+        while not self.game_over and self.answer_prompt():
+            pass
+
+    def play_turn(self):
+        """Play one roll for the current player, including every prompt it raises."""
+        player = self.players[self.current_player_index]
+        self.decide_builds(player)
+        if player.in_jail and not self.pay_jail_fare(player):
+            return
+        self.roll_dice()
+        self.resolve_pending()
+        self.force_bankruptcy_if_needed()
+        if self.can_end_turn():
+            self.end_turn()
+
+    def pay_jail_fare(self, player):
+        """Pay the current player's way out of the Arctic, raising the fare through decide_raise_funds if short.
+
+        Bankrupts the player if they still can't pay. Returns True if they are free to roll.
+        """
+        if player.money < JAIL_FARE:
+            self.decide_raise_funds(player, JAIL_FARE)
+        self.roll_dice()
+        if player.in_jail:
+            self.fail_jail_fee()
+            return False
+        return True
+
+    def play_game(self, max_turns=1000):
+        """Play until someone wins or max_turns turns pass; returns the winner (or None)."""
+        while not self.game_over and self.turn_count < max_turns:
+            self.play_turn()
+        return self.winner
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # SNAPSHOT / RESTORE / FORK
+    # ─────────────────────────────────────────────────────────────────────────
+    def snapshot(self, include_rng=False):
+        """Capture the whole game position as a GameSnapshot.
+
+        With include_rng the random streams (and any pre-drawn dice) are captured
+        too, so a restored game replays exactly the same future.
+        """
+        board = self.board
+        snap = GameSnapshot()
+        state = board.state.copy()
+        for name in ("owner", "houses", "hotel", "mortgaged", "stock_value", "cash", "position"):
+            getattr(state, name).setflags(write=False)
+        snap.state = state
+        snap.seats = tuple((p.name, p.color, p.token) for p in board.seats)
+        snap.player_fields = tuple(tuple(getattr(p, f) for f in SNAPSHOT_PLAYER_FIELDS) for p in board.seats)
+        snap.players = tuple(p.seat for p in self.players)
+        snap.engine_fields = tuple(getattr(self, f) for f in SNAPSHOT_ENGINE_FIELDS)
+        snap.player_refs = tuple(None if getattr(self, f) is None else getattr(self, f).seat
+                                 for f in SNAPSHOT_PLAYER_REFS)
+        snap.property_refs = tuple(None if getattr(self, f) is None else getattr(self, f).position
+                                   for f in SNAPSHOT_PROPERTY_REFS)
+        snap.auction_active_players = tuple(p.seat for p in self.auction_active_players)
+        snap.trade_offer_props = tuple(p.position for p in self.trade_offer_props)
+        snap.trade_request_props = tuple(p.position for p in self.trade_request_props)
+        snap.active_market_effects = tuple(dict(effect) for effect in self.active_market_effects)
+        snap.item_chest_cards = tuple(self.item_chest_cards)
+        snap.bankruptcies = tuple(self.bankruptcies)
+        snap.roll_total_counts = dict(self.roll_total_counts)
+        snap.last_rolls = tuple(self.last_rolls)
+        snap.position_visit_counts = dict(self.position_visit_counts)
+        dice = self.dice
+        snap.dice = (dice.dice_type, dice.roll_result, dice.double_count)
+        snap.rng = None
+        if include_rng:
+            batch = None
+            if dice.generator is not None:
+                batch = (dice.generator.bit_generator.state, dice._batch, dice._batch_index, dice._batch_type)
+            streams = (self.dice_rng.getstate(), self.card_rng.getstate(), self.chest_rng.getstate())
+            snap.rng = (streams, self.market_rng_state(), batch)
+        return snap
+
+    def restore(self, snap):
+        """Put this engine back into the position captured by snapshot()."""
+        board = self.board
+        if len(board.seats) != len(snap.seats):
+            board = self.board = Board()
+            for name, color, token in snap.seats:
+                Player(name, color, token, board)
+            self.num_players = len(snap.seats)
+        board.state = snap.state.copy()
+        board.rebuild_index()
+        seats = board.seats
+        for player, (name, color, token), fields in zip(seats, snap.seats, snap.player_fields):
+            player.name, player.color, player.token = name, color, token
+            for field, value in zip(SNAPSHOT_PLAYER_FIELDS, fields):
+                setattr(player, field, value)
+        spaces = board.spaces
+        self.players = [seats[s] for s in snap.players]
+        for field, value in zip(SNAPSHOT_ENGINE_FIELDS, snap.engine_fields):
+            setattr(self, field, value)
+        for field, seat in zip(SNAPSHOT_PLAYER_REFS, snap.player_refs):
+            setattr(self, field, None if seat is None else seats[seat])
+        for field, pos in zip(SNAPSHOT_PROPERTY_REFS, snap.property_refs):
+            setattr(self, field, None if pos is None else spaces[pos]["property"])
+        self.auction_active_players = [seats[s] for s in snap.auction_active_players]
+        self.trade_offer_props = {spaces[pos]["property"] for pos in snap.trade_offer_props}
+        self.trade_request_props = {spaces[pos]["property"] for pos in snap.trade_request_props}
+        self.active_market_effects = [dict(effect) for effect in snap.active_market_effects]
+        self.item_chest_cards = list(snap.item_chest_cards)
+        self.bankruptcies = list(snap.bankruptcies)
+        self.roll_total_counts = dict(snap.roll_total_counts)
+        self.last_rolls = list(snap.last_rolls)
+        self.position_visit_counts = dict(snap.position_visit_counts)
+        dice = self.dice
+        dice.dice_type, dice.roll_result, dice.double_count = snap.dice
+        if snap.rng is not None:
+            (dice_state, card_state, chest_state), market_state, batch = snap.rng
+            self.dice_rng.setstate(dice_state)
+            self.card_rng.setstate(card_state)
+            self.chest_rng.setstate(chest_state)
+            self.market_rng.bit_generator.state = market_state
+            self.noise_block = None
+            if batch is not None and dice.generator is not None:
+                dice.generator.bit_generator.state, dice._batch, dice._batch_index, dice._batch_type = batch
+
+    def fork(self, seed=None):
+        """Independent headless copy of the game in progress.
+
+        With seed=None the fork also inherits the random streams and plays out exactly
+        as this game would; pass a seed to explore a different future (rollouts).
+        Forking builds a new engine; for many rollouts from one position, fork once and
+        restore() a single snapshot into it instead.
+        """
+        engine = MonopolyEngine(len(self.board.seats), seed=seed, batch_dice=self.dice.generator is not None)
+        engine.restore(self.snapshot(include_rng=seed is None))
+        engine.policies = dict(self.policies)
+        return engine
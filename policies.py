@@ -0,0 +1,134 @@
+"""Computer players for the rules engine.
+
+A Policy makes one seat's decisions. MonopolyEngine asks the seat's policy
+whenever that player has to choose (buy, bid, build, answer a trade, the
+Hackathon Laptop and Evaporator picks); seats without one fall back to the
+engine's built-in choices, monopoly_engine.Policy, which the policies here
+subclass. Headless games and the pygame front end make the same calls, so a
+policy plays identically in both, e.g.
+
+    engine.set_policy(engine.players[1], POLICIES["balanced"])
+    engine.play_game()
+
+Policies keep no per-game state, so one instance can serve any number of
+seats and games. Every decision is a handful of ownership-index lookups over
+at most one color group or twelve spaces, well under a millisecond.
+"""
+from monopoly_engine import HOTEL_LEVEL, JAIL_POSITION, Policy, PropertyType
+
+BID_STEPS = (100, 20, 5)     # the auction's raise buttons, largest first
+
+
+def property_value(engine, player, prop):
+    """What prop is worth to player: its market value, raised when it completes or blocks a set."""
+    index = engine.board.index
+    value = prop.stock_value
+    if prop.property_type == PropertyType.PROPERTY:
+        size = index.color_sizes[prop.color]
+        held = index.color_counts.get((player, prop.color), 0) - (prop.owner is player)
+        if held == size - 1:
+            return value * 2.0
+        others = {p.owner for p in engine.board.color_groups[prop.color] if p is not prop}
+        if len(others) == 1 and None not in others and player not in others:
+            # One opponent holds the rest of the group: buying blocks their monopoly
+            return value * 1.5
+        return value * (1.2 if held else 1.0)
+    if prop.property_type == PropertyType.TRAIN_STATION:
+        held = index.count(player, PropertyType.TRAIN_STATION) - (prop.owner is player)
+        return value * (1.0 + 0.25 * held)
+    return value
+
+
+class HeuristicPolicy(Policy):
+    """Rule-of-thumb player tuned by how much cash it keeps back and how far it bids.
+
+    cash_reserve: cash kept after buying or bidding, unless the lot completes a set
+    bid_limit: highest bid as a multiple of property_value
+    build_reserve: cash kept after building
+    trade_margin: accept trades worth at least this multiple of what is given up
+    """
+
+    def __init__(self, cash_reserve=100, bid_limit=1.0, build_reserve=150, trade_margin=1.2):
+        self.cash_reserve = cash_reserve
+        self.bid_limit = bid_limit
+        self.build_reserve = build_reserve
+        self.trade_margin = trade_margin
+
+    def decide_purchase(self, engine, player, prop):
+        if player.money < prop.price:
+            return "auction"
+        if player.money - prop.price >= self.cash_reserve or property_value(engine, player, prop) >= 2 * prop.stock_value:
+            return "buy"
+        # Too dear to buy outright; an auction may still land it below list price
+        return "auction"
+
+    def decide_bid(self, engine, player, prop, current_bid):
+        ceiling = min(player.money - self.cash_reserve // 2, property_value(engine, player, prop) * self.bid_limit)
+        for step in BID_STEPS:
+            if current_bid + step <= ceiling and (step == BID_STEPS[-1] or ceiling - current_bid >= 2 * step):
+                return step
+        return None
+
+    def decide_hackathon(self, engine, player):
+        best, best_score = JAIL_POSITION, 0.0
+        for n in range(1, 13):
+            prop = engine.board.spaces[n].get("property")
+            if prop is None:
+                continue
+            if prop.owner is None:
+                score = property_value(engine, player, prop) if prop.price <= player.money else 0.0
+            elif prop.owner is player:
+                score = 1.0
+            else:
+                score = -prop.get_rent(7)
+            if score > best_score:
+                best, best_score = n, score
+        return best
+
+    def decide_evaporator(self, engine, player, targets):
+        opponents = [p for p in targets if p.owner != player]
+        if opponents:
+            return max(opponents, key=lambda p: p.get_rent(7))
+        return min(targets, key=lambda p: p.get_rent(7))
+
+    def decide_trade(self, engine, player, proposer):
+        if engine.trade_request_cash > player.money:
+            return False
+        received = engine.trade_offer_cash + sum(property_value(engine, player, p) for p in engine.trade_offer_props)
+        given = engine.trade_request_cash
+        for prop in engine.trade_request_props:
+            # Giving away a lot that completes the proposer's set costs more than the lot itself
+            given += max(property_value(engine, player, prop), property_value(engine, proposer, prop))
+        return received >= given * self.trade_margin and received > 0
+
+    def decide_builds(self, engine, player):
+        board = engine.board
+        index = board.index
+        for color, group in board.color_groups.items():
+            if not index.owns_color_set(player, color) or any(p.mortgaged for p in group):
+                continue
+            while True:
+                # Build evenly: always on the least developed lot of the set
+                prop = min(group, key=lambda p: (p.get_building_level(), -p.position))
+                level = prop.get_building_level()
+                if level == HOTEL_LEVEL:
+                    break
+                cost = prop.get_house_cost() if level < 4 else prop.get_hotel_cost()
+                pool = board.house_pool if level < 4 else board.hotel_pool
+                if pool <= 0 or player.money - cost < self.build_reserve:
+                    break
+                if level < 4:
+                    engine.try_buy_house(player, prop)
+                else:
+                    engine.try_buy_hotel(player, prop)
+                if prop.get_building_level() == level:
+                    break
+
+
+# Built-in opponents by name
+POLICIES = {
+    "basic": Policy(),
+    "cautious": HeuristicPolicy(cash_reserve=200, bid_limit=0.8, build_reserve=250, trade_margin=1.5),
+    "balanced": HeuristicPolicy(),
+    "aggressive": HeuristicPolicy(cash_reserve=25, bid_limit=1.3, build_reserve=50, trade_margin=1.05),
+}
@@ -0,0 +1,220 @@
+"""Frame-time profiling for the pygame front end.
+
+FrameProfiler times named sections of each frame and keeps a rolling window
+of per-frame totals, e.g.
+
+    profiler.begin_frame()
+    with profiler.section("draw_board"):
+        game.draw_board()
+    profiler.end_frame()
+    profiler.summary()["draw_board"]["p95"]    # milliseconds
+
+Sections nest and are inclusive (draw_board contains tooltip). Counters are
+either bumped directly (count()) or sampled once per frame from a running
+total (watch()), which is how text renders are read off the TextCache.
+While enabled, pygame.Surface construction and pygame.transform scaling are
+counted as "surfaces". start_trace() writes one JSON line per frame for
+offline analysis. When disabled, section() returns a shared no-op context.
+"""
+import contextlib
+import json
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+PERCENTILES = (50, 95, 99)
+NULL_SECTION = contextlib.nullcontext()
+# pygame.transform functions that allocate a new Surface
+COUNTED_TRANSFORMS = ("scale", "smoothscale", "rotate", "rotozoom", "flip")
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        frame = self.profiler.frame
+        frame[self.name] = frame.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, window=240):
+        self.window = window
+        self.enabled = False
+        self.frame_number = 0
+        self.frame = {}          # section -> seconds so far this frame
+        self.started = {}        # section -> perf_counter() at start(), for start()/stop() timing
+        self.counts = {}         # counter -> count so far this frame
+        self.samples = {}        # section or counter -> deque of per-frame values (ms for sections)
+        self.watched = {}        # counter -> [read total, total at the start of the frame]
+        self.counter_names = set()
+        self.frame_start = None
+        self.trace = None
+        self.saved_pygame = None
+
+    # ── Switching on and off ──
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.install_surface_counter()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.uninstall_surface_counter()
+        self.stop_trace()
+        self.frame_start = None
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def install_surface_counter(self):
+        profiler = self
+
+        class CountingSurface(pygame.Surface):
+            def __init__(self, *args, **kwargs):
+                profiler.count("surfaces")
+                super().__init__(*args, **kwargs)
+
+        def counted(function):
+            def wrapper(*args, **kwargs):
+                profiler.count("surfaces")
+                return function(*args, **kwargs)
+            return wrapper
+
+        transforms = {name: getattr(pygame.transform, name) for name in COUNTED_TRANSFORMS}
+        self.saved_pygame = (pygame.Surface, transforms)
+        pygame.Surface = CountingSurface
+        for name, function in transforms.items():
+            setattr(pygame.transform, name, counted(function))
+
+    def uninstall_surface_counter(self):
+        if self.saved_pygame is None:
+            return
+        surface_type, transforms = self.saved_pygame
+        pygame.Surface = surface_type
+        for name, function in transforms.items():
+            setattr(pygame.transform, name, function)
+        self.saved_pygame = None
+
+    # ── Recording ──
+    def section(self, name):
+        """Context manager that adds the time spent inside it to section `name` of this frame."""
+        if not self.enabled:
+            return NULL_SECTION
+        return _Section(self, name)
+
+    def start(self, name):
+        """Start timing section `name`; for spans that are awkward to wrap in a with block."""
+        if self.enabled:
+            self.started[name] = time.perf_counter()
+
+    def stop(self, name):
+        start = self.started.pop(name, None)
+        if start is not None:
+            self.frame[name] = self.frame.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name, n=1):
+        self.counter_names.add(name)
+        if self.enabled:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def watch(self, name, read_total):
+        """Record the per-frame increase of a running total, e.g. watch("text_renders", lambda: cache.misses)."""
+        self.counter_names.add(name)
+        self.watched[name] = [read_total, read_total()]
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame = {}
+        self.counts = {}
+        for watched in self.watched.values():
+            watched[1] = watched[0]()
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        self.frame["frame"] = time.perf_counter() - self.frame_start
+        self.frame_start = None
+        self.frame_number += 1
+        for name, (read_total, start) in self.watched.items():
+            self.counts[name] = read_total() - start
+        for name, seconds in self.frame.items():
+            self.add_sample(name, seconds * 1000.0)
+        for name in self.samples.keys() - self.frame.keys() - self.counts.keys():
+            self.add_sample(name, 0.0)
+        for name, value in self.counts.items():
+            self.add_sample(name, value)
+        if self.trace is not None:
+            record = {
+                "frame": self.frame_number,
+                "ms": {name: round(seconds * 1000.0, 4) for name, seconds in self.frame.items()},
+                "counts": self.counts,
+            }
+            self.trace.write(json.dumps(record) + "\n")
+
+    def add_sample(self, name, value):
+        values = self.samples.get(name)
+        if values is None:
+            values = self.samples[name] = deque(maxlen=self.window)
+        values.append(value)
+
+    # ── Reporting ──
+    def summary(self):
+        """{name: {"p50", "p95", "p99", "mean", "max"}} over the rolling window (ms for sections)."""
+        report = {}
+        for name, values in self.samples.items():
+            values = np.fromiter(values, dtype=np.float64, count=len(values))
+            if not len(values):
+                continue
+            stats = {f"p{pct}": float(value) for pct, value in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+            stats["mean"] = float(values.mean())
+            stats["max"] = float(values.max())
+            report[name] = stats
+        return report
+
+    def report_lines(self):
+        """Text lines for the diagnostics overlay: section times, then per-frame counts."""
+        summary = self.summary()
+        sections = sorted((n for n in summary if n not in self.counter_names), key=lambda n: (n != "frame", n))
+        counters = sorted(n for n in summary if n in self.counter_names)
+        lines = [f"{'ms':<16}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name in sections:
+            stats = summary[name]
+            lines.append(f"{name:<16}{stats['p50']:>7.2f}{stats['p95']:>7.2f}{stats['p99']:>7.2f}")
+        if counters:
+            lines.append(f"{'per frame':<16}{'p50':>7}{'p95':>7}{'max':>7}")
+            for name in counters:
+                stats = summary[name]
+                lines.append(f"{name:<16}{stats['p50']:>7.0f}{stats['p95']:>7.0f}{stats['max']:>7.0f}")
+        return lines
+
+    # ── Trace files ──
+    def start_trace(self, path):
+        """Append one JSON line per frame to path until stop_trace()."""
+        self.stop_trace()
+        self.enable()
+        self.trace = open(path, "a", buffering=1 << 16)
+
+    def stop_trace(self):
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
@@ -0,0 +1,252 @@
+"""Cached render layers for the pygame front end.
+
+BoardLayer keeps the board as a persistent Surface: the static part (spaces,
+color bars, board art, center deck) is rendered once per theme and size,
+and only spaces whose marks changed, the hover highlight and the tokens are
+repainted each frame. update() returns the screen rects it touched so the
+caller can push just those with pygame.display.update(rects).
+
+The drawing itself stays on the game (draw_static_board, draw_space_marks,
+draw_hover_highlight, draw_token); this module only decides what to redraw.
+
+FontRegistry loads each font size once and hands out CachedFonts whose
+render() goes through a shared, size-bounded LRU TextCache, so labels that
+are drawn every frame ("Roll Dice", cash lines, property lists) are only
+rasterized when their text or color changes.
+
+ModalCompositor keeps each modal popup (auction, trade, evaporator,
+hackathon) in its own Surface that is re-rendered only when the popup's
+model changes, plus a frozen copy of the screen underneath them, so an
+open modal costs a few blits per frame.
+
+ScaledImageCache makes scaled copies of source images (board art, dice
+faces) the first time a layout size asks for them, so resizing the window
+costs one smoothscale per image and drawing never scales.
+"""
+from collections import OrderedDict
+
+import pygame
+
+
+class BoardLayer:
+    def __init__(self):
+        self.static_cache = {}  # (size, dark_mode, overlay) -> static Surface
+        self.surface = None     # static layer + marks + hover + tokens, in board-local coordinates
+        self.key = None
+        self.marks = {}         # position -> marks last drawn (see CanadaMonopoly.get_space_marks)
+        self.hovered = None
+        self.tokens = []        # [(color, (x, y))] last drawn, board-local
+
+    def get_static(self, game):
+        key = (game.board_rect.size, game.dark_mode, id(game.board_overlay_image))
+        static = self.static_cache.get(key)
+        if static is None:
+            # Static layers for other board sizes are stale once the window has been resized
+            for stale in [k for k in self.static_cache if k[0] != key[0]]:
+                del self.static_cache[stale]
+            static = pygame.Surface(game.board_rect.size).convert()
+            game.draw_static_board(static)
+            self.static_cache[key] = static
+        return key, static
+
+    def repaint(self, game, static, region):
+        """Redraw one board-local region from the static layer up, clipped to it."""
+        surface = self.surface
+        surface.set_clip(region)
+        surface.blit(static, region.topleft, region)
+        for position, marks in self.marks.items():
+            if marks and region.colliderect(game.get_local_space_rect(position)):
+                game.draw_space_marks(surface, position, marks)
+        if self.hovered is not None:
+            game.draw_hover_highlight(surface, self.hovered)
+        for color, center in self.tokens:
+            if region.colliderect(game.get_token_rect(center)):
+                game.draw_token(surface, color, center)
+        surface.set_clip(None)
+
+    def update(self, game):
+        """Bring the board surface in line with the game and return the dirty screen rects."""
+        key, static = self.get_static(game)
+        origin = game.board_rect.topleft
+        full = key != self.key
+        if full:
+            self.key = key
+            self.surface = static.copy()
+            self.marks = {}
+            self.hovered = None
+            self.tokens = []
+
+        regions = []
+        for prop in game.board.properties:
+            marks = game.get_space_marks(prop)
+            if self.marks.get(prop.position) != marks:
+                self.marks[prop.position] = marks
+                regions.append(game.get_local_space_rect(prop.position))
+        if game.hovered_position != self.hovered:
+            for position in (self.hovered, game.hovered_position):
+                if position is not None:
+                    regions.append(game.get_local_space_rect(position))
+            self.hovered = game.hovered_position
+        tokens = [(color, (x - origin[0], y - origin[1])) for color, (x, y) in game.get_token_draws()]
+        if tokens != self.tokens:
+            regions.extend(game.get_token_rect(center) for _, center in self.tokens)
+            regions.extend(game.get_token_rect(center) for _, center in tokens)
+            self.tokens = tokens
+
+        bounds = self.surface.get_rect()
+        if full:
+            regions = [bounds]
+        dirty = []
+        for region in regions:
+            region = region.clip(bounds)
+            if region.width and region.height:
+                self.repaint(game, static, region)
+                dirty.append(region.move(origin))
+        return dirty
+
+
+# ── Fonts and text ──
+class TextCache:
+    """LRU cache of rendered text Surfaces keyed by (font, text, color, antialias).
+
+    Bounded by the pixel bytes held; the least recently used surfaces are
+    dropped first. Returned Surfaces are shared, so treat them as read-only.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (Surface, bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font_key, font, text, antialias, color, background=None):
+        key = (font_key, text, tuple(color), bool(antialias), None if background is None else tuple(background))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        size = surface.get_bytesize() * surface.get_width() * surface.get_height()
+        if size <= self.max_bytes:
+            self.entries[key] = (surface, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, old_size) = self.entries.popitem(last=False)
+                self.bytes -= old_size
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+
+class CachedFont:
+    """A pygame Font whose render() is served from a shared TextCache; everything else is passed through."""
+    __slots__ = ("font", "key", "cache")
+
+    def __init__(self, font, key, cache):
+        self.font = font
+        self.key = key
+        self.cache = cache
+
+    def render(self, text, antialias, color, background=None):
+        return self.cache.render(self.key, self.font, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+class FontRegistry:
+    """One Font per size from a single font file, loaded on first use and shared by the whole UI."""
+
+    def __init__(self, path, cache=None):
+        self.path = path
+        self.cache = cache if cache is not None else TextCache()
+        self.fonts = {}  # size -> CachedFont
+
+    def get(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            try:
+                raw = pygame.font.Font(self.path, size)
+            except Exception:
+                raw = pygame.font.Font(None, size)
+            font = CachedFont(raw, (self.path, size), self.cache)
+            self.fonts[size] = font
+        return font
+
+
+# ── Modal popups ──
+class ModalCompositor:
+    def __init__(self):
+        self.layers = {}     # name -> (model, Surface, screen rect)
+        self.canvas = None   # transparent scratch surface the size of the screen
+        self.base = None     # the screen under the modals, frozen while base_key holds
+        self.base_key = None
+        self.base_overlay_rects = []  # transient popups drawn into base
+        self.renders = 0
+
+    def draw(self, screen, name, model, draw):
+        """Blit modal `name`, re-rendering it with draw(canvas) only when model differs; return its rect.
+
+        draw() works in screen coordinates (so the button rects it records stay valid)
+        and returns the popup rect.
+        """
+        layer = self.layers.get(name)
+        if layer is None or layer[0] != model:
+            if self.canvas is None or self.canvas.get_size() != screen.get_size():
+                self.canvas = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            self.canvas.fill((0, 0, 0, 0))
+            # Titles can run past the popup border; keep everything that was drawn
+            rect = draw(self.canvas).union(self.canvas.get_bounding_rect()).clip(self.canvas.get_rect())
+            layer = (model, self.canvas.subsurface(rect).copy(), rect)
+            self.layers[name] = layer
+            self.renders += 1
+        screen.blit(layer[1], layer[2])
+        return layer[2]
+
+    def close(self, name):
+        self.layers.pop(name, None)
+
+    def freeze(self, screen, key, overlay_rects):
+        self.base = screen.copy()
+        self.base_key = key
+        self.base_overlay_rects = list(overlay_rects)
+
+    def thaw(self):
+        self.base = None
+        self.base_key = None
+        self.base_overlay_rects = []
+
+
+# ── Scaled images ──
+class ScaledImageCache:
+    """Scaled copies of source images keyed by (name, size), least recently used dropped first."""
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (name, size) -> Surface
+
+    def lookup(self, key):
+        scaled = self.entries.get(key)
+        if scaled is not None:
+            self.entries.move_to_end(key)
+        return scaled
+
+    def get(self, name, source, size):
+        key = (name, tuple(size))
+        scaled = self.lookup(key)
+        if scaled is not None:
+            return scaled
+        scaled = source if source.get_size() == key[1] else pygame.transform.smoothscale(source, key[1])
+        self.put(key, scaled)
+        return scaled
+
+    def put(self, key, surface):
+        """Store a surface built elsewhere (e.g. a scaled atlas) under key."""
+        self.entries[key] = surface
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
@@ -0,0 +1,77 @@
+"""Expected rent per opponent turn for every property, kept in step with the game.
+
+Each entry is
+
+    landing probability per roll (markov.get_landing_probabilities)
+    x rolls per turn (1 + d + d^2 for doubles probability d)
+    x the rent the lot charges right now (get_rent: buildings, stock value, mortgage)
+
+with utilities charged at the expected dice total. update() compares the
+board's state arrays with the copies it saw last time and recomputes only
+the lots whose owner, buildings, mortgage or stock value moved, plus every
+station (or utility) when one of them changes hands, since their rent
+depends on how many the owner holds. A dice-type change redoes the whole
+table. Between changes, reading the table costs nothing, so the board
+overlay can look values up every frame.
+"""
+import numpy as np
+
+from markov import get_landing_probabilities
+from monopoly_engine import BOARD_SIZE, PropertyType
+
+# BoardState arrays whose changes alter rent
+WATCHED_FIELDS = ("owner", "houses", "hotel", "mortgaged", "stock_value")
+GROUPED_TYPES = (PropertyType.TRAIN_STATION, PropertyType.UTILITY)
+
+
+class ExpectedRentTable:
+    def __init__(self):
+        self.values = np.zeros(BOARD_SIZE)   # expected rent per opponent turn; 0 off the properties
+        self.dice_type = None
+        self.board = None
+        self.seen = {}                       # field -> copy of the BoardState array at the last update
+        self.groups = []                     # position arrays of the stations and of the utilities
+        self.turn_landings = None            # expected landings per opponent turn, by position
+        self.expected_roll = 0.0
+        self.recomputed = 0                  # entries recomputed so far, for profiling
+
+    def update(self, engine):
+        """Refresh the entries whose inputs changed; returns the positions that were recomputed."""
+        board = engine.board
+        state = board.state
+        dice_type = engine.dice.dice_type
+        if dice_type != self.dice_type or board is not self.board:
+            self.dice_type = dice_type
+            self.board = board
+            doubles = engine.get_doubles_probability(dice_type)
+            self.turn_landings = get_landing_probabilities(dice_type) * (1.0 + doubles + doubles * doubles)
+            self.expected_roll = engine.get_expected_roll(dice_type)
+            self.seen = {name: getattr(state, name).copy() for name in WATCHED_FIELDS}
+            self.groups = [np.array([prop.position for prop in board.properties if prop.property_type == property_type])
+                           for property_type in GROUPED_TYPES]
+            changed = board.property_positions
+        else:
+            mask = np.zeros(BOARD_SIZE, dtype=np.bool_)
+            for name, seen in self.seen.items():
+                current = getattr(state, name)
+                mask |= current != seen
+                np.copyto(seen, current)
+            changed = np.flatnonzero(mask)
+            if not len(changed):
+                return changed
+            for group in self.groups:
+                if mask[group].any():
+                    mask[group] = True
+            changed = np.flatnonzero(mask)
+
+        spaces = board.spaces
+        for position in changed.tolist():
+            prop = spaces[position]["property"]
+            if prop.property_type == PropertyType.UTILITY:
+                # Utility rent is linear in the dice total, so charge it at the expected total
+                rent = prop.get_rent(1) * self.expected_roll
+            else:
+                rent = prop.get_rent()
+            self.values[position] = self.turn_landings[position] * rent
+        self.recomputed += len(changed)
+        return changed
@@ -0,0 +1,297 @@
+"""Action logs: record a game once, replay it exactly, headless or on screen.
+
+Every random draw in the engine comes from its seeded streams and every
+state change from a player_action method, so a game is fully described by
+its starting position (a snapshot with the RNG streams) plus the list of
+player actions taken since, e.g.
+
+    log = ActionLog()
+    log.begin(engine)                    # engine.action_log = log
+    engine.play_game()
+    save_replay(log, "game.cmreplay", engine)
+
+    python replay.py game.cmreplay                    # full speed, checks the final position
+    python replay.py game.cmreplay --list             # one line per action
+    python replay.py game.cmreplay --stop 120 --save quicksave.cmsave
+    python replay.py game.cmreplay --events game.jsonl  # the rule events, see event_log.py
+    python main2.py --replay game.cmreplay            # watch it move by move
+
+An action is a one-byte code plus its arguments, with players stored by
+seat and properties by position: a few bytes each, so a whole game's log is
+a few KB next to the 8.5 KB starting snapshot. The file ends with a digest
+of the final position, which a replay must reproduce.
+"""
+import argparse
+import hashlib
+import struct
+import time
+
+from event_log import EventLog
+from monopoly_engine import SNAPSHOT_ENGINE_FIELDS, MonopolyEngine
+from savegame import SaveFormatError, decode_snapshot, encode_snapshot, save_game, write_atomic
+
+MAGIC = b"CMRP"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sHII")      # magic, version, snapshot bytes, action count
+NO_LOT = 255
+DIGEST_SIZE = 20                      # SHA-1
+
+# Argument kinds: p player (seat), l property (position), n small int, c cash, b bool, L set of properties
+KIND_FORMATS = {"p": "B", "l": "B", "n": "h", "c": "i", "b": "?"}
+
+# (engine method, argument kinds) by action code; append new actions at the end
+ACTIONS = (
+    ("roll_dice", ""),
+    ("end_turn", ""),
+    ("change_dice_type", ""),
+    ("buy_pending_property", ""),
+    ("skip_pending_property", ""),
+    ("auction_pending_property", ""),
+    ("place_bid", "n"),
+    ("leave_auction", ""),
+    ("finish_auction", ""),
+    ("choose_hackathon_space", "n"),
+    ("evaporate", "l"),
+    ("try_buy_house", "pl"),
+    ("try_buy_hotel", "pl"),
+    ("sell_building", "pl"),
+    ("sell_property", "pl"),
+    ("toggle_mortgage", "pl"),
+    ("open_trade", ""),
+    ("propose_trade", "nLLcc"),
+    ("answer_trade", "b"),
+    ("force_bankruptcy", ""),
+    ("fail_jail_fee", ""),
+    ("declare_bankruptcy", ""),
+)
+ACTION_CODES = {name: code for code, (name, _) in enumerate(ACTIONS)}
+
+# Left out of the digest: the on-screen message, and the trade terms the front end edits
+# directly until propose_trade logs them
+DIGEST_IGNORED_FIELDS = ("message", "message_timer", "trade_stage", "trade_partner_index",
+                         "trade_offer_cash", "trade_request_cash")
+
+
+def encode_arg(kind, value):
+    if kind == "p":
+        return value.seat
+    if kind == "l":
+        return NO_LOT if value is None else value.position
+    if kind == "L":
+        return tuple(sorted(prop.position for prop in value))
+    if kind == "b":
+        return bool(value)
+    return int(value)
+
+
+def decode_arg(engine, kind, value):
+    if kind == "p":
+        return engine.board.seats[value]
+    if kind == "l":
+        return None if value == NO_LOT else engine.board.spaces[value]["property"]
+    if kind == "L":
+        return [engine.board.spaces[pos]["property"] for pos in value]
+    return value
+
+
+class ActionLog:
+    """A game's starting position and every player action taken since."""
+
+    def __init__(self, start=None, actions=None, final_digest=None):
+        self.start = start                  # GameSnapshot including the RNG streams
+        self.actions = actions or []        # (action code, encoded arguments)
+        self.final_digest = final_digest    # state_digest() of the position the recording ended on
+
+    def __len__(self):
+        return len(self.actions)
+
+    def begin(self, engine):
+        """Start recording engine's actions from its current position."""
+        self.start = engine.snapshot(include_rng=True)
+        self.actions = []
+        self.final_digest = None
+        engine.action_log = self
+
+    def record(self, engine, name, args):
+        kinds = ACTIONS[ACTION_CODES[name]][1]
+        self.actions.append((ACTION_CODES[name], tuple(encode_arg(kind, arg) for kind, arg in zip(kinds, args))))
+
+
+def state_digest(engine):
+    """SHA-1 of the engine's position and RNG streams, which a faithful replay reproduces bit for bit."""
+    snap = engine.snapshot(include_rng=True)
+    fields = list(snap.engine_fields)
+    for name in DIGEST_IGNORED_FIELDS:
+        fields[SNAPSHOT_ENGINE_FIELDS.index(name)] = None
+    snap.engine_fields = tuple(fields)
+    snap.trade_offer_props = snap.trade_request_props = ()
+    return hashlib.sha1(encode_snapshot(snap)).digest()
+
+
+# ── Replaying ──
+def apply_action(engine, action):
+    code, args = action
+    name, kinds = ACTIONS[code]
+    getattr(engine, name)(*[decode_arg(engine, kind, value) for kind, value in zip(kinds, args)])
+
+
+def describe_action(engine, action):
+    """One line for --list, e.g. "turn 12  Player 2  try_buy_house Player 2, STC"."""
+    code, args = action
+    name, kinds = ACTIONS[code]
+    shown = []
+    for kind, value in zip(kinds, args):
+        if kind == "p":
+            shown.append(engine.board.seats[value].name)
+        elif kind == "l":
+            shown.append("-" if value == NO_LOT else engine.board.spaces[value]["name"])
+        elif kind == "L":
+            shown.append("[" + ", ".join(engine.board.spaces[pos]["name"] for pos in value) + "]")
+        else:
+            shown.append(str(value))
+    player = engine.players[engine.current_player_index].name if engine.players else "-"
+    return f"turn {engine.turn_count:<4} {player:<10} {name} {', '.join(shown)}".rstrip()
+
+
+def start_replay(log, engine=None):
+    """Put engine (a new headless MonopolyEngine if None) at the log's starting position."""
+    if engine is None:
+        # Logs of batch_dice games carry the pre-drawn dice; keep using them
+        engine = MonopolyEngine(len(log.start.seats), batch_dice=log.start.rng[2] is not None)
+    engine.restore(log.start)
+    return engine
+
+
+def replay(log, engine=None, stop=None):
+    """Play the log's first `stop` actions (all by default) from its start; returns the engine."""
+    engine = start_replay(log, engine)
+    for action in log.actions[:stop]:
+        apply_action(engine, action)
+    return engine
+
+
+def matches_recording(log, engine):
+    """True/False: engine is at the position the recording ended on; None if the log has no digest."""
+    if log.final_digest is None:
+        return None
+    return state_digest(engine) == log.final_digest
+
+
+# ── Files ──
+def encode_replay(log, engine=None):
+    """Pack the log into bytes; with engine, also the digest of its position as the recording's end."""
+    if engine is not None:
+        log.final_digest = state_digest(engine)
+    start = encode_snapshot(log.start)
+    buffer = bytearray(HEADER.pack(MAGIC, REPLAY_VERSION, len(start), len(log.actions)))
+    buffer += start
+    for code, args in log.actions:
+        buffer += struct.pack("<B", code)
+        for kind, value in zip(ACTIONS[code][1], args):
+            if kind == "L":
+                buffer += struct.pack(f"<B{len(value)}B", len(value), *value)
+            else:
+                buffer += struct.pack("<" + KIND_FORMATS[kind], value)
+    buffer += struct.pack("<?", log.final_digest is not None)
+    if log.final_digest is not None:
+        buffer += log.final_digest
+    return bytes(buffer)
+
+
+def decode_replay(data):
+    """Unpack bytes written by encode_replay into an ActionLog."""
+    if len(data) < HEADER.size:
+        raise SaveFormatError("File is too short to be a replay")
+    magic, version, start_size, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a Canada Monopoly replay file")
+    if version != REPLAY_VERSION:
+        raise SaveFormatError(f"Replay format version {version} is not supported (expected {REPLAY_VERSION})")
+    offset = HEADER.size
+    if len(data) < offset + start_size:
+        raise SaveFormatError("Replay file is truncated")
+    try:
+        start = decode_snapshot(data[offset:offset + start_size])
+    except SaveFormatError as exc:
+        raise SaveFormatError("Replay file is truncated or corrupt") from exc
+    if start.rng is None:
+        raise SaveFormatError("Replay has no RNG state to start from")
+    offset += start_size
+    actions = []
+    try:
+        for _ in range(count):
+            (code,) = struct.unpack_from("<B", data, offset)
+            offset += 1
+            if code >= len(ACTIONS):
+                raise SaveFormatError(f"Unknown action code {code}")
+            args = []
+            for kind in ACTIONS[code][1]:
+                if kind == "L":
+                    (size,) = struct.unpack_from("<B", data, offset)
+                    args.append(struct.unpack_from(f"<{size}B", data, offset + 1))
+                    offset += 1 + size
+                else:
+                    fmt = "<" + KIND_FORMATS[kind]
+                    args.append(struct.unpack_from(fmt, data, offset)[0])
+                    offset += struct.calcsize(fmt)
+            actions.append((code, tuple(args)))
+        (has_digest,) = struct.unpack_from("<?", data, offset)
+    except struct.error:
+        raise SaveFormatError("Replay file is truncated") from None
+    if has_digest and len(data) < offset + 1 + DIGEST_SIZE:
+        raise SaveFormatError("Replay file is truncated")
+    final_digest = bytes(data[offset + 1:offset + 1 + DIGEST_SIZE]) if has_digest else None
+    return ActionLog(start, actions, final_digest)
+
+
+def save_replay(log, path, engine=None):
+    """Write the log to path (see encode_replay); returns the file size."""
+    return write_atomic(path, encode_replay(log, engine))
+
+
+def load_replay(path):
+    with open(path, "rb") as f:
+        return decode_replay(f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Canada Monopoly game at full speed.")
+    parser.add_argument("path", help="a .cmreplay file")
+    parser.add_argument("--stop", type=int, help="stop after this many actions")
+    parser.add_argument("--list", action="store_true", help="print every action as it is replayed")
+    parser.add_argument("--save", help="write the position the replay stopped at to this save file")
+    parser.add_argument("--events", help="write the replayed game's rule events to this JSONL or .cmevents file")
+    args = parser.parse_args()
+
+    log = load_replay(args.path)
+    start = time.perf_counter()
+    engine = start_replay(log)
+    if args.events:
+        engine.event_log = EventLog(args.events)
+    for index, action in enumerate(log.actions[:args.stop]):
+        if args.list:
+            print(f"{index:>6}  {describe_action(engine, action)}")
+        apply_action(engine, action)
+    if args.events:
+        engine.event_log.close()
+        engine.event_log = None
+    elapsed = time.perf_counter() - start
+
+    played = len(log.actions[:args.stop])
+    print(f"{played} of {len(log)} actions in {elapsed * 1000:.1f} ms, turn {engine.turn_count}, "
+          f"winner: {engine.winner.name if engine.winner else '-'}")
+    if args.save:
+        save_game(engine, args.save)
+        print(f"Position saved to {args.save}")
+    if played == len(log):
+        matched = matches_recording(log, engine)
+        if matched is None:
+            print("The log has no final position to check against.")
+        else:
+            print("Final position matches the recording." if matched else "Final position DIFFERS from the recording!")
+            if not matched:
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
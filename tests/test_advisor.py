@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import advisor
+from advisor import Advisor
+from monopoly_engine import MonopolyEngine
+
+
+def purchase_pending(seed=1):
+    engine = MonopolyEngine(2, seed=seed)
+    while True:
+        engine.roll_dice()
+        if engine.pending_property is not None:
+            return engine
+        engine.resolve_pending()
+        if engine.can_end_turn():
+            engine.end_turn()
+
+
+def run(search):
+    while search.busy:
+        search.poll()
+
+
+def test_failing_choice_is_reported_and_dropped(monkeypatch, capsys):
+    rollouts = advisor.run_rollouts
+
+    def run_rollouts(task):
+        if task[2] == "skip":
+            raise RuntimeError("broken rollout")
+        return rollouts(task)
+
+    monkeypatch.setattr(advisor, "run_rollouts", run_rollouts)
+    search = Advisor(workers=2, budget_ms=300, turns=5)
+    search.pool = ThreadPoolExecutor(2)
+    try:
+        assert search.start(purchase_pending())
+        run(search)
+        assert [label for label, _ in search.failures()] == ["Skip"]
+        assert sorted(row[0] for row in search.results()) == ["Auction", "Buy"]
+        skip = next(s for s in search.stats if s.choice == "skip")
+        # Nothing more was queued for it once its batches came back
+        assert skip.n == 0 and skip.queued == 0
+    finally:
+        search.shutdown()
+    assert "broken rollout" in capsys.readouterr().err
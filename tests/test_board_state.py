@@ -0,0 +1,55 @@
+from monopoly_engine import NO_OWNER, MonopolyEngine
+
+
+def test_views_read_and_write_the_state_arrays():
+    engine = MonopolyEngine(3, seed=1)
+    state = engine.board.state
+    player = engine.players[2]
+    prop = engine.board.properties[5]
+    prop.owner = player
+    prop.houses = 3
+    player.money = 1234
+    player.position = prop.position
+    assert state.owner[prop.position] == player.seat
+    assert state.houses[prop.position] == 3
+    assert state.cash[player.seat] == 1234
+    assert state.position[player.seat] == prop.position
+    state.mortgaged[prop.position] = True
+    state.stock_value[prop.position] = 999
+    assert prop.mortgaged and prop.stock_value == 999
+    prop.owner = None
+    assert state.owner[prop.position] == NO_OWNER and prop.owner is None
+
+
+def test_views_hand_out_plain_python_values():
+    engine = MonopolyEngine(2, seed=1)
+    engine.play_game(40)
+    for prop in engine.board.properties:
+        assert type(prop.houses) is int and type(prop.stock_value) is int
+        assert type(prop.hotel) is bool and type(prop.mortgaged) is bool
+    for player in engine.players:
+        assert type(player.money) is int and type(player.position) is int
+
+
+def test_state_copy_is_independent():
+    engine = MonopolyEngine(2, seed=2)
+    engine.play_game(40)
+    copy = engine.board.state.copy()
+    cash = copy.cash.tolist()
+    stock = copy.stock_value.tolist()
+    engine.play_game(80)
+    engine.board.state.cash[0] += 1
+    assert copy.cash.tolist() == cash and copy.stock_value.tolist() == stock
+
+
+def test_swapping_in_a_state_moves_every_view():
+    source = MonopolyEngine(2, seed=3)
+    source.play_game(60)
+    target = MonopolyEngine(2, seed=4)
+    target.board.state = source.board.state.copy()
+    target.board.rebuild_index()
+    for mine, theirs in zip(target.board.properties, source.board.properties):
+        assert (mine.owner is None) == (theirs.owner is None)
+        assert mine.owner is None or mine.owner is target.board.seats[theirs.owner.seat]
+        assert (mine.houses, mine.hotel, mine.stock_value) == (theirs.houses, theirs.hotel, theirs.stock_value)
+    assert [p.money for p in target.board.seats] == [p.money for p in source.board.seats]
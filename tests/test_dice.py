@@ -0,0 +1,62 @@
+import random
+
+import numpy as np
+import pytest
+
+from markov import get_roll_outcome_distribution
+from monopoly_engine import Dice, DiceType, roll_dice_batch
+
+ROLLS = 60000
+
+
+def frequencies(totals, doubles):
+    counts = {}
+    for key in zip(totals.tolist(), doubles.tolist()):
+        counts[key] = counts.get(key, 0) + 1
+    return {key: n / len(totals) for key, n in counts.items()}
+
+
+def assert_matches_exact(observed, dice_type, n):
+    exact = get_roll_outcome_distribution(dice_type)
+    assert set(observed) <= set(exact)
+    for key, p in exact.items():
+        # Five standard errors of a binomial share
+        assert abs(observed.get(key, 0.0) - p) <= 5 * np.sqrt(p * (1 - p) / n) + 1e-9, key
+
+
+@pytest.mark.parametrize("dice_type", list(DiceType))
+def test_batch_rolls_match_the_exact_distribution(dice_type):
+    die1, die2, totals, doubles = roll_dice_batch(dice_type, ROLLS, np.random.default_rng(1))
+    assert (totals == die1 + die2).all() and (doubles == (die1 == die2)).all()
+    assert_matches_exact(frequencies(totals, doubles), dice_type, ROLLS)
+
+
+@pytest.mark.parametrize("dice_type", list(DiceType))
+def test_scalar_rolls_match_the_exact_distribution(dice_type):
+    dice = Dice(random.Random(1))
+    dice.dice_type = dice_type
+    rolls = np.array([dice.roll() for _ in range(ROLLS)])
+    assert_matches_exact(frequencies(rolls[:, 0], rolls[:, 1].astype(bool)), dice_type, ROLLS)
+
+
+def test_pre_drawn_dice_follow_the_batch_stream():
+    dice = Dice(random.Random(1), np.random.default_rng(2), batch_size=16)
+    rolled = []
+    for _ in range(40):
+        dice.roll()
+        rolled.append(dice.roll_result)
+    generator = np.random.default_rng(2)
+    expected = []
+    for _ in range(3):
+        die1, die2, _, _ = roll_dice_batch(DiceType.REGULAR, 16, generator)
+        expected += zip(die1.tolist(), die2.tolist())
+    assert rolled == expected[:40]
+
+
+def test_changing_dice_type_starts_a_new_block():
+    dice = Dice(random.Random(1), np.random.default_rng(2), batch_size=16)
+    dice.roll()
+    dice.dice_type = DiceType.STABLE
+    for _ in range(20):
+        dice.roll()
+        assert set(dice.roll_result) <= {3, 4}
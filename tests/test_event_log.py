@@ -0,0 +1,73 @@
+import json
+from collections import Counter
+
+from event_log import COLUMNAR_SUFFIX, EVENT_FIELDS, EventLog, read_columns
+from monopoly_engine import DiceType, MonopolyEngine
+from policies import POLICIES
+
+
+def play_games(path, games=20, batch_size=64):
+    """Play seeded policy games into an EventLog at path; returns the engines."""
+    engines = []
+    with EventLog(str(path), batch_size=batch_size) as log:
+        for game in range(games):
+            engine = MonopolyEngine(4, seed=game, batch_dice=True)
+            engine.dice.dice_type = list(DiceType)[game % len(DiceType)]
+            for player in engine.players:
+                engine.set_policy(player, POLICIES["balanced"])
+            engine.event_log = log
+            log.start_game(game)
+            engine.play_game(300)
+            engines.append(engine)
+    return engines
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_columnar_and_jsonl_hold_the_same_records(tmp_path):
+    play_games(tmp_path / "events.jsonl")
+    play_games(tmp_path / f"events{COLUMNAR_SUFFIX}")
+    records = read_jsonl(tmp_path / "events.jsonl")
+    columns = read_columns(tmp_path / f"events{COLUMNAR_SUFFIX}")
+    counts = Counter(record["event"] for record in records)
+    assert {event: len(fields["game"]) for event, fields in columns.items()} == dict(counts)
+    for event, fields in columns.items():
+        rows = [record for record in records if record["event"] == event]
+        for name in ("game", "turn") + EVENT_FIELDS[event]:
+            assert fields[name].tolist() == [row[name] for row in rows]
+
+
+def test_records_agree_with_the_engine(tmp_path):
+    engines = play_games(tmp_path / "events.jsonl")
+    records = read_jsonl(tmp_path / "events.jsonl")
+    for record in records:
+        assert set(record) == {"event", "game", "turn"} | set(EVENT_FIELDS[record["event"]])
+    for game, engine in enumerate(engines):
+        mine = [record for record in records if record["game"] == game]
+        assert sum(record["event"] == "roll" for record in mine) == engine.roll_count
+        seats = {player.name: player.seat for player in engine.board.seats}
+        assert [(r["seat"], r["cause"]) for r in mine if r["event"] == "bankruptcy"] == [
+            (seats[name], cause) for name, cause, _ in engine.bankruptcies]
+
+
+def test_appends_across_logs_and_writes_in_batches(tmp_path):
+    path = tmp_path / "events.jsonl"
+    with EventLog(str(path), batch_size=10) as log:
+        for turn in range(25):
+            log.append(turn, "pass_go", (0, 200))
+        # Two full batches are on disk, the rest waits for the next flush
+        assert log.written == 20
+        assert len(log.buffer) == 5
+    with EventLog(str(path)) as log:
+        log.append(0, "bankruptcy", (1, "rent"))
+    records = read_jsonl(path)
+    assert len(records) == 26
+    assert records[-1] == {"event": "bankruptcy", "game": 0, "turn": 0, "seat": 1, "cause": "rent"}
+
+
+def test_event_fields_leave_room_for_the_common_ones():
+    for fields in EVENT_FIELDS.values():
+        assert not {"event", "game", "turn"} & set(fields)
@@ -0,0 +1,54 @@
+from monopoly_engine import BROWN, JAIL_FARE, JAIL_POSITION, MonopolyEngine
+from replay import ActionLog, matches_recording, replay, state_digest
+
+
+def jailed_engine(money, seed=3):
+    engine = MonopolyEngine(2, seed=seed)
+    player = engine.players[0]
+    player.position = JAIL_POSITION
+    player.in_jail = True
+    player.money = money
+    return engine, player
+
+
+def test_fare_is_raised_by_mortgaging():
+    # $30 and STC's $30 mortgage cover the $50 fare
+    engine, player = jailed_engine(30)
+    prop = engine.board.color_groups[BROWN][0]
+    engine.board.transfer(prop, player)
+    engine.play_turn()
+    assert player in engine.players
+    assert not engine.bankruptcies
+    assert not player.in_jail
+    assert prop.mortgaged
+
+
+def test_fare_is_raised_by_selling_buildings():
+    engine, player = jailed_engine(0)
+    group = engine.board.color_groups[BROWN]
+    for prop in group:
+        engine.board.transfer(prop, player)
+        prop.houses = 2
+    engine.play_turn()
+    assert player in engine.players
+    assert not player.in_jail
+    # Only as many houses as the fare needs are sold
+    assert sum(p.houses for p in group) < 4
+    assert any(p.houses for p in group)
+
+
+def test_player_with_nothing_to_raise_goes_bankrupt():
+    engine, player = jailed_engine(JAIL_FARE - 1)
+    engine.play_turn()
+    assert player not in engine.players
+    assert engine.bankruptcies == [(player.name, "jail_fee", engine.turn_count)]
+
+
+def test_raising_the_fare_replays():
+    engine, player = jailed_engine(30)
+    engine.board.transfer(engine.board.color_groups[BROWN][0], player)
+    log = ActionLog()
+    log.begin(engine)
+    engine.play_game(50)
+    log.final_digest = state_digest(engine)
+    assert matches_recording(log, replay(log))
@@ -0,0 +1,68 @@
+import copy
+
+import numpy as np
+
+from monopoly_engine import MARKET_NOISE_TURNS, MAX_STOCK_VALUE, MIN_STOCK_VALUE, Board, MonopolyEngine, stream_seed
+
+
+def scalar_update(board, percent_changes, noise):
+    """The per-property loop update_stock_values replaced."""
+    for prop, multiplier in zip(board.properties, noise):
+        for percent_change in percent_changes:
+            prop.update_stock_value(percent_change)
+        prop.stock_value = min(MAX_STOCK_VALUE, max(MIN_STOCK_VALUE, int(round(prop.stock_value * multiplier))))
+
+
+def stock_values(board):
+    return [prop.stock_value for prop in board.properties]
+
+
+def test_vectorized_update_matches_the_scalar_loop():
+    rng = np.random.default_rng(8)
+    vectorized, scalar = Board(), Board()
+    seen = set()
+    # Crashes down to the floor, a mixed market, then inflation up to the cap
+    for choices in [(-50, -25)] * 60 + [(-50, -40, -25, 50, 75, 100)] * 200 + [(50, 100)] * 60:
+        percent_changes = [int(pct) for pct in rng.choice(choices, size=rng.integers(0, 4))]
+        noise = rng.random(len(vectorized.properties)) * 0.1 + 0.95
+        vectorized.update_stock_values(percent_changes, noise)
+        scalar_update(scalar, percent_changes, noise)
+        assert stock_values(vectorized) == stock_values(scalar)
+        seen.update(stock_values(scalar))
+    assert MIN_STOCK_VALUE in seen and MAX_STOCK_VALUE in seen
+
+
+def test_noise_rounds_half_to_even_like_round():
+    board = Board()
+    prop = board.properties[0]
+    for value, multiplier in ((25, 0.9), (35, 0.9), (45, 1.1), (55, 1.1)):
+        prop.stock_value = value
+        noise = np.ones(len(board.properties))
+        noise[0] = multiplier
+        board.update_stock_values((), noise)
+        assert prop.stock_value == round(value * multiplier)
+
+
+def test_next_turn_reprices_like_the_scalar_loop():
+    engine = MonopolyEngine(2, seed=9)
+    engine.play_game(30)
+    engine.active_market_effects = [{"action": "inflation", "amount": 60, "turns_left": 3},
+                                    {"action": "market_drop", "amount": 30, "turns_left": 1}]
+    expected = copy.deepcopy(engine.board)
+    market_rng = np.random.Generator(np.random.PCG64())
+    market_rng.bit_generator.state = engine.market_rng_state()
+    scalar_update(expected, [60, -30], market_rng.random(len(expected.properties)) * (1.05 - 0.95) + 0.95)
+    engine.next_turn()
+    assert stock_values(engine.board) == stock_values(expected)
+    assert [effect["action"] for effect in engine.active_market_effects] == ["inflation"]
+
+
+def test_noise_drawn_in_blocks_matches_turn_by_turn_draws():
+    engine = MonopolyEngine(3, seed=10)
+    generator = np.random.default_rng(stream_seed(10, "market"))
+    size = len(engine.board.properties)
+    # Across several block boundaries
+    for _ in range(3 * MARKET_NOISE_TURNS + 5):
+        expected = generator.random(size) * (1.05 - 0.95) + 0.95
+        assert engine.market_noise().tolist() == expected.tolist()
+        assert engine.market_rng_state() == generator.bit_generator.state
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from markov import get_landing_probabilities, get_resting_probabilities
+from monopoly_engine import BOARD_SIZE, DiceType, MonopolyEngine, Policy
+
+TURNS = 20000
+
+
+class Tourist(Policy):
+    """Never buys or bids, so nobody pays rent and a single game runs as long as needed."""
+
+    def decide_purchase(self, engine, player, prop):
+        return "skip"
+
+    def decide_bid(self, engine, player, prop, current_bid):
+        return None
+
+
+def simulated_landings(dice_type, seed=0):
+    engine = MonopolyEngine(2, seed=seed)
+    engine.dice.dice_type = dice_type
+    for player in engine.players:
+        engine.set_policy(player, Tourist())
+    for _ in range(TURNS):
+        # Taxes and cards can't end the game either
+        for player in engine.players:
+            player.money = 10000
+        engine.play_turn()
+    assert not engine.bankruptcies
+    return np.array([engine.position_visit_counts[n] for n in range(BOARD_SIZE)])
+
+
+@pytest.mark.parametrize("dice_type", list(DiceType))
+def test_stationary_landings_match_simulated_games(dice_type):
+    counts = simulated_landings(dice_type)
+    frequencies = counts / counts.sum()
+    exact = get_landing_probabilities(dice_type)
+    # Five standard errors of each space's share
+    tolerance = 5 * np.sqrt(exact * (1 - exact) / counts.sum()) + 1e-3
+    assert (np.abs(frequencies - exact) <= tolerance).all()
+
+
+@pytest.mark.parametrize("dice_type", list(DiceType))
+def test_probabilities_are_distributions(dice_type):
+    for probabilities in (get_landing_probabilities(dice_type), get_resting_probabilities(dice_type)):
+        assert probabilities.shape == (BOARD_SIZE,)
+        assert (probabilities >= 0).all()
+        assert probabilities.sum() == pytest.approx(1.0)
+    # Go to US sends every token on to the Arctic, so nobody rests there
+    assert get_resting_probabilities(dice_type)[30] == pytest.approx(0.0)
@@ -0,0 +1,73 @@
+import random
+from collections import Counter
+
+from monopoly_engine import MonopolyEngine, PropertyType
+from policies import POLICIES
+
+
+class EventCounter(Counter):
+    """Stands in for an EventLog, counting events by name."""
+
+    def append(self, turn, event, fields):
+        self[event] += 1
+
+
+def scanned_counts(engine):
+    """The ownership index's tallies, recounted by scanning every property."""
+    type_counts, color_counts = Counter(), Counter()
+    for prop in engine.board.properties:
+        if prop.owner is not None:
+            type_counts[(prop.owner, prop.property_type)] += 1
+            if prop.property_type == PropertyType.PROPERTY:
+                color_counts[(prop.owner, prop.color)] += 1
+    return type_counts, color_counts
+
+
+def assert_index_matches_board(engine):
+    index = engine.board.index
+    type_counts, color_counts = scanned_counts(engine)
+    assert {key: n for key, n in index.type_counts.items() if n} == dict(type_counts)
+    assert {key: n for key, n in index.color_counts.items() if n} == dict(color_counts)
+    for player in engine.board.seats:
+        for color, group in engine.board.color_groups.items():
+            assert index.owns_color_set(player, color) == all(p.owner is player for p in group)
+
+
+def random_trade(engine, rng):
+    """Swap a random handful of lots and some cash between the current player and another."""
+    proposer = engine.players[engine.current_player_index]
+    partner_index = rng.choice([i for i in range(len(engine.players)) if i != engine.current_player_index])
+    partner = engine.players[partner_index]
+    offer = rng.sample(proposer.properties, min(2, len(proposer.properties)))
+    request = rng.sample(partner.properties, min(2, len(partner.properties)))
+    engine.open_trade()
+    engine.propose_trade(partner_index, offer, request, rng.randint(0, 20), 0)
+    engine.answer_trade(True)
+
+
+def test_index_matches_a_board_scan_through_whole_games():
+    rng = random.Random(0)
+    events = EventCounter()
+    for seed in range(12):
+        engine = MonopolyEngine(4, seed=seed)
+        for player in engine.players:
+            engine.set_policy(player, POLICIES["aggressive"])
+        engine.event_log = events
+        while not engine.game_over and engine.turn_count < 300:
+            if engine.turn_count % 5 == 0 and len(engine.players) > 1 and not engine.dice_rolled:
+                random_trade(engine, rng)
+            engine.play_turn()
+            assert_index_matches_board(engine)
+    # Every way a lot changes hands was exercised
+    assert events["buy"] and events["auction_end"] and events["trade"] and events["bankruptcy"]
+
+
+def test_rebuild_index_matches_the_incremental_index():
+    engine = MonopolyEngine(3, seed=4)
+    engine.play_game(80)
+    index = engine.board.index
+    before = ({k: n for k, n in index.type_counts.items() if n}, {k: n for k, n in index.color_counts.items() if n})
+    engine.board.rebuild_index()
+    index = engine.board.index
+    assert ({k: n for k, n in index.type_counts.items() if n},
+            {k: n for k, n in index.color_counts.items() if n}) == before
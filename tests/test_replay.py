@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from monopoly_engine import MonopolyEngine
+from policies import POLICIES
+from replay import (
+    ACTION_CODES, ACTIONS, DIGEST_SIZE, HEADER, REPLAY_VERSION, ActionLog, decode_replay, encode_replay, load_replay, matches_recording,
+    replay, save_replay, state_digest,
+)
+from savegame import SaveFormatError
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+# seed 11, three balanced bots with pre-drawn dice, recorded for 80 turns by replay format version 1
+FIXTURE = os.path.join(DATA, "seed11_turn80.cmreplay")
+FIXTURE_ACTIONS = 264
+
+
+def record(seed, turns=200, batch_dice=False, policy="balanced"):
+    engine = MonopolyEngine(4, seed=seed, batch_dice=batch_dice)
+    for player in engine.players:
+        engine.set_policy(player, POLICIES[policy])
+    engine.play_game(10)
+    log = ActionLog()
+    log.begin(engine)
+    engine.play_game(turns)
+    return log, engine
+
+
+@pytest.mark.parametrize("seed, batch_dice, policy", [
+    (1, False, "balanced"), (2, True, "aggressive"), (3, False, "basic"), (4, True, "cautious"),
+])
+def test_replay_reproduces_final_digest(tmp_path, seed, batch_dice, policy):
+    log, engine = record(seed, batch_dice=batch_dice, policy=policy)
+    path = tmp_path / "game.cmreplay"
+    save_replay(log, path, engine)
+    loaded = load_replay(path)
+    assert loaded.actions == log.actions
+    assert matches_recording(loaded, replay(loaded)) is True
+
+
+def test_trade_terms_are_logged():
+    engine = MonopolyEngine(3, seed=5)
+    engine.play_game(40)
+    log = ActionLog()
+    log.begin(engine)
+    proposer, partner = engine.players[0], engine.players[1]
+    engine.open_trade()
+    engine.propose_trade(1, proposer.properties[:1], partner.properties[:1], 10, 0)
+    engine.answer_trade(True)
+    engine.play_game(80)
+    assert matches_recording(decode_replay(encode_replay(log, engine)), replay(log)) is True
+
+
+def test_nested_actions_are_not_logged():
+    engine = MonopolyEngine(2, seed=6)
+    log = ActionLog()
+    log.begin(engine)
+    engine.players[0].money = 0
+    engine.pending_property = engine.board.properties[0]
+    # Too poor to buy, so the purchase starts an auction; the last bidder leaving ends it.
+    # Only the two outer calls are logged: replaying them repeats start_auction and finish_auction.
+    engine.buy_pending_property()
+    assert engine.auction_active
+    engine.leave_auction()
+    assert not engine.auction_active
+    assert [ACTIONS[code][0] for code, _ in log.actions] == ["buy_pending_property", "leave_auction"]
+    assert engine.action_depth == 0
+
+
+def test_diverging_replay_is_detected():
+    log, engine = record(7, turns=60)
+    log.final_digest = state_digest(engine)
+    turn_ends = [i for i, (code, _) in enumerate(log.actions) if code == ACTION_CODES["end_turn"]]
+    assert matches_recording(log, replay(log, stop=turn_ends[-1])) is False
+
+
+def test_fixture_from_this_format_version_still_replays():
+    # Fails if the action table or file layout changes without a REPLAY_VERSION bump (and a new fixture)
+    assert REPLAY_VERSION == 1
+    log = load_replay(FIXTURE)
+    assert len(log) == FIXTURE_ACTIONS
+    engine = replay(log)
+    assert engine.turn_count == 80
+    assert matches_recording(log, engine) is True
+    with open(FIXTURE, "rb") as f:
+        assert encode_replay(log) == f.read()
+
+
+def test_rejects_foreign_files():
+    with pytest.raises(SaveFormatError, match="Not a Canada Monopoly replay"):
+        decode_replay(b"CMSV" + bytes(20))
+    with pytest.raises(SaveFormatError, match="too short"):
+        decode_replay(b"CMRP")
+
+
+def test_rejects_truncated_files():
+    with open(FIXTURE, "rb") as f:
+        data = f.read()
+    # Inside the starting snapshot, the actions and the final digest
+    sizes = list(range(HEADER.size, len(data), 97)) + list(range(len(data) - DIGEST_SIZE - 1, len(data)))
+    for size in sizes:
+        with pytest.raises(SaveFormatError, match="truncated"):
+            decode_replay(data[:size])
+
+
+def test_save_replay_leaves_no_temporary_file(tmp_path):
+    log, engine = record(5, turns=20)
+    path = tmp_path / "game.cmreplay"
+    save_replay(log, path, engine)
+    save_replay(log, path, engine)
+    assert os.listdir(tmp_path) == ["game.cmreplay"]
+    assert matches_recording(load_replay(path), replay(load_replay(path)))
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from monopoly_engine import MonopolyEngine
+from replay import state_digest
+from savegame import (
+    SAVE_VERSION, SaveFormatError, decode_snapshot, encode_snapshot, load_game, save_game, write_atomic,
+)
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+# seed 7, three players, 60 turns, saved with the RNG streams by save format version 2
+FIXTURE = os.path.join(DATA, "seed7_turn60.cmsave")
+FIXTURE_DIGEST = "ab777f5b7dc74ded7f3ad052c203cec2a124587f"
+
+
+def play(seed=7, turns=60, batch_dice=False):
+    engine = MonopolyEngine(3, seed=seed, batch_dice=batch_dice)
+    engine.play_game(turns)
+    return engine
+
+
+@pytest.mark.parametrize("batch_dice", [False, True])
+def test_round_trip_keeps_position_and_streams(tmp_path, batch_dice):
+    engine = play(batch_dice=batch_dice)
+    path = tmp_path / "game.cmsave"
+    save_game(engine, path)
+    loaded = load_game(path)
+    assert state_digest(loaded) == state_digest(engine)
+    # Same streams, so both games play on identically
+    engine.play_game(200)
+    loaded.play_game(200)
+    assert state_digest(loaded) == state_digest(engine)
+
+
+def test_encode_is_stable_through_decode():
+    data = encode_snapshot(play().snapshot(include_rng=True))
+    assert encode_snapshot(decode_snapshot(data)) == data
+
+
+def test_save_without_rng_restores_position():
+    engine = play()
+    snap = decode_snapshot(encode_snapshot(engine.snapshot()))
+    assert snap.rng is None
+    loaded = MonopolyEngine(3)
+    loaded.restore(snap)
+    assert [p.money for p in loaded.players] == [p.money for p in engine.players]
+    assert loaded.board.state.owner.tolist() == engine.board.state.owner.tolist()
+
+
+def test_fixture_from_this_format_version_still_loads():
+    # Fails if the layout changes without a SAVE_VERSION bump (and a new fixture)
+    assert SAVE_VERSION == 2
+    engine = load_game(FIXTURE)
+    assert state_digest(engine).hex() == FIXTURE_DIGEST
+    with open(FIXTURE, "rb") as f:
+        assert encode_snapshot(engine.snapshot(include_rng=True)) == f.read()
+
+
+def test_fixture_matches_a_fresh_game():
+    assert state_digest(play()).hex() == FIXTURE_DIGEST
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"CM", "too short"),
+    (b"XXXX\x02\x00\x00\x00", "Not a Canada Monopoly save"),
+    (b"CMSV\x63\x00\x00\x00", "version 99"),
+])
+def test_rejects_foreign_files(data, message):
+    with pytest.raises(SaveFormatError, match=message):
+        decode_snapshot(data)
+
+
+def test_rejects_truncated_files():
+    with open(FIXTURE, "rb") as f:
+        data = f.read()
+    # Every section, including the RNG streams at the end
+    for size in list(range(8, len(data), 61)) + [len(data) - 1]:
+        with pytest.raises(SaveFormatError, match="truncated or corrupt"):
+            decode_snapshot(data[:size])
+
+
+def test_interrupted_save_keeps_the_previous_file(tmp_path):
+    path = tmp_path / "quicksave.cmsave"
+    size = save_game(play(), path)
+    with pytest.raises(TypeError):
+        write_atomic(path, "not bytes")
+    assert os.path.getsize(path) == size
+    assert os.listdir(tmp_path) == ["quicksave.cmsave"]
+    assert state_digest(load_game(path)).hex() == FIXTURE_DIGEST
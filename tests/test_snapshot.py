@@ -0,0 +1,73 @@
+import pytest
+
+from monopoly_engine import MonopolyEngine
+from policies import POLICIES
+from replay import state_digest
+
+
+def game(seed=21, players=4, batch_dice=False, turns=50):
+    engine = MonopolyEngine(players, seed=seed, batch_dice=batch_dice)
+    for player in engine.players:
+        engine.set_policy(player, POLICIES["balanced"])
+    engine.play_game(turns)
+    return engine
+
+
+def continuation(engine, turns=150):
+    engine.play_game(engine.turn_count + turns)
+    return state_digest(engine)
+
+
+@pytest.mark.parametrize("batch_dice", [False, True])
+def test_restore_replays_the_same_future(batch_dice):
+    engine = game(batch_dice=batch_dice)
+    snap = engine.snapshot(include_rng=True)
+    first = continuation(engine)
+    engine.restore(snap)
+    assert continuation(engine) == first
+    # A snapshot can be restored any number of times
+    engine.restore(snap)
+    assert continuation(engine) == first
+
+
+@pytest.mark.parametrize("batch_dice", [False, True])
+def test_fork_plays_out_exactly_like_the_original(batch_dice):
+    engine = game(batch_dice=batch_dice)
+    fork = engine.fork()
+    assert state_digest(fork) == state_digest(engine)
+    assert continuation(fork) == continuation(engine)
+
+
+def test_fork_is_independent_of_the_original():
+    engine = game()
+    before = state_digest(engine)
+    fork = engine.fork()
+    fork.play_game(fork.turn_count + 100)
+    fork.players[0].money += 1000
+    assert state_digest(engine) == before
+
+
+def test_seeded_forks_explore_their_own_future():
+    engine = game()
+    futures = {continuation(engine.fork(seed)) for seed in (1, 1, 2)}
+    assert len(futures) == 2
+    assert continuation(engine.fork()) not in futures
+
+
+def test_snapshot_is_not_changed_by_later_play():
+    engine = game()
+    snap = engine.snapshot(include_rng=True)
+    cash = snap.state.cash.tolist()
+    continuation(engine)
+    assert snap.state.cash.tolist() == cash
+    with pytest.raises(ValueError):
+        snap.state.cash[0] = 0
+
+
+def test_restore_into_an_engine_with_other_seats():
+    engine = game(players=3)
+    other = MonopolyEngine(2, seed=99)
+    other.restore(engine.snapshot(include_rng=True))
+    other.policies = dict(engine.policies)
+    assert [p.name for p in other.players] == [p.name for p in engine.players]
+    assert continuation(other) == continuation(engine)